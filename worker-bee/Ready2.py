@@ -1,10 +1,15 @@
 import json
+import os
 import time
 import threading
 import re
 from kafka import KafkaConsumer, KafkaProducer, errors
 from judge import SafetyChecker
-from Ready import PROBLEM_TEMPLATES
+from harness import (BATCH_CASE_MARKER, BATCH_ERROR_MARKER, RAW_TEMPLATE_VERSION, ProgramHashes,
+                     VariableCache, generate_wrapper, iter_chunks, job_function_name, prepare_batch, prepare_wrapper,
+                     render_batch_wrapper, render_wrapper)
+from stdin_harness import encode_stdin_input, prepare_stdin_program
+from templates import TEMPLATE_VERSION, registry_stats
 import io
 import sys
 
@@ -13,30 +18,22 @@ import sys
 # ----------------------------------------------------------------------
 consumer = None
 producer = None
-checker = SafetyChecker()
-
-
-def clean_user_code(code, language):
-    """Remove struct definitions from user code"""
-    if language == "c":
-        # Remove struct ListNode definition
-        lines = code.split('\n')
-        cleaned_lines = []
-        in_struct = False
-
-        for line in lines:
-            stripped = line.strip()
-            if stripped.startswith('struct ListNode {'):
-                in_struct = True
-                continue
-            elif in_struct and stripped == '};':
-                in_struct = False
-                continue
-            elif not in_struct:
-                cleaned_lines.append(line)
-
-        return '\n'.join(cleaned_lines)
-    return code
+# One pool process per consumer thread: large submissions are checked off the
+# GIL so a burst of them does not serialise the three consumers. Edits to
+# policy.json are picked up within a few seconds without a restart.
+POLICY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "policy.json")
+checker = SafetyChecker(processes=3, policy_path=POLICY_PATH)
+# Test cases per program on all_test_batch_execution: one compile and one
+# start-up per chunk instead of per test case. 0 keeps one
+# all_test_execution message per test case.
+BATCH_CHUNK_SIZE = 0
+# Send one program per job that reads each test case from its "stdin" payload,
+# so executors can compile once and run it for every test case.
+STDIN_HARNESS = False
+# Recently emitted programHash values, to mark messages first-seen or repeat.
+program_hashes = ProgramHashes()
+# Rendered {{TEST_VARIABLES}} blocks per problem, test input and language.
+variable_cache = VariableCache()
 
 
 while not consumer:
@@ -64,6 +61,7 @@ while not producer:
         time.sleep(5)
 
 print("WorkerBee running... Waiting for jobs.")
+print("Template registry:", registry_stats())
 
 # ----------------------------------------------------------------------
 # Safe built-ins whitelist
@@ -78,417 +76,12 @@ safe_builtins = {
     "bool": bool,
 }
 
-# ----------------------------------------------------------------------
-# PRINT-SUPPRESSION
-# ----------------------------------------------------------------------
-
-
-def remove_user_prints(code, language):
-    """Comment out user-level print statements for the given language."""
-    if language == "python":
-        lines = code.split('\n')
-        cleaned = []
-        for line in lines:
-            stripped = line.strip()
-            if stripped.startswith('print(') and not stripped.startswith('#'):
-                cleaned.append(' # ' + line.strip() +
-                               ' # Suppressed for test case')
-            else:
-                cleaned.append(line)
-        return '\n'.join(cleaned)
-    elif language == "javascript":
-        lines = code.split('\n')
-        cleaned = []
-        for line in lines:
-            stripped = line.strip()
-            if 'console.log(' in stripped and not stripped.startswith('//'):
-                cleaned.append(' // ' + line.strip() +
-                               ' // Suppressed for test case')
-            else:
-                cleaned.append(line)
-        return '\n'.join(cleaned)
-    elif language == "go":
-        lines = code.split('\n')
-        cleaned = []
-        for line in lines:
-            stripped = line.strip()
-            if 'fmt.Println(' in stripped and not stripped.startswith('//'):
-                cleaned.append(' // ' + line.strip() +
-                               ' // Suppressed for test case')
-            else:
-                cleaned.append(line)
-        return '\n'.join(cleaned)
-    elif language == "java":
-        lines = code.split('\n')
-        cleaned = []
-        for line in lines:
-            stripped = line.strip()
-            if 'System.out.print' in stripped and not stripped.startswith('//'):
-                cleaned.append(' // ' + line.strip() +
-                               ' // Suppressed for test case')
-            else:
-                cleaned.append(line)
-        return '\n'.join(cleaned)
-    elif language == "c":
-        lines = code.split('\n')
-        cleaned = []
-        for line in lines:
-            stripped = line.strip()
-            if 'printf(' in stripped and not stripped.startswith('//'):
-                cleaned.append(' // ' + line.strip() +
-                               ' // Suppressed for test case')
-            else:
-                cleaned.append(line)
-        return '\n'.join(cleaned)
-    return code
-
-# ----------------------------------------------------------------------
-# PARSE AND FORMAT TEST VARIABLES (WORKS FOR ALL 14 PROBLEMS)
-# ----------------------------------------------------------------------
-
-
-def parse_and_format_test_variables(test_input, language):
-    """Parse test input and format for specific language - works for all 14 problems"""
-    if not test_input:
-        return ""
-
-    try:
-        # Split by comma but handle arrays and strings properly
-        parts = []
-        current_part = ""
-        bracket_count = 0
-        quote_count = 0
-        in_string = False
-
-        i = 0
-        while i < len(test_input):
-            char = test_input[i]
-
-            if char == '"' and (i == 0 or test_input[i-1] != '\\'):
-                in_string = not in_string
-            elif char == '[' and not in_string:
-                bracket_count += 1
-            elif char == ']' and not in_string:
-                bracket_count -= 1
-            elif char == ',' and bracket_count == 0 and not in_string:
-                parts.append(current_part.strip())
-                current_part = ""
-                i += 1
-                continue
-
-            current_part += char
-            i += 1
-
-        if current_part.strip():
-            parts.append(current_part.strip())
-
-        # Parse each variable assignment
-        formatted_vars = []
-        for part in parts:
-            if '=' in part:
-                key, value = part.split('=', 1)
-                key = key.strip()
-                value = value.strip()
-
-                # Format for specific language
-                if language == "python":
-                    formatted_vars.append(f"{key} = {value}")
-
-                elif language == "javascript":
-                    formatted_vars.append(f"const {key} = {value};")
-
-                elif language == "java":
-                    # Handle different data types for Java
-                    if value.startswith('[') and value.endswith(']'):
-                        # Array handling
-                        java_array = value.replace('[', '{').replace(']', '}')
-                        if key in ['nums', 'nums1', 'nums2', 'l1', 'l2', 'head']:
-                            formatted_vars.append(
-                                f"int[] {key} = {java_array};")
-                        elif key in ['s'] and value.startswith("['") and value.endswith("']"):
-                            # Character array like ['h','e','l','l','o']
-                            char_array = java_array.replace(
-                                "'", "'").replace("'", "'")
-                            formatted_vars.append(
-                                f"char[] {key} = {char_array};")
-                        else:
-                            formatted_vars.append(
-                                f"int[] {key} = {java_array};")
-                    elif value.startswith('"') and value.endswith('"'):
-                        # String
-                        formatted_vars.append(f"String {key} = {value};")
-                    elif value.replace('.', '').replace('-', '').isdigit():
-                        # Number
-                        if '.' in value:
-                            formatted_vars.append(f"double {key} = {value};")
-                        else:
-                            formatted_vars.append(f"int {key} = {value};")
-                    else:
-                        formatted_vars.append(f"var {key} = {value};")
-
-                elif language == "go":
-                    # Handle different data types for Go
-                    if value.startswith('[') and value.endswith(']'):
-                        # Array handling
-                        inner_content = value[1:-1]  # Remove brackets
-                        if value.startswith("['") and value.endswith("']"):
-                            # Character array/byte slice
-                            go_array = f"[]byte{{{inner_content}}}"
-                        else:
-                            # Integer array
-                            go_array = f"[]int{{{inner_content}}}"
-                        formatted_vars.append(f"{key} := {go_array}")
-                    elif value.startswith('"') and value.endswith('"'):
-                        # String
-                        formatted_vars.append(f"{key} := {value}")
-                    else:
-                        # Number or other
-                        formatted_vars.append(f"{key} := {value}")
-
-                elif language == "c":
-                    # Handle different data types for C
-                    if value.startswith('[') and value.endswith(']'):
-                        # Array handling
-                        c_array = value.replace('[', '{').replace(']', '}')
-                        array_elements = value[1:-
-                                               1].split(',') if value != '[]' else []
-                        array_size = len(array_elements) if array_elements != [
-                            ''] else 0
-
-                        # Use correct parameter names for C functions
-                        if key == 'nums':
-                            formatted_vars.append(f"int {key}[] = {c_array};")
-                            formatted_vars.append(
-                                f"int numsSize = {array_size};")
-                        elif key == 'nums1':
-                            formatted_vars.append(f"int {key}[] = {c_array};")
-                            formatted_vars.append(
-                                f"int nums1Size = {array_size};")
-                        elif key == 'nums2':
-                            formatted_vars.append(f"int {key}[] = {c_array};")
-                            formatted_vars.append(
-                                f"int nums2Size = {array_size};")
-                        elif key in ['l1', 'l2', 'head']:
-                            formatted_vars.append(f"int {key}[] = {c_array};")
-                            formatted_vars.append(
-                                f"int {key}_size = {array_size};")
-                        elif key == 's' and value.startswith("['") and value.endswith("']"):
-                            # Character array like ['h','e','l','l','o']
-                            formatted_vars.append(f"char {key}[] = {c_array};")
-                            formatted_vars.append(
-                                f"int {key}_size = {array_size};")
-                        else:
-                            # Default integer array
-                            formatted_vars.append(f"int {key}[] = {c_array};")
-                            formatted_vars.append(
-                                f"int {key}_size = {array_size};")
-                    elif value.startswith('"') and value.endswith('"'):
-                        # String
-                        formatted_vars.append(f"char* {key} = {value};")
-                    elif value.replace('.', '').replace('-', '').isdigit():
-                        # Number
-                        if '.' in value:
-                            formatted_vars.append(f"double {key} = {value};")
-                        else:
-                            formatted_vars.append(f"int {key} = {value};")
-                    else:
-                        formatted_vars.append(f"int {key} = {value};")
-
-        result = '\n'.join(formatted_vars)
-        print(f"Parsed test variables for {language}: {result}")
-        return result
-
-    except Exception as e:
-        print(f"Error parsing test variables: {e}")
-        return f"// Error parsing test input: {test_input}"
-    """Parse test input and format for specific language - works for all 14 problems"""
-    if not test_input:
-        return ""
-
-    try:
-        # Split by comma but handle arrays and strings properly
-        parts = []
-        current_part = ""
-        bracket_count = 0
-        quote_count = 0
-        in_string = False
-
-        i = 0
-        while i < len(test_input):
-            char = test_input[i]
-
-            if char == '"' and (i == 0 or test_input[i-1] != '\\'):
-                in_string = not in_string
-            elif char == '[' and not in_string:
-                bracket_count += 1
-            elif char == ']' and not in_string:
-                bracket_count -= 1
-            elif char == ',' and bracket_count == 0 and not in_string:
-                parts.append(current_part.strip())
-                current_part = ""
-                i += 1
-                continue
-
-            current_part += char
-            i += 1
-
-        if current_part.strip():
-            parts.append(current_part.strip())
-
-        # Parse each variable assignment
-        formatted_vars = []
-        for part in parts:
-            if '=' in part:
-                key, value = part.split('=', 1)
-                key = key.strip()
-                value = value.strip()
-
-                # Format for specific language
-                if language == "python":
-                    formatted_vars.append(f"{key} = {value}")
-
-                elif language == "javascript":
-                    formatted_vars.append(f"const {key} = {value};")
-
-                elif language == "java":
-                    # Handle different data types for Java
-                    if value.startswith('[') and value.endswith(']'):
-                        # Array handling
-                        java_array = value.replace('[', '{').replace(']', '}')
-                        if key in ['nums', 'nums1', 'nums2', 'l1', 'l2', 'head']:
-                            formatted_vars.append(
-                                f"int[] {key} = {java_array};")
-                        elif key in ['s'] and value.startswith("['") and value.endswith("']"):
-                            # Character array like ['h','e','l','l','o']
-                            char_array = java_array.replace(
-                                "'", "'").replace("'", "'")
-                            formatted_vars.append(
-                                f"char[] {key} = {char_array};")
-                        else:
-                            formatted_vars.append(
-                                f"int[] {key} = {java_array};")
-                    elif value.startswith('"') and value.endswith('"'):
-                        # String
-                        formatted_vars.append(f"String {key} = {value};")
-                    elif value.replace('.', '').replace('-', '').isdigit():
-                        # Number
-                        if '.' in value:
-                            formatted_vars.append(f"double {key} = {value};")
-                        else:
-                            formatted_vars.append(f"int {key} = {value};")
-                    else:
-                        formatted_vars.append(f"var {key} = {value};")
-
-                elif language == "go":
-                    # Handle different data types for Go
-                    if value.startswith('[') and value.endswith(']'):
-                        # Array handling
-                        inner_content = value[1:-1]  # Remove brackets
-                        if value.startswith("['") and value.endswith("']"):
-                            # Character array/byte slice
-                            go_array = f"[]byte{{{inner_content}}}"
-                        else:
-                            # Integer array
-                            go_array = f"[]int{{{inner_content}}}"
-                        formatted_vars.append(f"{key} := {go_array}")
-                    elif value.startswith('"') and value.endswith('"'):
-                        # String
-                        formatted_vars.append(f"{key} := {value}")
-                    else:
-                        # Number or other
-                        formatted_vars.append(f"{key} := {value}")
-
-                elif language == "c":
-                    # Handle different data types for C
-                    if value.startswith('[') and value.endswith(']'):
-                        # Array handling
-                        c_array = value.replace('[', '{').replace(']', '}')
-                        array_elements = value[1:-
-                                               1].split(',') if value != '[]' else []
-                        array_size = len(array_elements) if array_elements != [
-                            ''] else 0
-
-                        if value.startswith("['") and value.endswith("']"):
-                            # Character array
-                            formatted_vars.append(f"char {key}[] = {c_array};")
-                            formatted_vars.append(
-                                f"int {key}_size = {array_size};")
-                        else:
-                            # Integer array
-                            formatted_vars.append(f"int {key}[] = {c_array};")
-                            formatted_vars.append(
-                                f"int {key}_size = {array_size};")
-                    elif value.startswith('"') and value.endswith('"'):
-                        # String
-                        formatted_vars.append(f"char* {key} = {value};")
-                    elif value.replace('.', '').replace('-', '').isdigit():
-                        # Number
-                        if '.' in value:
-                            formatted_vars.append(f"double {key} = {value};")
-                        else:
-                            formatted_vars.append(f"int {key} = {value};")
-                    else:
-                        formatted_vars.append(f"int {key} = {value};")
-
-        result = '\n'.join(formatted_vars)
-        print(f"Parsed test variables for {language}: {result}")
-        return result
 
-    except Exception as e:
-        print(f"Error parsing test variables: {e}")
-        return f"// Error parsing test input: {test_input}"
-
-# ----------------------------------------------------------------------
-# WRAPPER GENERATION USING HARDCODED TEMPLATES
-# ----------------------------------------------------------------------
-
-
-def generate_wrapper(user_code, job_data, test_case, language, suppress_prints=False):
-    """Generate wrapper using hardcoded templates from Ready.py"""
-
-    # Extract function name from job data or problem data
-    function_name = job_data.get("function_name", "")
-    if not function_name:
-        # Try to get from problem data
-        problem = job_data.get("problem", {})
-        function_name = problem.get("function_name", "")
-
-    if not function_name:
-        print("No function_name found in job data")
-        return user_code
-
-    # Get template for this function and language
-    template = PROBLEM_TEMPLATES.get(function_name, {}).get(language, "")
-    if not template:
-        print(f"No template found for {function_name} in {language}")
-        return user_code
-
-       # 🚀 ADD THIS: Clean struct definitions from user code FIRST
-    cleaned_code = clean_user_code(user_code, language)
-
-    # Clean user code if prints should be suppressed
-    if suppress_prints:
-        cleaned_code = remove_user_prints(cleaned_code, language)
-
-    # Replace user code in template
-    wrapper = template.replace("{{USER_CODE}}", cleaned_code)
-
-    # Parse test case input to format variables
-    test_input = test_case.get("input", "") if test_case else ""
-    test_variables = parse_and_format_test_variables(test_input, language)
-
-    # Replace test variables
-    wrapper = wrapper.replace("{{TEST_VARIABLES}}", test_variables)
-
-    print(f"Generated wrapper for {function_name} in {language}")
-    return wrapper
-
-
-def publish_blocked_result(job_id, socket_id, reason, language, code, topic="blocked_exec"):
+def publish_blocked_result(job_id, socket_id, reason, language, code, topic="blocked_exec", status="unsafe"):
     result_data = {
         "id": job_id,
         "jobId": job_id,
-        "status": "unsafe",
+        "status": status,
         "reason": reason,
         "output": None,
         "language": language,
@@ -522,10 +115,11 @@ def consume_programmiz_requests():
 
         print("Received job for safety check:", job_id)
 
-        is_safe = checker.check(code, language)
-        reason = checker.reason()
+        verdict = checker.check(code, language)
+        reason = verdict.reason
 
-        if is_safe:
+        # a single run of a never-ending loop just hits the executor timeout once
+        if verdict or verdict.will_time_out:
             print(f"Job {job_id} is SAFE. Reason: {reason}")
             result_data = {
                 "jobId": job_id,
@@ -536,6 +130,7 @@ def consume_programmiz_requests():
                 "code": code,
                 "socketId": socketId
             }
+            program_hashes.stamp(result_data, code, language, RAW_TEMPLATE_VERSION)
             producer.send("programiz_execution", result_data)
             producer.flush()
         else:
@@ -577,22 +172,84 @@ def consume_alltest_cases():
         socket_id = job.get("socketId")
         userId = job.get("userId")
         problemId = job.get("problemId")
+        function_name = job_function_name(job)
         print(f"Received test_code job {job_id} ({language}) with {
               len(testCases)} test cases")
         print("problemid:", problemId)
         # ---- safety check -------------------------------------------------
-        is_safe = checker.check(code, language)
-        reason = checker.reason()
+        verdict = checker.check(code, language)
+        reason = verdict.reason
 
-        if not is_safe:
+        if verdict.will_time_out:
+            # every test case would run into the executor timeout; answer once instead
+            print(f"Test case job {job_id} WILL TIME OUT. Reason: {reason}")
+            publish_blocked_result(job_id, socket_id, reason, language, code, status="timeout")
+            continue
+
+        if not verdict:
             print(f"Test case job {job_id} BLOCKED. Reason: {reason}")
             publish_blocked_result(job_id, socket_id, reason, language, code)
             continue
 
+        # ---- batch mode: one program per chunk of test cases -------------
+        batch = prepare_batch(code, job, language) if BATCH_CHUNK_SIZE > 0 else None
+        if batch is not None:
+            chunks = list(iter_chunks(testCases, BATCH_CHUNK_SIZE))
+            for k, (first, chunk) in enumerate(chunks):
+                batch_job = {
+                    "jobId": job_id,
+                    "batchId": f"{job_id}_batch_{k+1}",
+                    "batchNumber": k + 1,
+                    "totalBatches": len(chunks),
+                    "totalTestCases": len(testCases),
+                    "testCases": [{
+                        "testCaseId": f"{job_id}_test_{first+j}",
+                        "testCaseNumber": first + j,
+                        "input": tc.get("input"),
+                        "expected": tc.get("expected"),
+                    } for j, tc in enumerate(chunk)],
+                    "caseMarker": BATCH_CASE_MARKER,
+                    "errorMarker": BATCH_ERROR_MARKER,
+                    "language": language,
+                    "wrappedCode": render_batch_wrapper(
+                        batch, chunk, language, first,
+                        variable_cache.blocks(problemId, chunk, language, function_name=function_name)),
+                    "originalCode": code,
+                    "problem": problem,
+                    "status": "ready_for_execution",
+                    "socketId": socket_id,
+                    "userId": userId,
+                    "problemId": problemId
+                }
+                program_hashes.stamp(batch_job, batch_job["wrappedCode"], language)
+                try:
+                    producer.send("all_test_batch_execution", batch_job)
+                    producer.flush()
+                    print(f"Published batch {k+1}/{len(chunks)} -> {batch_job['batchId']}")
+                except Exception as e:
+                    print(f"Failed to publish batch {k+1}: {e}")
+            print(f"Finished job {job_id} – {len(testCases)} test cases in {len(chunks)} batches")
+            continue
+
+        # ---- stdin mode: the same program for every test case ------------
+        payloads = None
+        stdin_job = prepare_stdin_program(code, job, language) if STDIN_HARNESS else None
+        if stdin_job is not None:
+            stdin_program, inputs = stdin_job
+            payloads = [encode_stdin_input(tc.get("input", ""), inputs) for tc in testCases]
+            if None in payloads:
+                print(f"Job {job_id}: test input does not fit the stdin harness, embedding it")
+                payloads = None
+
         # ---- generate wrapper for each test case (suppress prints) -------
+        # the user code is cleaned and bound into the template once per job
+        job_template = prepare_wrapper(code, job, language, suppress_prints=True) if payloads is None else None
         for i, tc in enumerate(testCases):
-            wrapped = generate_wrapper(
-                code, job, tc, language, suppress_prints=True)
+            if payloads is not None:
+                wrapped = stdin_program
+            else:
+                block = variable_cache.block(problemId, tc, language, function_name=function_name) if job_template else None
+                wrapped = render_wrapper(job_template, tc, language, block) if job_template else code
 
             test_case_job = {
                 "jobId": job_id,
@@ -610,6 +267,11 @@ def consume_alltest_cases():
                 "userId": userId,
                 "problemId": problemId
             }
+            if payloads is not None:
+                test_case_job["inputMode"] = "stdin"
+                test_case_job["stdin"] = payloads[i]
+            program_hashes.stamp(test_case_job, wrapped, language,
+                                 RAW_TEMPLATE_VERSION if wrapped is code else TEMPLATE_VERSION)
 
             try:
                 producer.send("all_test_execution", test_case_job)
@@ -659,10 +321,10 @@ def consume_printone_case():
         print(f"Received direct run_code job {job_id} ({language})")
 
         # ---- safety -------------------------------------------------------
-        is_safe = checker.check(code, language)
-        reason = checker.reason()
+        verdict = checker.check(code, language)
+        reason = verdict.reason
 
-        if not is_safe:
+        if not verdict and not verdict.will_time_out:
             print(f"Direct run job {job_id} BLOCKED. Reason: {reason}")
             publish_blocked_result(job_id, socket_id, reason, language, code)
             continue
@@ -678,6 +340,8 @@ def consume_printone_case():
             "language": language
         }
 
+        program_hashes.stamp(structured_job, wrapped, language,
+                             RAW_TEMPLATE_VERSION if wrapped is code else TEMPLATE_VERSION)
         producer.send("print_test_execution", structured_job)
         producer.flush()
         print("Direct run job forwarded to executor.")
@@ -693,3 +357,11 @@ threading.Thread(target=consume_printone_case, daemon=True).start()
 # Keep the main thread alive
 while True:
     time.sleep(60)
+    print("SafetyChecker verdict cache:", checker.cache_stats())
+    print("SafetyChecker pre-gate rejections:", checker.pregate_stats())
+    print("SafetyChecker policy:", checker.policy_version)
+    print("SafetyChecker latency:", checker.latency_stats())
+    print("SafetyChecker rules:", checker.rule_stats())
+    print("Program hashes:", program_hashes.stats())
+    print("Template registry:", registry_stats())
+    print("Test variable cache:", variable_cache.stats())
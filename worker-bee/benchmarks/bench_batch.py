@@ -0,0 +1,94 @@
+"""
+bench_batch.py
+
+Sandbox cost of one all-tests job: compile + run time for one program per test
+case ("per-test", what all_test_execution carries today) versus one batch
+program for the whole job (all_test_batch_execution). Uses the twoSum
+solutions from corpus.py and the same toolchain commands as go-exec; languages
+whose toolchain is not installed are skipped. Also checks that every batch
+case prints what its per-test program printed.
+
+Usage:
+    python3 benchmarks/bench_batch.py [--tests 20] [--languages c,go,python]
+"""
+import argparse
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import harness  # noqa: E402
+from corpus import TYPICAL  # noqa: E402
+
+JOB = {"function_name": "twoSum"}
+
+# (file name, build command or None, run command, required tools), as in go-exec's executeCode
+TOOLCHAINS = {
+    "python": ("main.py", None, ["python3", "main.py"], ["python3"]),
+    "javascript": ("main.js", None, ["node", "main.js"], ["node"]),
+    "c": ("main.c", ["gcc", "-O2", "-o", "main", "main.c", "-lm"], ["./main"], ["gcc"]),
+    "go": ("main.go", ["go", "build", "-o", "main", "main.go"], ["./main"], ["go"]),
+    "java": ("Main.java", ["javac", "Main.java"], ["java", "-cp", ".", "Main"], ["javac", "java"]),
+}
+
+
+def build_tests(count, size=50, seed=11):
+    rng = random.Random(seed)
+    tests = []
+    for _ in range(count):
+        nums = rng.sample(range(-10_000, 10_000), size)
+        i, j = rng.sample(range(size), 2)
+        tests.append({"input": f"nums = [{','.join(map(str, nums))}], target = {nums[i] + nums[j]}"})
+    return tests
+
+
+def compile_and_run(language, source):
+    """(stdout, seconds) for one program, build included."""
+    file_name, build, run, _ = TOOLCHAINS[language]
+    with tempfile.TemporaryDirectory() as d:
+        with open(os.path.join(d, file_name), "w") as f:
+            f.write(source)
+        t0 = time.perf_counter()
+        if build:
+            subprocess.run(build, cwd=d, check=True, capture_output=True)
+        out = subprocess.run(run, cwd=d, check=True, capture_output=True, text=True).stdout
+        return out, time.perf_counter() - t0
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--tests", type=int, default=20)
+    ap.add_argument("--languages", default=",".join(TOOLCHAINS))
+    args = ap.parse_args()
+
+    tests = build_tests(args.tests)
+    print(f"twoSum, {args.tests} test cases per job")
+    print(f"{'language':11} {'per-test s':>11} {'batch s':>9} {'speed-up':>9}")
+    for language in args.languages.split(","):
+        if not all(shutil.which(tool) for tool in TOOLCHAINS[language][3]):
+            print(f"{language:11} skipped (toolchain not installed)")
+            continue
+        code = TYPICAL[language]["twoSum"]
+        single = harness.prepare_wrapper(code, JOB, language, suppress_prints=True)
+        batch = harness.prepare_batch(code, JOB, language)
+
+        expected, per_test = [], 0.0
+        for tc in tests:
+            out, secs = compile_and_run(language, harness.render_wrapper(single, tc, language))
+            expected.append(out.strip())
+            per_test += secs
+
+        out, batched = compile_and_run(language, harness.render_batch_wrapper(batch, tests, language))
+        results = harness.split_batch_output(out)
+        got = [results[n]["output"].strip() for n in range(1, len(tests) + 1)]
+        assert got == expected, f"{language}: batch output differs from per-test output"
+        print(f"{language:11} {per_test:11.2f} {batched:9.2f} {per_test / batched:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
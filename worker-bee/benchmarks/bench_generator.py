@@ -0,0 +1,59 @@
+"""
+bench_generator.py
+
+Harness generation from signatures. "generate" builds every problem's harness
+in every language from its signature; "cached" is generator.generate_harness
+once the harnesses are in its cache, what every job after a problem's first
+one pays. Also prints the size of each language's harnesses.
+
+Usage:
+    python3 benchmarks/bench_generator.py [--repeat 200]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import generator  # noqa: E402
+from signatures import PROBLEM_SIGNATURES  # noqa: E402
+
+
+def each_harness(fn):
+    for function_name, signature in PROBLEM_SIGNATURES.items():
+        for language in generator.LANGUAGES:
+            fn(function_name, signature, language)
+
+
+def per_call(fn, repeat):
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        each_harness(fn)
+    return (time.perf_counter() - t0) / (repeat * len(PROBLEM_SIGNATURES) * len(generator.LANGUAGES))
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--repeat", type=int, default=200)
+    args = ap.parse_args()
+
+    generate = per_call(lambda name, signature, language: generator._generate(name, signature, language),
+                        args.repeat)
+    cached = per_call(lambda name, signature, language: generator.generate_harness(signature, language, name),
+                      args.repeat)
+    print(f"{len(PROBLEM_SIGNATURES)} signatures x {len(generator.LANGUAGES)} languages, {args.repeat} rounds")
+    print(f"{'':9} {'us/harness':>11}")
+    for label, secs in (("generate", generate), ("cached", cached)):
+        print(f"{label:9} {secs * 1e6:11.2f}")
+    print(f"speed-up: {generate / cached:.1f}x")
+    print("cache:", generator.generator_stats())
+
+    sizes = {language: 0 for language in generator.LANGUAGES}
+    each_harness(lambda name, signature, language: sizes.__setitem__(
+        language, sizes[language] + len(generator.generate_harness(signature, language, name))))
+    print("bytes per harness:", {language: total // len(PROBLEM_SIGNATURES) for language, total in sizes.items()})
+
+
+if __name__ == "__main__":
+    main()
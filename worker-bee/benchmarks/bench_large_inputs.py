@@ -0,0 +1,112 @@
+"""
+bench_large_inputs.py
+
+Compile-plus-run time of one findMax test case with a large int[] input,
+three ways: "literal" embeds the array in the source (harness.render_wrapper),
+"text" sends it on stdin as decimal text and "i32" as base64 int32 (see
+stdin_harness). Also prints the bytes that would travel in the execution
+message: the source, plus the stdin payload.
+
+Languages whose toolchain is not on PATH are skipped. A build or run that
+fails (javac's 64 KB code limit on literal arrays, for one) is reported with
+its first error line.
+
+Usage:
+    python3 benchmarks/bench_large_inputs.py [--sizes 1000,100000,1000000] [--languages c,go,java]
+"""
+import argparse
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import harness  # noqa: E402
+import stdin_harness  # noqa: E402
+
+SOLUTIONS = {
+    "python": "def findMax(nums):\n    return max(nums)\n",
+    "javascript": "function findMax(nums) {\n    let m = nums[0];\n    for (const x of nums) if (x > m) m = x;\n"
+                  "    return m;\n}\n",
+    "java": "class Solution {\n    public int findMax(int[] nums) {\n        int m = nums[0];\n"
+            "        for (int x : nums) m = Math.max(m, x);\n        return m;\n    }\n}\n",
+    "go": "func findMax(nums []int) int {\n    m := nums[0]\n    for _, x := range nums {\n"
+          "        if x > m {\n            m = x\n        }\n    }\n    return m\n}\n",
+    "c": "int findMax(int* nums, int numsSize) {\n    int m = nums[0];\n"
+         "    for (int i = 1; i < numsSize; i++) if (nums[i] > m) m = nums[i];\n    return m;\n}\n",
+}
+# (source file, build command or None, run command, tool that must be on PATH)
+TOOLCHAINS = {
+    "python": ("main.py", None, ["python3", "main.py"], "python3"),
+    "javascript": ("main.js", None, ["node", "main.js"], "node"),
+    "java": ("Main.java", ["javac", "Main.java"], ["java", "-Xss64m", "Main"], "javac"),
+    "go": ("main.go", ["go", "build", "-o", "main", "main.go"], ["./main"], "go"),
+    "c": ("main.c", ["gcc", "-O2", "-o", "main", "main.c"], ["./main"], "gcc"),
+}
+
+
+def compile_and_run(language, source, payload, timeout):
+    """(build seconds, run seconds, stdout) or an error string."""
+    file_name, build, run, _ = TOOLCHAINS[language]
+    with tempfile.TemporaryDirectory() as d:
+        with open(os.path.join(d, file_name), "w") as f:
+            f.write(source)
+        try:
+            t0 = time.perf_counter()
+            if build:
+                r = subprocess.run(build, cwd=d, capture_output=True, text=True, timeout=timeout)
+                if r.returncode:
+                    return "build failed: " + (r.stderr.strip().splitlines() or ["?"])[0][:60]
+            t1 = time.perf_counter()
+            r = subprocess.run(run, cwd=d, input=payload, capture_output=True, text=True, timeout=timeout)
+            t2 = time.perf_counter()
+        except subprocess.TimeoutExpired:
+            return f"timed out after {timeout}s"
+        if r.returncode:
+            return "run failed: " + (r.stderr.strip().splitlines() or ["?"])[-1][:60]
+        return t1 - t0, t2 - t1, r.stdout.strip()
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes", default="1000,100000,1000000", help="array lengths")
+    ap.add_argument("--languages", default=",".join(TOOLCHAINS))
+    ap.add_argument("--timeout", type=int, default=600, help="seconds per build or run")
+    args = ap.parse_args()
+
+    job = {"function_name": "findMax"}
+    print(f"{'language':11} {'n':>8} {'mode':8} {'source KB':>9} {'stdin KB':>9} "
+          f"{'build s':>8} {'run s':>7} {'total s':>8}")
+    for language in args.languages.split(","):
+        if shutil.which(TOOLCHAINS[language][3]) is None:
+            print(f"{language:11} skipped: {TOOLCHAINS[language][3]} not found")
+            continue
+        code = SOLUTIONS[language]
+        literal = harness.prepare_wrapper(code, job, language, suppress_prints=True)
+        program, inputs = stdin_harness.prepare_stdin_program(code, job, language)
+        for n in map(int, args.sizes.split(",")):
+            rng = random.Random(n)
+            nums = [rng.randint(-2 ** 31, 2 ** 31 - 1) for _ in range(n)]
+            test_input = f"nums = [{','.join(map(str, nums))}]"
+            modes = (
+                ("literal", harness.render_wrapper(literal, {"input": test_input}, language), ""),
+                ("text", program, stdin_harness.encode_stdin_input(test_input, inputs, binary_min=None)),
+                ("i32", program, stdin_harness.encode_stdin_input(test_input, inputs, binary_min=1)),
+            )
+            for mode, source, payload in modes:
+                result = compile_and_run(language, source, payload, args.timeout)
+                sizes = f"{len(source) / 1024:9.0f} {len(payload) / 1024:9.0f}"
+                if isinstance(result, str):
+                    print(f"{language:11} {n:8} {mode:8} {sizes} {result}")
+                    continue
+                build, run, out = result
+                check = "" if out == str(max(nums)) else f"  wrong output {out[:20]!r}"
+                print(f"{language:11} {n:8} {mode:8} {sizes} {build:8.2f} {run:7.2f} {build + run:8.2f}{check}")
+
+
+if __name__ == "__main__":
+    main()
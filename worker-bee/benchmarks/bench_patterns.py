@@ -0,0 +1,113 @@
+"""
+bench_patterns.py
+
+Checks/sec for the regex-based languages (JavaScript, C, Go, Java) on large,
+clean submissions: the old per-check `re.search(pattern_string, code)` loop
+versus the precompiled per-policy `_PatternSet` matcher in judge.py.
+
+Usage:
+    python3 benchmarks/bench_patterns.py [--lines 2000] [--repeat 20]
+"""
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import judge  # noqa: E402
+
+SAMPLE_LINES = {
+    "javascript": [
+        "function twoSum(nums, target) {",
+        "    const seen = new Map();",
+        "    for (let i = 0; i < nums.length; i++) {",
+        "        const need = target - nums[i];",
+        "        if (seen.has(need)) return [seen.get(need), i];",
+        "        seen.set(nums[i], i);",
+        "    }",
+        "    return [];",
+        "}",
+    ],
+    "c": [
+        "int* twoSum(int* nums, int numsSize, int target, int* returnSize) {",
+        "    for (int i = 0; i < numsSize; i++) {",
+        "        for (int j = i + 1; j < numsSize; j++) {",
+        "            if (nums[i] + nums[j] == target) { *returnSize = 2; }",
+        "        }",
+        "    }",
+        "    return nums;",
+        "}",
+    ],
+    "go": [
+        "func twoSum(nums []int, target int) []int {",
+        "    seen := map[int]int{}",
+        "    for i, n := range nums {",
+        "        if j, ok := seen[target-n]; ok { return []int{j, i} }",
+        "        seen[n] = i",
+        "    }",
+        "    return nil",
+        "}",
+    ],
+    "java": [
+        "class Solution {",
+        "    public int[] twoSum(int[] nums, int target) {",
+        "        Map<Integer, Integer> seen = new HashMap<>();",
+        "        for (int i = 0; i < nums.length; i++) {",
+        "            if (seen.containsKey(target - nums[i])) return new int[]{seen.get(target - nums[i]), i};",
+        "            seen.put(nums[i], i);",
+        "        }",
+        "        return null;",
+        "    }",
+        "}",
+    ],
+}
+
+PATTERN_LISTS = {
+    "javascript": judge._JS_FORBIDDEN_PATTERNS,
+    "c": judge._C_BLOCKED_FUNCS,
+    "go": judge._GO_SUSPICIOUS_PATTERNS,
+    "java": judge._JAVA_FORBIDDEN_PATTERNS,
+}
+
+
+def build_submission(language, lines):
+    body = SAMPLE_LINES[language]
+    return "\n".join(body[i % len(body)] for i in range(lines))
+
+
+def legacy_first_match(patterns, code):
+    for p in patterns:
+        if re.search(p, code):
+            return p
+    return None
+
+
+def rate(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return repeat / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--lines", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    re.purge()
+    print(f"{'language':<12}{'bytes':>10}{'before/s':>12}{'after/s':>12}{'speedup':>10}")
+    for language, patterns in PATTERN_LISTS.items():
+        code = build_submission(language, args.lines)
+        matcher = judge._PatternSet(patterns)
+        assert legacy_first_match(patterns, code) == matcher.first_match(code)
+
+        before = rate(lambda: legacy_first_match(patterns, code), args.repeat)
+        after = rate(lambda: matcher.first_match(code), args.repeat)
+        print(f"{language:<12}{len(code):>10}{before:>12.1f}{after:>12.1f}{after / before:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+bench_preludes.py
+
+Size and build time of the harnesses with their prelude trimmed to the
+helpers they reference (preludes.compose, what generator.py does) against
+the same harnesses carrying every fragment of their language. Sizes cover
+every signature; build time is one reverseList program per language
+("build" is `node --check` / py_compile for the interpreted ones), skipped
+where the toolchain is missing.
+
+Usage:
+    python3 benchmarks/bench_preludes.py [--repeat 5]
+"""
+import argparse
+import os
+import py_compile
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import generator  # noqa: E402
+import preludes  # noqa: E402
+from signatures import PROBLEM_SIGNATURES  # noqa: E402
+from templates import compile_template  # noqa: E402
+
+REVERSE_LIST = {
+    "python": "def reverseList(head):\n    prev = None\n    while head:\n"
+              "        head.next, prev, head = prev, head, head.next\n    return prev\n",
+    "javascript": "function reverseList(head) {\n    let prev = null;\n"
+                  "    while (head) { const next = head.next; head.next = prev; prev = head; head = next; }\n"
+                  "    return prev;\n}\n",
+    "go": "type ListNode struct {\n    Val  int\n    Next *ListNode\n}\n\nfunc reverseList(head *ListNode) *ListNode {\n"
+          "    var prev *ListNode\n    for head != nil {\n        next := head.Next\n        head.Next = prev\n"
+          "        prev = head\n        head = next\n    }\n    return prev\n}\n",
+    "c": "struct ListNode* reverseList(struct ListNode* head) {\n    struct ListNode* prev = NULL;\n"
+         "    while (head) { struct ListNode* next = head->next; head->next = prev; prev = head; head = next; }\n"
+         "    return prev;\n}\n",
+}
+TEST_VARIABLES = {
+    "python": "head = [1, 2, 3]",
+    "javascript": "const head = [1, 2, 3];",
+    "go": "head := []int{1, 2, 3}",
+    "c": "int head[] = {1, 2, 3};\n    int head_size = 3;",
+}
+BUILDS = {
+    "javascript": ("main.js", ["node", "--check", "main.js"]),
+    "go": ("main.go", ["go", "build", "-o", "main", "main.go"]),
+    "c": ("main.c", ["gcc", "-O2", "-o", "main", "main.c"]),
+}
+
+
+def full(language, function_name, signature):
+    """The harness with every fragment of its language."""
+    text = generator._harness_text(function_name, signature, language)
+    return preludes.compose(language, text, extra=[f.name for f in preludes.FRAGMENTS[language]])
+
+
+def build_seconds(language, source, repeat):
+    best = float("inf")
+    with tempfile.TemporaryDirectory() as d:
+        if language == "python":
+            path = os.path.join(d, "main.py")
+            with open(path, "w") as f:
+                f.write(source)
+            for _ in range(repeat):
+                t0 = time.perf_counter()
+                py_compile.compile(path, doraise=True)
+                best = min(best, time.perf_counter() - t0)
+            return best
+        file_name, command = BUILDS[language]
+        with open(os.path.join(d, file_name), "w") as f:
+            f.write(source)
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            subprocess.run(command, cwd=d, check=True, capture_output=True)
+            best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    print(f"{'language':11} {'trimmed KB':>10} {'full KB':>8}   (all {len(PROBLEM_SIGNATURES)} signatures)")
+    for language in generator.LANGUAGES:
+        trimmed = sum(len(generator._generate(name, signature, language))
+                      for name, signature in PROBLEM_SIGNATURES.items())
+        everything = sum(len(full(language, name, signature)) for name, signature in PROBLEM_SIGNATURES.items())
+        print(f"{language:11} {trimmed / 1024:10.1f} {everything / 1024:8.1f}")
+
+    print(f"\nreverseList build, best of {args.repeat}")
+    print(f"{'language':11} {'trimmed ms':>10} {'full ms':>8}")
+    signature = PROBLEM_SIGNATURES["reverseList"]
+    for language, code in REVERSE_LIST.items():
+        tool = BUILDS.get(language, (None, ["python3"]))[1][0]
+        if shutil.which(tool) is None:
+            print(f"{language:11} skipped: {tool} not found")
+            continue
+        values = {"USER_CODE": code, "USER_TYPES": preludes.user_types(language, code),
+                  "TEST_VARIABLES": TEST_VARIABLES[language]}
+        sources = (generator._generate("reverseList", signature, language), full(language, "reverseList", signature))
+        times = [build_seconds(language, compile_template(text).render(**values), args.repeat) for text in sources]
+        print(f"{language:11} {times[0] * 1000:10.1f} {times[1] * 1000:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+bench_prints.py
+
+Print suppression on one large submission per language. "ready2" and "test"
+are the two per-line remove_user_prints functions that used to live in
+Ready2.py and test.py (kept below, behaviour unchanged); "engine" is the single-pass
+harness.remove_user_prints. The submissions contain calls spanning two lines
+and prints behind an `if` on the same line; "left" counts the print calls a
+version leaves active and "unbal" the parentheses it leaves unbalanced
+(commenting out the first line of a two-line call), either of which means
+output still flows or the program no longer compiles.
+
+Usage:
+    python3 benchmarks/bench_prints.py [--functions 400] [--repeat 20]
+"""
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import harness  # noqa: E402
+
+# print calls that would still write, per language (not inside a comment)
+ACTIVE_PRINTS = {
+    "python": re.compile(r"^(?![ \t]*#).*?(?<![\w.])print\(", re.M),
+    "javascript": re.compile(r"^(?![ \t]*//).*?console\.log\(", re.M),
+    "java": re.compile(r"^(?![ \t]*//).*?System\.out\.print", re.M),
+    "go": re.compile(r"^(?![ \t]*//).*?fmt\.Print", re.M),
+    "c": re.compile(r"^(?![ \t]*//).*?(?<!\w)printf\(", re.M),
+}
+
+
+LINE_COMMENT = {"python": re.compile(r"#[^\n]*")}
+
+
+def unbalanced(code, language):
+    """Open minus close parentheses outside line comments (string contents ignored)."""
+    code = LINE_COMMENT.get(language, re.compile(r"//[^\n]*")).sub("", code)
+    return code.count("(") - code.count(")")
+
+
+def ready2_remove_user_prints(code, language):
+    """Ready2.py's version (one if/elif branch per language)."""
+    markers = {"javascript": 'console.log(', "go": 'fmt.Println(', "java": 'System.out.print', "c": 'printf('}
+    if language == "python":
+        lines = code.split('\n')
+        cleaned = []
+        for line in lines:
+            stripped = line.strip()
+            if stripped.startswith('print(') and not stripped.startswith('#'):
+                cleaned.append(' # ' + line.strip() +
+                               ' # Suppressed for test case')
+            else:
+                cleaned.append(line)
+        return '\n'.join(cleaned)
+    elif language in markers:
+        lines = code.split('\n')
+        cleaned = []
+        for line in lines:
+            stripped = line.strip()
+            if markers[language] in stripped and not stripped.startswith('//'):
+                cleaned.append(' // ' + line.strip() +
+                               ' // Suppressed for test case')
+            else:
+                cleaned.append(line)
+        return '\n'.join(cleaned)
+    return code
+
+
+def test_remove_user_prints(code, language):
+    """test.py's version (the language checked on every line)."""
+    lines = code.split('\n')
+    cleaned = []
+
+    for line in lines:
+        stripped = line.strip()
+        if language == "python" and stripped.startswith('print('):
+            cleaned.append(' # ' + line + ' # Suppressed for test case')
+        elif language == "javascript" and 'console.log(' in stripped:
+            cleaned.append(' // ' + line + ' // Suppressed for test case')
+        elif language == "go" and 'fmt.Println(' in stripped:
+            cleaned.append(' // ' + line + ' // Suppressed for test case')
+        elif language == "java" and 'System.out.print' in stripped:
+            cleaned.append(' // ' + line + ' // Suppressed for test case')
+        elif language == "c" and 'printf(' in stripped:
+            cleaned.append(' // ' + line + ' // Suppressed for test case')
+        else:
+            cleaned.append(line)
+
+    return '\n'.join(cleaned)
+
+
+def build_submission(language, functions):
+    out = []
+    for i in range(functions):
+        if language == "python":
+            out += [f"def helper{i}(nums):", "    total = 0", "    for n in nums:", "        total += n",
+                    "        if total > 10: print('big', total)",
+                    f"    print('helper{i}',", "          total)", "    return total", ""]
+        elif language == "javascript":
+            out += [f"function helper{i}(nums) {{", "  let total = 0;", "  for (const n of nums) total += n;",
+                    "  console.log('helper',", "    total);", "  return total;", "}"]
+        elif language == "java":
+            out += [f"  int helper{i}(int[] nums) {{", "    int total = 0;", "    for (int n : nums) total += n;",
+                    "    System.out.println(\"helper \" +", "        total);", "    return total;", "  }"]
+        elif language == "go":
+            out += [f"func helper{i}(nums []int) int {{", "\ttotal := 0", "\tfor _, n := range nums {",
+                    "\t\ttotal += n", "\t}", "\tfmt.Println(\"helper\",", "\t\ttotal)", "\treturn total", "}"]
+        else:
+            out += [f"int helper{i}(int* nums, int n) {{", "    int total = 0;",
+                    "    for (int i = 0; i < n; i++) total += nums[i];",
+                    "    printf(\"helper %d\\n\",", "           total);", "    return total;", "}"]
+    return "\n".join(out)
+
+
+def best_of(fn, code, language, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(code, language)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--functions", type=int, default=400, help="helper functions per submission")
+    ap.add_argument("--repeat", type=int, default=20)
+    args = ap.parse_args()
+
+    versions = (("ready2", ready2_remove_user_prints), ("test", test_remove_user_prints),
+                ("engine", harness.remove_user_prints))
+    print(f"{args.functions} helpers per submission, best of {args.repeat}")
+    print(f"{'language':11} {'KB':>5} "
+          + " ".join(f"{label + ' ms':>10} {'left':>5} {'unbal':>5}" for label, _ in versions))
+    for language in ACTIVE_PRINTS:
+        code = build_submission(language, args.functions)
+        cells = []
+        for _, fn in versions:
+            out = fn(code, language)
+            left = len(ACTIVE_PRINTS[language].findall(out))
+            cells.append(f"{best_of(fn, code, language, args.repeat) * 1000:10.2f} {left:5} "
+                         f"{unbalanced(out, language):5}")
+        print(f"{language:11} {len(code) // 1024:5} " + " ".join(cells))
+
+
+if __name__ == "__main__":
+    main()
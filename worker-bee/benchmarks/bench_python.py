@@ -0,0 +1,77 @@
+"""
+bench_python.py
+
+Checks/sec of SafetyChecker's Python check on generated 5k-line submissions
+dense with bytearray(...), list(range(...)) and `[x] * call(...)` sites, i.e.
+the sites that need a source segment. "before" swaps the line-offset index for
+ast.get_source_segment (which re-splits the whole source per call), "after" is
+the shipped checker. The "before" run is quadratic and takes about a minute
+at 5k lines, so it is timed once.
+
+Usage:
+    python3 benchmarks/bench_python.py [--lines 5000] [--repeat 5]
+"""
+import argparse
+import ast
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import judge  # noqa: E402
+
+
+class _ResplittingIndex(judge._SourceIndex):
+    """The pre-index behaviour: every segment re-splits the full source."""
+
+    def segment(self, node):
+        return ast.get_source_segment(self.code, node) or ""
+
+
+def build_submission(lines):
+    out = ["import math", "", "def solve(n, xs):", "    total = 0"]
+    kinds = (
+        "    buf{i} = bytearray(n + {i})",
+        "    seq{i} = list(range(n * {i} + 1))",
+        "    row{i} = [0] * len(xs[{i}:])",
+        "    total += math.floor({i} / 3)",
+    )
+    for i in range(lines - len(out) - 1):
+        out.append(kinds[i % len(kinds)].format(i=i))
+    out.append("    return total")
+    return "\n".join(out)
+
+
+def rate(checker, code, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        verdict = checker.check(code, "python")
+        assert verdict, verdict.reason
+    return repeat / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--lines", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    code = build_submission(args.lines)
+    checker = judge.SafetyChecker(cache_size=0)
+
+    shipped = judge._SourceIndex
+    judge._SourceIndex = _ResplittingIndex
+    try:
+        before = rate(checker, code, 1)
+    finally:
+        judge._SourceIndex = shipped
+    after = rate(checker, code, args.repeat)
+
+    print(f"lines={args.lines} bytes={len(code)}")
+    print(f"before: {before:8.2f} checks/s")
+    print(f"after:  {after:8.2f} checks/s  ({after / before:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
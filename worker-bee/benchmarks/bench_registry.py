@@ -0,0 +1,86 @@
+"""
+bench_registry.py
+
+Start-up cost of the problem templates as the problem set grows. "eager" is
+what importing Ready.PROBLEM_TEMPLATES and compiling it at import used to do:
+every template read, compiled and split for batch mode. "lazy" is the
+registry: only the index is read at start-up, and a worker then compiles the
+templates of the problems it serves (--served of them, all languages).
+
+The problem set is the generated harness of every signature in
+signatures.py, written --copies times into a temporary directory under new
+function names. Memory is what
+tracemalloc sees allocated and still held.
+
+Usage:
+    python3 benchmarks/bench_registry.py [--copies 1,10,100] [--served 5]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import registry  # noqa: E402
+from generator import LANGUAGES  # noqa: E402
+from signatures import PROBLEM_SIGNATURES  # noqa: E402
+from templates import compile_template, problem_text, split_for_batch  # noqa: E402
+
+
+def build_problem_set(root, copies):
+    for name in PROBLEM_SIGNATURES:
+        for k in range(copies):
+            directory = os.path.join(root, name if k == 0 else f"{name}{k}")
+            os.makedirs(directory)
+            for language in LANGUAGES:
+                with open(os.path.join(directory, language + registry.TEMPLATE_SUFFIX), "w") as f:
+                    f.write(problem_text(name, language))
+    registry.write_index(root)
+
+
+def start_worker(root, served):
+    """Read the index, then read, compile and batch-split the first `served`
+    problems' templates (every problem when `served` is None)."""
+    templates = registry.TemplateRegistry(root)
+    held = []
+    for function_name in templates.function_names()[:served]:
+        for language in templates.languages(function_name):
+            text = templates.text(function_name, language)
+            held.append((compile_template(text), split_for_batch(text, language)))
+    return templates, held
+
+
+def measure(fn, root, served):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    result = fn(root, served)
+    secs = time.perf_counter() - t0
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return secs, memory
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--copies", default="1,10,100", help="problem set sizes, in copies of the signatures")
+    ap.add_argument("--served", type=int, default=5, help="problems a lazy worker compiles")
+    args = ap.parse_args()
+
+    print(f"lazy worker serves {args.served} problems; times include compiling, memory is held after")
+    print(f"{'problems':>8} {'eager ms':>9} {'eager KB':>9} {'lazy ms':>8} {'lazy KB':>8}")
+    for copies in map(int, args.copies.split(",")):
+        with tempfile.TemporaryDirectory() as root:
+            build_problem_set(root, copies)
+            problems = len(registry.TemplateRegistry(root).function_names())
+            eager_secs, eager_mem = measure(start_worker, root, None)
+            lazy_secs, lazy_mem = measure(start_worker, root, args.served)
+        print(f"{problems:8} {eager_secs * 1000:9.1f} {eager_mem / 1024:9.0f} "
+              f"{lazy_secs * 1000:8.1f} {lazy_mem / 1024:8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+bench_suite.py
+
+SafetyChecker benchmark over the submission corpus in corpus.py.
+
+Every case is checked `--repeat` times with the verdict cache disabled.
+Throughput (checks/sec) and p50/p99 latency are reported per language, per
+rule (the rule id of the verdict, "ok" for accepted code) and per case,
+followed by the checker's own latency histogram against its time budget and
+the share of check time each rule stage took (SafetyChecker.rule_stats). With
+`--json PATH` the same numbers are written as JSON, so runs from different
+versions can be diffed to track regressions.
+
+Usage:
+    python3 benchmarks/bench_suite.py [--repeat 20] [--scale 1] [--json out.json] [--label v1]
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, ".."))
+sys.path.insert(0, HERE)
+
+import judge  # noqa: E402
+from corpus import build_corpus  # noqa: E402
+
+
+def percentile(sorted_ns: List[int], pct: float) -> float:
+    """Nearest-rank percentile of already sorted samples, in microseconds."""
+    if not sorted_ns:
+        return 0.0
+    rank = max(0, min(len(sorted_ns) - 1, int(round(pct / 100.0 * len(sorted_ns))) - 1))
+    return sorted_ns[rank] / 1000.0
+
+
+def summarize(samples: List[int]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    total = sum(ordered)
+    return {
+        "checks": len(ordered),
+        "checks_per_sec": (len(ordered) / (total / 1e9)) if total else 0.0,
+        "p50_us": percentile(ordered, 50),
+        "p99_us": percentile(ordered, 99),
+        "max_us": ordered[-1] / 1000.0 if ordered else 0.0,
+    }
+
+
+def run(repeat: int, scale: int) -> Dict[str, object]:
+    checker = judge.SafetyChecker(cache_size=0)
+    by_language: Dict[str, List[int]] = defaultdict(list)
+    by_rule: Dict[str, List[int]] = defaultdict(list)
+    cases = []
+
+    for case in build_corpus(scale):
+        samples = []
+        verdict = None
+        for _ in range(repeat):
+            start = time.perf_counter_ns()
+            verdict = checker.check(case.code, case.language)
+            samples.append(time.perf_counter_ns() - start)
+        rule = verdict.rule or "ok"
+        by_language[case.language].extend(samples)
+        by_rule[rule].extend(samples)
+        cases.append({
+            "name": case.name,
+            "language": case.language,
+            "category": case.category,
+            "bytes": len(case.code),
+            "rule": rule,
+            **summarize(samples),
+        })
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": repeat,
+            "scale": scale,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        },
+        "languages": {lang: summarize(s) for lang, s in sorted(by_language.items())},
+        "rules": {rule: summarize(s) for rule, s in sorted(by_rule.items())},
+        "cases": cases,
+        "latency": checker.latency_stats(),
+        "rule_stats": checker.rule_stats(),
+    }
+
+
+def print_table(title: str, rows: Dict[str, Dict[str, float]]) -> None:
+    print(f"\n{title}")
+    print(f"  {'':<32}{'checks/s':>12}{'p50 us':>12}{'p99 us':>12}{'max us':>12}")
+    for name, s in rows.items():
+        print(f"  {name:<32}{s['checks_per_sec']:>12.1f}{s['p50_us']:>12.1f}{s['p99_us']:>12.1f}{s['max_us']:>12.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--scale", type=int, default=1, help="size multiplier for large/adversarial cases")
+    parser.add_argument("--json", metavar="PATH", help="also write the results as JSON")
+    parser.add_argument("--label", help="free-form version label stored in the JSON meta")
+    args = parser.parse_args()
+
+    results = run(args.repeat, args.scale)
+    if args.label:
+        results["meta"]["label"] = args.label
+
+    print_table("per language", results["languages"])
+    print_table("per rule", results["rules"])
+    print_table("per case", {c["name"]: c for c in results["cases"]})
+
+    latency = results["latency"]
+    print(f"\nlatency vs {latency['budget_seconds']:g}s budget: max {latency['max_seconds'] * 1e3:.1f} ms, "
+          f"{latency['over_half_budget']} checks over half the budget, {latency['timeouts']} timeouts")
+    print("  " + "  ".join(f"<={le}:{n}" for le, n in latency["buckets"].items()))
+
+    print(f"\n  {'time per rule stage':<32}{'calls':>12}{'hits':>12}{'total ms':>12}{'share':>12}")
+    for lang, rules in results["rule_stats"].items():
+        lang_ns = sum(r["ns"] for r in rules.values()) or 1
+        for rule, r in sorted(rules.items(), key=lambda kv: -kv[1]["ns"]):
+            print(f"  {lang + ' ' + rule:<32}{r['calls']:>12}{r['hits']:>12}{r['ns'] / 1e6:>12.1f}{r['ns'] / lang_ns:>12.1%}")
+
+    if args.json:
+        with open(args.json, "w") as fh:
+            json.dump(results, fh, indent=2)
+        print(f"\nwrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+bench_testinput.py
+
+Time to turn one test case into its {{TEST_VARIABLES}} block, for arrays of
+10^5 elements in every language. "before" is the old
+parse_and_format_test_variables, kept below verbatim (character-by-character
+split with `current_part += char`, types guessed from the literal text per
+language); "after" is testinput.parse_test_input once plus
+testinput.emit_variables.
+
+Usage:
+    python3 benchmarks/bench_testinput.py [--size 100000] [--repeat 5]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from testinput import emit_variables, parse_test_input  # noqa: E402
+
+LANGUAGES = ("python", "javascript", "java", "go", "c")
+
+
+def legacy_format(test_input, language):
+    """The old harness.parse_and_format_test_variables."""
+    if not test_input:
+        return ""
+
+    parts = []
+    current_part = ""
+    bracket_count = 0
+    in_string = False
+
+    i = 0
+    while i < len(test_input):
+        char = test_input[i]
+
+        if char == '"' and (i == 0 or test_input[i-1] != '\\'):
+            in_string = not in_string
+        elif char == '[' and not in_string:
+            bracket_count += 1
+        elif char == ']' and not in_string:
+            bracket_count -= 1
+        elif char == ',' and bracket_count == 0 and not in_string:
+            parts.append(current_part.strip())
+            current_part = ""
+            i += 1
+            continue
+
+        current_part += char
+        i += 1
+
+    if current_part.strip():
+        parts.append(current_part.strip())
+
+    formatted_vars = []
+    for part in parts:
+        if '=' in part:
+            key, value = part.split('=', 1)
+            key = key.strip()
+            value = value.strip()
+
+            if language == "python":
+                formatted_vars.append(f"{key} = {value}")
+            elif language == "javascript":
+                formatted_vars.append(f"const {key} = {value};")
+            elif language == "java":
+                if value.startswith('[') and value.endswith(']'):
+                    java_array = value.replace('[', '{').replace(']', '}')
+                    if key in ['s'] and value.startswith("['") and value.endswith("']"):
+                        formatted_vars.append(f"char[] {key} = {java_array};")
+                    else:
+                        formatted_vars.append(f"int[] {key} = {java_array};")
+                elif value.startswith('"') and value.endswith('"'):
+                    formatted_vars.append(f"String {key} = {value};")
+                elif value.replace('.', '').replace('-', '').isdigit():
+                    formatted_vars.append(f"int {key} = {value};")
+                else:
+                    formatted_vars.append(f"var {key} = {value};")
+            elif language == "go":
+                if value.startswith('[') and value.endswith(']'):
+                    inner_content = value[1:-1]
+                    if value.startswith("['") and value.endswith("']"):
+                        formatted_vars.append(f"{key} := []byte{{{inner_content}}}")
+                    else:
+                        formatted_vars.append(f"{key} := []int{{{inner_content}}}")
+                else:
+                    formatted_vars.append(f"{key} := {value}")
+            elif language == "c":
+                if value.startswith('[') and value.endswith(']'):
+                    c_array = value.replace('[', '{').replace(']', '}')
+                    array_elements = value[1:-1].split(',') if value != '[]' else []
+                    array_size = len(array_elements) if array_elements != [''] else 0
+                    size_name = key + "Size" if key in ('nums', 'nums1', 'nums2') else key + "_size"
+                    c_type = "char" if value.startswith("['") else "int"
+                    formatted_vars.append(f"{c_type} {key}[] = {c_array};")
+                    formatted_vars.append(f"int {size_name} = {array_size};")
+                elif value.startswith('"') and value.endswith('"'):
+                    formatted_vars.append(f"char* {key} = {value};")
+                else:
+                    formatted_vars.append(f"int {key} = {value};")
+
+    return '\n'.join(formatted_vars)
+
+
+def build_inputs(size, seed=5):
+    rng = random.Random(seed)
+    nums = [rng.randint(-10 ** 9, 10 ** 9) for _ in range(size)]
+    chars = [chr(rng.randint(97, 122)) for _ in range(size)]
+    return {
+        "int[]": f"nums = [{','.join(map(str, nums))}], target = {nums[0] + nums[-1]}",
+        "char[]": "s = [" + ",".join(f"'{c}'" for c in chars) + "]",
+        "string": f's = "{"".join(chars)}"',
+    }
+
+
+def best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--size", type=int, default=100_000, help="elements per array")
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    inputs = build_inputs(args.size)
+    print(f"{args.size} elements per input, best of {args.repeat}")
+    print(f"{'input':8} {'language':11} {'before ms':>10} {'after ms':>9} {'speed-up':>9}")
+    for label, test_input in inputs.items():
+        for language in LANGUAGES:
+            before = best_of(lambda: legacy_format(test_input, language), args.repeat)
+            after = best_of(lambda: emit_variables(parse_test_input(test_input), language), args.repeat)
+            print(f"{label:8} {language:11} {before * 1000:10.1f} {after * 1000:9.1f} {before / after:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
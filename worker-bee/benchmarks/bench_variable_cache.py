@@ -0,0 +1,77 @@
+"""
+bench_variable_cache.py
+
+Test-variable rendering for repeated submissions to one problem: a 100-test
+twoSum problem submitted in every language in turn. "uncached" formats every
+test input for every submission, as render_wrapper does on its own; "cached"
+takes the blocks from a harness.VariableCache, once cold and once after
+warm(). Prints the time per submission and the cache's stats.
+
+Usage:
+    python3 benchmarks/bench_variable_cache.py [--tests 100] [--size 1000] [--submissions 200]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import harness  # noqa: E402
+
+LANGUAGES = ("python", "javascript", "java", "go", "c")
+
+
+def build_tests(count, size, seed=3):
+    rng = random.Random(seed)
+    tests = []
+    for _ in range(count):
+        nums = [rng.randint(-10 ** 6, 10 ** 6) for _ in range(size)]
+        tests.append({"input": f"nums = [{','.join(map(str, nums))}], target = {nums[0] + nums[-1]}"})
+    return tests
+
+
+def run(submissions, tests, render):
+    t0 = time.perf_counter()
+    for k in range(submissions):
+        language = LANGUAGES[k % len(LANGUAGES)]
+        for tc in tests:
+            render(tc, language)
+    return (time.perf_counter() - t0) / submissions
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--tests", type=int, default=100)
+    ap.add_argument("--size", type=int, default=1000, help="array length per test case")
+    ap.add_argument("--submissions", type=int, default=200)
+    args = ap.parse_args()
+
+    tests = build_tests(args.tests, args.size)
+    uncached = run(args.submissions, tests,
+                   lambda tc, language: harness.parse_and_format_test_variables(tc["input"], language))
+
+    cold = harness.VariableCache()
+    cached = run(args.submissions, tests, lambda tc, language: cold.block("p1", tc, language))
+    assert all(cold.block("p1", tc, language) == harness.parse_and_format_test_variables(tc["input"], language)
+               for tc in tests for language in LANGUAGES)
+
+    warm = harness.VariableCache()
+    t0 = time.perf_counter()
+    rendered = warm.warm("p1", tests, LANGUAGES)
+    warm_up = time.perf_counter() - t0
+    warmed = run(args.submissions, tests, lambda tc, language: warm.block("p1", tc, language))
+
+    print(f"twoSum, {args.tests} tests of {args.size} ints, {args.submissions} submissions")
+    print(f"{'':9} {'ms/submission':>14}")
+    for label, secs in (("uncached", uncached), ("cached", cached), ("warmed", warmed)):
+        print(f"{label:9} {secs * 1000:14.3f}")
+    print(f"speed-up: {uncached / cached:.1f}x (cold), {uncached / warmed:.1f}x (warmed)")
+    print(f"warm-up: {rendered} blocks in {warm_up * 1000:.1f} ms")
+    print("cold cache:", cold.stats())
+    print("warm cache:", warm.stats())
+
+
+if __name__ == "__main__":
+    main()
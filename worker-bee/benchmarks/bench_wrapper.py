@@ -0,0 +1,112 @@
+"""
+bench_wrapper.py
+
+Wrapper throughput for one all-tests job: the Java twoSum template, a ~4 KB
+submission with prints in it, and 100 test cases. "before" is the old
+Ready2.generate_wrapper loop (clean_user_code and remove_user_prints per test
+case, then a `str.replace` per placeholder over the raw template), "after"
+prepares the user code once per job and renders each test case with a single
+join over the precompiled template. Both produce identical programs.
+
+Usage:
+    python3 benchmarks/bench_wrapper.py [--tests 100] [--size 20] [--repeat 50]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import harness  # noqa: E402
+from templates import problem_text  # noqa: E402
+
+JOB = {"function_name": "twoSum"}
+
+
+def build_submission(helpers):
+    out = ["import java.util.*;", "", "class Solution {"]
+    for i in range(helpers):
+        out += [
+            f"    private int helper{i}(int[] nums, int k) {{",
+            "        int total = 0;",
+            "        for (int n : nums) total += n % (k + 1);",
+            f"        System.out.println(\"helper{i} \" + total);",
+            "        return total;",
+            "    }",
+        ]
+    out += [
+        "    public int[] twoSum(int[] nums, int target) {",
+        "        Map<Integer, Integer> seen = new HashMap<>();",
+        "        for (int i = 0; i < nums.length; i++) {",
+        "            Integer j = seen.get(target - nums[i]);",
+        "            if (j != null) return new int[]{j, i};",
+        "            seen.put(nums[i], i);",
+        "        }",
+        "        return new int[0];",
+        "    }",
+        "}",
+    ]
+    return "\n".join(out)
+
+
+def build_tests(count, size, seed=7):
+    rng = random.Random(seed)
+    tests = []
+    for _ in range(count):
+        nums = [rng.randint(-1000, 1000) for _ in range(size)]
+        tests.append({"input": f"nums = [{','.join(map(str, nums))}], target = {nums[0] + nums[-1]}"})
+    return tests
+
+
+def legacy_job(code, tests, language):
+    """The old per-test loop from Ready2.generate_wrapper."""
+    template = problem_text(JOB["function_name"], language)
+    out = []
+    for tc in tests:
+        cleaned_code = harness.clean_user_code(code, language)
+        cleaned_code = harness.remove_user_prints(cleaned_code, language)
+        wrapper = template.replace("{{USER_CODE}}", cleaned_code)
+        test_variables = harness.parse_and_format_test_variables(tc.get("input", ""), language)
+        out.append(wrapper.replace("{{TEST_VARIABLES}}", test_variables))
+    return out
+
+
+def compiled_job(code, tests, language):
+    job_template = harness.prepare_wrapper(code, JOB, language, suppress_prints=True)
+    return [harness.render_wrapper(job_template, tc, language) for tc in tests]
+
+
+def time_job(fn, code, tests, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(code, tests, "java")
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--tests", type=int, default=100)
+    ap.add_argument("--size", type=int, default=20, help="array length per test case")
+    ap.add_argument("--helpers", type=int, default=20, help="extra methods in the submission")
+    ap.add_argument("--repeat", type=int, default=50)
+    args = ap.parse_args()
+
+    code = build_submission(args.helpers)
+    tests = build_tests(args.tests, args.size)
+    assert legacy_job(code, tests, "java") == compiled_job(code, tests, "java")
+
+    before = time_job(legacy_job, code, tests, args.repeat)
+    after = time_job(compiled_job, code, tests, args.repeat)
+    print(f"java twoSum, {args.tests} tests, {len(code)} byte submission, arrays of {args.size}")
+    print(f"{'':8} {'ms/job':>10} {'wrappers/s':>12}")
+    for label, secs in (("before", before), ("after", after)):
+        print(f"{label:8} {secs * 1000:10.3f} {args.tests / secs:12.0f}")
+    print(f"speed-up: {before / after:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
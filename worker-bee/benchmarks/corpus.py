@@ -0,0 +1,300 @@
+"""
+corpus.py
+
+Submission corpus for the SafetyChecker benchmarks: typical LeetCode-style
+solutions, very large files, adversarial inputs (regex backtracking shapes,
+deep nesting) and a few submissions each rule should reject, for all five
+languages.
+
+`build_corpus(scale)` returns a list of Case objects; `scale` multiplies the
+size of the generated large/adversarial inputs.
+"""
+from typing import List
+
+LANGUAGES = ("python", "javascript", "c", "go", "java")
+
+
+class Case:
+    __slots__ = ("name", "language", "category", "code")
+
+    def __init__(self, name: str, language: str, category: str, code: str):
+        self.name = name
+        self.language = language
+        self.category = category
+        self.code = code
+
+
+# ---------------- typical solutions ----------------
+TYPICAL = {
+    "python": {
+        "twoSum": """def twoSum(nums, target):
+    seen = {}
+    for i, n in enumerate(nums):
+        if target - n in seen:
+            return [seen[target - n], i]
+        seen[n] = i
+    return []
+""",
+        "lengthOfLongestSubstring": """def lengthOfLongestSubstring(s):
+    last = {}
+    best = start = 0
+    for i, ch in enumerate(s):
+        if ch in last and last[ch] >= start:
+            start = last[ch] + 1
+        last[ch] = i
+        best = max(best, i - start + 1)
+    return best
+""",
+        "sortArray": """import heapq
+
+def sortArray(nums):
+    heapq.heapify(nums)
+    return [heapq.heappop(nums) for _ in range(len(nums))]
+""",
+        "fib": """from functools import lru_cache
+
+@lru_cache(maxsize=None)
+def fib(n):
+    return n if n < 2 else fib(n - 1) + fib(n - 2)
+""",
+        # the loop ends through the IndexError, not a break
+        "findMax": """def findMax(nums):
+    stack = list(nums)
+    best = stack[-1]
+    try:
+        while True:
+            best = max(best, stack.pop())
+    except IndexError:
+        return best
+""",
+    },
+    "javascript": {
+        "twoSum": """function twoSum(nums, target) {
+    const seen = new Map();
+    for (let i = 0; i < nums.length; i++) {
+        const need = target - nums[i];
+        if (seen.has(need)) return [seen.get(need), i];
+        seen.set(nums[i], i);
+    }
+    return [];
+}
+""",
+        "reverseString": """// two pointers, in place
+function reverseString(s) {
+    let i = 0, j = s.length - 1;
+    while (i < j) { [s[i], s[j]] = [s[j], s[i]]; i++; j--; }
+    return s;
+}
+""",
+        "isPalindrome": """function isPalindrome(x) {
+    const s = String(x).replace(/[^0-9]/g, "");
+    return s === s.split("").reverse().join("");
+}
+""",
+    },
+    "c": {
+        "twoSum": """#include <stdlib.h>
+
+int* twoSum(int* nums, int numsSize, int target, int* returnSize) {
+    int* out = malloc(2 * sizeof(int));
+    for (int i = 0; i < numsSize; i++) {
+        for (int j = i + 1; j < numsSize; j++) {
+            if (nums[i] + nums[j] == target) {
+                out[0] = i; out[1] = j; *returnSize = 2;
+                return out;
+            }
+        }
+    }
+    *returnSize = 0;
+    return out;
+}
+""",
+        "findMax": """#include <limits.h>
+
+int findMax(int* nums, int numsSize) {
+    int best = INT_MIN;
+    for (int i = 0; i < numsSize; i++) if (nums[i] > best) best = nums[i];
+    return best;
+}
+""",
+        "reverseList": """struct ListNode* reverseList(struct ListNode* head) {
+    struct ListNode* prev = NULL;
+    while (head) { struct ListNode* next = head->next; head->next = prev; prev = head; head = next; }
+    return prev;
+}
+""",
+    },
+    "go": {
+        "twoSum": """func twoSum(nums []int, target int) []int {
+    seen := map[int]int{}
+    for i, n := range nums {
+        if j, ok := seen[target-n]; ok {
+            return []int{j, i}
+        }
+        seen[n] = i
+    }
+    return nil
+}
+""",
+        "sortArray": """func sortArray(nums []int) []int {
+    out := make([]int, len(nums))
+    copy(out, nums)
+    for i := 1; i < len(out); i++ {
+        for j := i; j > 0 && out[j-1] > out[j]; j-- {
+            out[j-1], out[j] = out[j], out[j-1]
+        }
+    }
+    return out
+}
+""",
+        "factorial": """func factorial(n int) int {
+    if n <= 1 {
+        return 1
+    }
+    return n * factorial(n-1)
+}
+""",
+    },
+    "java": {
+        "twoSum": """import java.util.*;
+
+class Solution {
+    public int[] twoSum(int[] nums, int target) {
+        Map<Integer, Integer> seen = new HashMap<>();
+        for (int i = 0; i < nums.length; i++) {
+            Integer j = seen.get(target - nums[i]);
+            if (j != null) return new int[]{j, i};
+            seen.put(nums[i], i);
+        }
+        return new int[0];
+    }
+}
+""",
+        "removeDuplicates": """class Solution {
+    public int removeDuplicates(int[] nums) {
+        int k = 0;
+        for (int n : nums) if (k == 0 || nums[k - 1] != n) nums[k++] = n;
+        return k;
+    }
+}
+""",
+        "findMax": """import java.util.*;
+
+class Solution {
+    public int findMax(int[] nums) {
+        Iterator<Integer> it = Arrays.stream(nums).iterator();
+        int best = Integer.MIN_VALUE;
+        try {
+            while (true) { best = Math.max(best, it.next()); }
+        } catch (NoSuchElementException e) {
+            return best;
+        }
+    }
+}
+""",
+    },
+}
+
+# ---------------- submissions each language should reject ----------------
+BLOCKED = {
+    "python": {
+        "import_os": "import os\nos.system('ls')\n",
+        "bytearray_huge": "buf = bytearray(10**10)\n",
+        "eval": "eval('1+1')\n",
+        "named_range": "N = 10**9\nseen = list(range(N))\n",
+        "endless_loop": "def f(n):\n    while True:\n        n += 1\n",
+    },
+    "javascript": {
+        "require_fs": "const fs = require('fs');\nfs.readFileSync('/etc/passwd');\n",
+        "process_exit": "function f() { process.exit(1); }\n",
+        "new_array_huge": "const a = new Array(1 << 30);\n",
+        "named_buffer": "const SIZE = 1e10;\nconst b = Buffer.alloc(SIZE);\n",
+        "endless_loop": "function f(n) {\n    for (;;) { n++; }\n}\n",
+        # `/"/` after `)` is a regex; read as a division, the quote would hide the call
+        "regex_after_paren": "function f() { if (true) /\"/; process.kill(process.pid) }\n",
+    },
+    "c": {
+        "system": "#include <stdlib.h>\nint main() { system(\"ls\"); }\n",
+        "header": "#include <unistd.h>\nint main() { return 0; }\n",
+        "static_array": "int buf[1 << 30];\n",
+        "define_array": "#include <stdio.h>\n#define N 1000000000\nint buf[N];\n",
+        "endless_loop": "int f(int n) {\n    while (1) { n++; }\n}\n",
+    },
+    "go": {
+        "import_os": "import \"os\"\nfunc f() { os.Exit(1) }\n",
+        "make_huge": "func f() []byte { return make([]byte, 1<<40) }\n",
+        "const_make": "const n = 1e9\nfunc f() []int { return make([]int, n) }\n",
+        "endless_loop": "func f(n int) int {\n    for {\n        n++\n    }\n}\n",
+    },
+    "java": {
+        "runtime": "class Solution { void f() throws Exception { Runtime.getRuntime().exec(\"ls\"); } }\n",
+        "java_io": "import java.io.File;\nclass Solution {}\n",
+        "bytes_huge": "class Solution { byte[] f() { return new byte[1 << 30]; } }\n",
+        "final_bytes": "class Solution { static final int N = 1 << 30; byte[] f() { return new byte[N]; } }\n",
+        "endless_loop": "class Solution { int f(int n) { while (true) { n++; } } }\n",
+        # javac decodes \u000a before parsing, ending the comment
+        "unicode_newline": "class Solution { void f() throws Exception {\n"
+                           "    // \\u000a Runtime.getRuntime().exec(\"ls\");\n} }\n",
+    },
+}
+
+
+def _large(language: str, lines: int) -> str:
+    """A clean file of about `lines` lines built from renamed copies of a typical solution."""
+    base = next(iter(TYPICAL[language].values()))
+    # imports/includes appear once, at the top, as in a real file
+    is_header = lambda line: line.startswith(("import", "from", "#include"))  # noqa: E731
+    header = "".join(line + "\n" for line in base.split("\n") if is_header(line))
+    body = "\n".join(line for line in base.split("\n") if not is_header(line))
+    per_copy = max(1, body.count("\n"))
+    copies = max(1, lines // per_copy)
+    out = [header]
+    for i in range(copies):
+        out.append(body.replace("twoSum", f"twoSum{i}"))
+    return "\n".join(out)
+
+
+def _adversarial(scale: int) -> List[Case]:
+    n = 400 * scale
+    return [
+        # C static-array pattern: `[^\]]+` and `\s*` share the run of spaces and
+        # there is no closing bracket, so every start position backtracks.
+        Case("c_static_array_backtrack", "c", "adversarial", "int a[" + " " * n + "x"),
+        Case("c_static_array_many_opens", "c", "adversarial", ("int a[ " * (n // 8)) + "1"),
+        # JS `new Array(` size extraction without a closing parenthesis.
+        Case("js_new_array_backtrack", "javascript", "adversarial", "let a = new Array(" + " " * n + "1"),
+        # Go make( with a long first argument and no comma.
+        Case("go_make_backtrack", "go", "adversarial", "func f() { x := make(" + "a" * n + " }"),
+        # JS import with a long run of spaces and no module string.
+        Case("js_import_backtrack", "javascript", "adversarial", "import" + " " * n + "x"),
+        # Many unclosed calloc( openers, each of which used to rescan the rest of the file.
+        Case("c_calloc_many_opens", "c", "adversarial", "int *p = " + "calloc(1, " * (n // 8) + "1"),
+        # Go import block that is never closed.
+        Case("go_import_block_unclosed", "go", "adversarial", "package main\n" + "import (\n" * (n // 8)),
+        # Java `new byte[` without a closing bracket.
+        Case("java_new_byte_backtrack", "java", "adversarial",
+             "class S { void f() { var b = new byte[" + " " * n + "1; } }"),
+        # Deep but legal Python: nested parentheses just under the pre-gate
+        # limit, deeply nested blocks and a very long operator chain.
+        Case("python_deep_parens", "python", "adversarial", "x = " + "(" * 90 + "1" + ")" * 90 + "\n"),
+        Case("python_deep_blocks", "python", "adversarial",
+             "".join("    " * i + "if x:\n" for i in range(90)) + "    " * 90 + "pass\n"),
+        Case("python_long_chain", "python", "adversarial", "x = " + " + ".join(["1"] * (5 * n)) + "\n"),
+        Case("python_many_alloc_sites", "python", "adversarial",
+             "".join(f"b{i} = bytearray(n + {i})\n" for i in range(n))),
+        # Rejections the pre-gate should answer immediately.
+        Case("python_oversized", "python", "adversarial", "x = 1\n" * (200_000 * scale)),
+        Case("c_nesting_bomb", "c", "adversarial", "int f() { return " + "(" * 2000 + "1" + ")" * 2000 + "; }"),
+    ]
+
+
+def build_corpus(scale: int = 1) -> List[Case]:
+    cases: List[Case] = []
+    for language in LANGUAGES:
+        for name, code in TYPICAL[language].items():
+            cases.append(Case(f"{language}_{name}", language, "typical", code))
+        for name, code in BLOCKED[language].items():
+            cases.append(Case(f"{language}_{name}", language, "blocked", code))
+        cases.append(Case(f"{language}_large", language, "large", _large(language, 3000 * scale)))
+    cases.extend(_adversarial(scale))
+    return cases
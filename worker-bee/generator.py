@@ -0,0 +1,252 @@
+"""
+generator.py
+
+Harness templates generated from problem signatures (see signatures.py).
+
+`generate_harness(signature, "java")` returns template text with the usual
+{{USER_CODE}} and {{TEST_VARIABLES}} placeholders: the helpers the harness
+uses (linked-list converters, output formatting; see preludes.py), the user
+code, then a main that declares the test variables, builds the arguments,
+calls the function and prints its result. Every language prints the same
+text for the same value, in the shapes the stored expectations use (go-exec
+compares exactly, as JSON, or with whitespace removed): `[1,2]`, `true`,
+`"abc"`, doubles with 5 decimals in the typed languages, and character
+arrays as `['o','l']`, which is not JSON.
+
+Generated texts are cached by signature hash, so every problem with the same
+signature shares one, and a signature change produces a new harness.
+
+Usage:
+    text = generate_harness(PROBLEM_SIGNATURES["twoSum"], "java", "twoSum")
+"""
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from preludes import compose
+from signatures import c_size_name, signature_hash
+
+LANGUAGES = ("python", "javascript", "java", "go", "c")
+
+
+# ---------------- python ----------------
+def _python(function_name: str, params, returns: str, output: Optional[str]) -> str:
+    args = [f"{name}_list" if kind == "ListNode" else name for name, kind in params]
+    lines = [f"{name}_list = array_to_list({name})" for name, kind in params if kind == "ListNode"]
+    call = f"{function_name}({', '.join(args)})"
+    if output is not None:
+        printed, kind = output, dict(params)[output]
+        lines.append(call)
+    else:
+        printed, kind = "result", returns
+        lines.append(f"result = {call}")
+    if kind == "char[]":
+        lines.append(f"print(format_chars({printed}))")
+    else:
+        value = f"list_to_array({printed})" if kind == "ListNode" else printed
+        lines.append(f"print(_json.dumps({value}, separators=(',', ':')))")
+    return ("import json as _json\n\n{{PRELUDE}}\n{{USER_CODE}}\n\n# Test execution\n{{TEST_VARIABLES}}\n"
+            + "\n".join(lines))
+
+
+# ---------------- javascript ----------------
+def _javascript(function_name: str, params, returns: str, output: Optional[str]) -> str:
+    args = [f"{name}_list" if kind == "ListNode" else name for name, kind in params]
+    lines = [f"const {name}_list = arrayToList({name});" for name, kind in params if kind == "ListNode"]
+    call = f"{function_name}({', '.join(args)})"
+    if output is not None:
+        printed, kind = output, dict(params)[output]
+        lines.append(call + ";")
+    else:
+        printed, kind = "result", returns
+        lines.append(f"const result = {call};")
+    if kind == "char[]":
+        lines.append(f"console.log(formatChars({printed}));")
+    else:
+        value = f"listToArray({printed})" if kind == "ListNode" else printed
+        lines.append(f"console.log(JSON.stringify({value}));")
+    return "{{PRELUDE}}\n{{USER_CODE}}\n\n// Test execution\n{{TEST_VARIABLES}}\n" + "\n".join(lines)
+
+
+# ---------------- java ----------------
+_JAVA_TYPES = {"int": "int", "long": "long", "double": "double", "bool": "boolean", "int[]": "int[]",
+               "string": "String", "char[]": "char[]", "ListNode": "ListNode"}
+_JAVA_FORMATS = {
+    "int": "{}",
+    "long": "{}",
+    "bool": "{}",
+    "double": 'String.format(Locale.ROOT, "%.5f", {})',
+    "int[]": "Arrays.toString({}).replace(\" \", \"\")",
+    "string": "DockexecFormat.quote({})",
+    "char[]": "DockexecFormat.chars({})",
+    "ListNode": "Arrays.toString(ArrayListConverter.listToArray({})).replace(\" \", \"\")",
+}
+
+
+def _java(function_name: str, params, returns: str, output: Optional[str]) -> str:
+    kinds = dict(params)
+    args = [f"{name}_list" if kind == "ListNode" else name for name, kind in params]
+    lines = [f"ListNode {name}_list = ArrayListConverter.arrayToList({name});"
+             for name, kind in params if kind == "ListNode"]
+    call = f"solution.{function_name}({', '.join(args)})"
+    if output is not None:
+        printed, kind = output, kinds[output]
+        lines.append(call + ";")
+    else:
+        printed, kind = "result", returns
+        lines.append(f"{_JAVA_TYPES[returns]} result = {call};")
+    lines.append(f"System.out.println({_JAVA_FORMATS[kind].format(printed)});")
+    body = "\n".join("        " + line for line in lines)
+    return ("import java.util.*;\n\n{{PRELUDE}}\n{{USER_CODE}}\n\n"
+            "class Main {\n    public static void main(String[] args) {\n"
+            "        Solution solution = new Solution();\n        {{TEST_VARIABLES}}\n"
+            f"{body}\n    }}\n}}")
+
+
+# ---------------- go ----------------
+# the value to print for each kind; None means fmt.Println as is
+_GO_FORMATS = {
+    "int": None,
+    "long": None,
+    "bool": None,
+    "double": None,
+    "int[]": "dockexecJSON(append([]int{{}}, {}...))",
+    "string": "dockexecJSON({})",
+    "char[]": "dockexecChars({})",
+    "ListNode": "dockexecJSON(listToArray({}))",
+}
+
+
+def _go(function_name: str, params, returns: str, output: Optional[str]) -> str:
+    kinds = dict(params)
+    args = [f"{name}List" if kind == "ListNode" else name for name, kind in params]
+    lines = [f"{name}List := arrayToList({name})" for name, kind in params if kind == "ListNode"]
+    call = f"{function_name}({', '.join(args)})"
+    if output is not None:
+        printed, kind = output, kinds[output]
+        lines.append(call)
+    else:
+        printed, kind = "result", returns
+        lines.append(f"result := {call}")
+    fmt = _GO_FORMATS[kind]
+    if kind == "double":
+        lines.append(f'fmt.Printf("%.5f\\n", {printed})')
+    elif fmt is None:
+        lines.append(f"fmt.Println({printed})")
+    else:
+        lines.append(f"fmt.Println({fmt.format(printed)})")
+    body = "\n".join("    " + line for line in lines)
+    # helpers follow the user code, which may open with imports of its own
+    return ('package main\nimport "fmt"\n{{PRELUDE_IMPORTS}}\n\n{{USER_CODE}}\n\n{{PRELUDE}}\n'
+            f"func main() {{\n    {{{{TEST_VARIABLES}}}}\n{body}\n}}")
+
+
+# ---------------- c ----------------
+_C_TYPES = {"int": "int", "long": "long long", "double": "double", "bool": "bool", "int[]": "int*",
+            "string": "char*", "char[]": "char*", "ListNode": "struct ListNode*"}
+_C_PRINTERS = {
+    "int": 'printf("%d\\n", {});',
+    "long": 'printf("%lld\\n", (long long){});',
+    "double": 'printf("%.5f\\n", {});',
+    "bool": 'printf("%s\\n", {} ? "true" : "false");',
+    "int[]": "dockexecPrintInts({}, {});",
+    "char[]": "dockexecPrintChars({}, {});",
+    "string": "dockexecPrintString({});",
+    "ListNode": "printList({});",
+}
+
+
+def _c(function_name: str, params, returns: str, output: Optional[str], result_size: Optional[str]) -> str:
+    kinds = dict(params)
+    args: List[str] = []
+    lines: List[str] = []
+    for name, kind in params:
+        if kind == "ListNode":
+            lines.append(f"struct ListNode* {name}_list = arrayToList({name}, {c_size_name(name)});")
+            args.append(f"{name}_list")
+        elif kind in ("int[]", "char[]"):
+            args += [name, c_size_name(name)]
+        else:
+            args.append(name)
+    if output is not None:
+        printed, kind, size = output, kinds[output], c_size_name(output)
+        lines.append(f"{function_name}({', '.join(args)});")
+    else:
+        printed, kind = "result", returns
+        if kind in ("int[]", "char[]") and result_size is None:
+            lines.append("int returnSize = 0;")
+            args.append("&returnSize")
+            size = "returnSize"
+        else:
+            size = c_size_name(result_size) if result_size else ""
+        lines.append(f"{_C_TYPES[returns]} result = {function_name}({', '.join(args)});")
+    lines.append(_C_PRINTERS[kind].format(printed, size))
+    body = "\n".join("    " + line for line in lines)
+    includes = "#include <stdio.h>\n#include <stdlib.h>\n#include <string.h>\n#include <stdbool.h>\n\n"
+    if "ListNode" in kinds.values() or returns == "ListNode":
+        # the user may declare the struct; helpers that use it follow the user code
+        return (includes + "{{USER_TYPES}}\nstruct ListNode;\n{{PRELUDE_DECLS}}\n{{USER_CODE}}\n\n{{PRELUDE}}\n"
+                f"int main() {{\n    {{{{TEST_VARIABLES}}}}\n{body}\n    return 0;\n}}")
+    return (includes + "{{PRELUDE}}\n{{USER_CODE}}\n\n"
+            f"int main() {{\n    {{{{TEST_VARIABLES}}}}\n{body}\n    return 0;\n}}")
+
+
+# ---------------- cache ----------------
+_lock = threading.Lock()
+_generated: Dict[Tuple[str, str], str] = {}
+# function_name -> (signature, its hash); hashing the canonical JSON costs
+# more than generating, so it is done once per signature object
+_hashes: Dict[str, Tuple[dict, str]] = {}
+_hits = 0
+_misses = 0
+
+
+def _harness_text(function_name: str, signature: dict, language: str) -> str:
+    """The harness with its {{PRELUDE}} slot still open."""
+    params = tuple(tuple(p) for p in signature["params"])
+    returns = signature["returns"]
+    output = signature.get("output")
+    if language == "python":
+        return _python(function_name, params, returns, output)
+    if language == "javascript":
+        return _javascript(function_name, params, returns, output)
+    if language == "java":
+        return _java(function_name, params, returns, output)
+    if language == "go":
+        return _go(function_name, params, returns, output)
+    return _c(function_name, params, returns, output, signature.get("c_result_size"))
+
+
+def _generate(function_name: str, signature: dict, language: str) -> str:
+    return compose(language, _harness_text(function_name, signature, language))
+
+
+def generate_harness(signature: dict, language: str, function_name: str) -> Optional[str]:
+    """The harness template for `function_name` with `signature`, or None for an
+    unsupported language. Cached by signature hash."""
+    global _hits, _misses
+    if language not in LANGUAGES:
+        return None
+    known = _hashes.get(function_name)
+    if known is None or known[0] is not signature:
+        known = _hashes[function_name] = (signature, signature_hash(function_name, signature))
+    key = (known[1], language)
+    with _lock:
+        text = _generated.get(key)
+        if text is not None:
+            _hits += 1
+            return text
+        _misses += 1
+    text = _generate(function_name, signature, language)
+    with _lock:
+        return _generated.setdefault(key, text)
+
+
+def generator_stats() -> dict:
+    with _lock:
+        total = _hits + _misses
+        return {
+            "size": len(_generated),
+            "hits": _hits,
+            "misses": _misses,
+            "hit_rate": round(_hits / total, 3) if total else 0.0,
+        }
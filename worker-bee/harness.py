@@ -0,0 +1,602 @@
+"""
+harness.py
+
+Turns a submission plus its test cases into the programs the executor runs.
+
+The user code is identical for every test case of a job, so it is prepared
+once: `prepare_wrapper` strips the C `struct ListNode` the template already
+defines, optionally silences its prints, and binds the result into the
+problem's precompiled template (see templates.py). `render_wrapper` then only
+formats the test variables and joins the pieces.
+
+Batch mode runs every test case of a job (or of a chunk) in one program, so
+Java, Go and C pay for one compile and one start-up instead of one per test
+case. Each case runs in its own function, an exception (a signal, for C)
+in one case is reported and the next case still runs, and each case's output
+follows a `<<<dockexec-case N>>>` line; `split_batch_output` undoes that.
+
+Usage:
+    job_template = prepare_wrapper(code, job, "java", suppress_prints=True)
+    for tc in test_cases:
+        program = render_wrapper(job_template, tc, "java") if job_template else code
+
+    batch = prepare_batch(code, job, "java")
+    for first, chunk in iter_chunks(test_cases, 50):
+        program = render_batch_wrapper(batch, chunk, "java", first)
+
+Every execution message also carries a `programHash` over the program source,
+the template version and the toolchain that will build it, so executors can
+key a compile cache on it; `programHashSeen` says whether this worker emitted
+the same hash recently ("first" or "repeat").
+
+    hashes = ProgramHashes()
+    hashes.stamp(message, program, "java")
+
+A problem's test cases do not change between submissions, so a VariableCache
+keeps each rendered test-variables block per (problemId, test input,
+language) and render_wrapper / render_batch_wrapper take the cached blocks.
+The function name types empty arrays from the problem's signature:
+
+    cache = VariableCache()
+    block = cache.block(problem_id, tc, "java", function_name=job_function_name(job))
+    program = render_wrapper(job_template, tc, "java", block)
+"""
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from preludes import user_types
+from templates import TEMPLATE_VERSION, BatchTemplate, Template, batch_template, problem_template
+from testinput import emit_variables, parse_test_input
+
+
+# ----------------------------------------------------------------------
+# USER CODE CLEAN-UP
+# ----------------------------------------------------------------------
+
+
+def clean_user_code(code, language):
+    """Remove struct definitions from user code"""
+    if language == "c":
+        # Remove struct ListNode definition
+        lines = code.split('\n')
+        cleaned_lines = []
+        in_struct = False
+
+        for line in lines:
+            stripped = line.strip()
+            if stripped.startswith('struct ListNode {'):
+                in_struct = True
+                continue
+            elif in_struct and stripped == '};':
+                in_struct = False
+                continue
+            elif not in_struct:
+                cleaned_lines.append(line)
+
+        return '\n'.join(cleaned_lines)
+    return code
+
+
+# ----------------------------------------------------------------------
+# PRINT-SUPPRESSION
+# ----------------------------------------------------------------------
+
+
+# Print suppression is one regex pass per language. Each match is a run of code
+# that cannot hold a print call (anything without the interesting characters,
+# comments, string literals) followed by a print callee or the end of the code.
+# Only the callee is rewritten and the arguments stay where they were, so
+# calls spanning several lines and prints in nested blocks need no special
+# handling, no block is left empty, and a variable only the print used is
+# still used (Go rejects unused ones). An unclosed comment or multi-line
+# literal runs to the end of the code, so each is scanned once (a lazy `.*?`
+# that fails would rescan the rest of the code for every opener).
+_C_FAMILY_SKIP = r"""//[^\n]*+|/\*(?:[^*]|\*(?!/))*+(?:\*/|\Z)|"(?:[^"\\\n]|\\.)*+"|'(?:[^'\\\n]|\\.)*+'"""
+# language: (characters that can start a skipped token or a call, skipped
+# tokens, the print callee, what the callee becomes, a substring every print
+# call contains)
+_PRINT_RULES = {
+    "python": (
+        "#'\"p",
+        r"""#[^\n]*+|'{3}(?:[^'\\]|\\.|'(?!''))*+(?:'{3}|\Z)|"{3}(?:[^"\\]|\\.|"(?!""))*+(?:"{3}|\Z)"""
+        r"""|"(?:[^"\\\n]|\\.)*+"|'(?:[^'\\\n]|\\.)*+'""",
+        r"(?<![\w.])print(?=\s*\()",
+        "(lambda *a, **k: None)",
+        "print",
+    ),
+    "javascript": (
+        "/'\"`c",
+        r"`(?:[^`\\]|\\.)*+(?:`|\Z)|" + _C_FAMILY_SKIP,
+        r"(?<![\w.$])console\s*\.\s*(?:log|info|debug)(?=\s*\()",
+        # `void` cannot continue the previous line's expression, so code without
+        # semicolons still gets its statement break before it
+        "void (() => {})",
+        "console",
+    ),
+    "java": (
+        "/'\"S",
+        r'"""(?:[^"\\]|\\.|"(?!""))*+(?:"""|\Z)|' + _C_FAMILY_SKIP,
+        r"(?<![\w.])System\s*\.\s*out(?=\s*\.\s*(?:print|println|printf|format|write|append)\s*\()",
+        "new java.io.PrintStream(java.io.OutputStream.nullOutputStream())",
+        "System",
+    ),
+    "go": (
+        "/'\"`f",
+        r"`[^`]*+(?:`|\Z)|" + _C_FAMILY_SKIP,
+        r"(?<![\w.])fmt\s*\.\s*Print(?=(?:ln|f)?\s*\()",
+        "fmt.Sprint",
+        "Print",
+    ),
+    "c": (
+        "/'\"p",
+        _C_FAMILY_SKIP,
+        r"(?<![\w.>])printf\s*\(",
+        "snprintf(NULL, 0, ",
+        "printf",
+    ),
+}
+
+
+def _print_pattern(firsts, skip, call):
+    firsts = re.escape(firsts)
+    body = rf"(?:[^{firsts}]++|{skip}|(?!{call})[{firsts}])*+"
+    return re.compile(rf"({body})(?:(?P<call>{call})|\Z)", re.DOTALL)
+
+
+_PRINT_PATTERNS = {
+    language: (_print_pattern(firsts, skip, call), silent, marker)
+    for language, (firsts, skip, call, silent, marker) in _PRINT_RULES.items()
+}
+
+
+def remove_user_prints(code, language):
+    """Silence user-level print calls for the given language, in one pass."""
+    if language not in _PRINT_PATTERNS or not code:
+        return code
+    pattern, silent, marker = _PRINT_PATTERNS[language]
+    if marker not in code:
+        return code
+
+    def rewrite(m):
+        return m.group(1) + silent if m.group("call") is not None else m.group(1)
+
+    return pattern.sub(rewrite, code)
+
+
+# ----------------------------------------------------------------------
+# PARSE AND FORMAT TEST VARIABLES (WORKS FOR ALL 14 PROBLEMS)
+# ----------------------------------------------------------------------
+
+
+def parse_and_format_test_variables(test_input, language, function_name=None):
+    """Parse test input and format for specific language - works for all 14 problems"""
+    if not test_input:
+        return ""
+
+    try:
+        return emit_variables(parse_test_input(test_input), language, function_name)
+
+    except Exception as e:
+        print(f"Error parsing test variables: {e}")
+        return f"// Error parsing test input: {test_input}"
+
+# ----------------------------------------------------------------------
+# RENDERED TEST VARIABLES, CACHED PER PROBLEM
+# ----------------------------------------------------------------------
+
+
+def _input_digest(test_input: str) -> bytes:
+    return hashlib.blake2b(test_input.encode(), digest_size=16).digest()
+
+
+def _render_test_variables(slot, test_input, language, function_name=None):
+    return parse_and_format_test_variables(test_input, language, function_name)
+
+
+class VariableCache:
+    """LRU of rendered per-case blocks ({{TEST_VARIABLES}} by default).
+
+    A problem's test cases are the same for every submission, so the block
+    for one (problemId, function, test input, language, slot, template
+    version) is rendered once. The test input is keyed by its digest, so an edited test
+    case misses instead of returning a stale block. Bounded by entry count
+    and by total characters; `evict(problem_id)` drops one problem's blocks.
+    """
+
+    def __init__(self, render: Callable[[str, str, str, Optional[str]], str] = _render_test_variables,
+                 capacity: int = 20000, max_chars: int = 64 * 1024 * 1024):
+        self.render = render
+        self.capacity = capacity
+        self.max_chars = max_chars
+        self._blocks: "OrderedDict[tuple, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.chars = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def block(self, problem_id, test_case, language, slot="TEST_VARIABLES", function_name=None) -> str:
+        """The rendered block for one test case; not cached without a problem id."""
+        test_input = (test_case or {}).get("input", "")
+        if not problem_id:
+            return self.render(slot, test_input, language, function_name)
+        key = (problem_id, function_name, _input_digest(test_input), language, slot, TEMPLATE_VERSION)
+        with self._lock:
+            block = self._blocks.get(key)
+            if block is not None:
+                self._blocks.move_to_end(key)
+                self.hits += 1
+                return block
+            self.misses += 1
+        block = self.render(slot, test_input, language, function_name)
+        self._store(key, block)
+        return block
+
+    def blocks(self, problem_id, test_cases, language, slot="TEST_VARIABLES", function_name=None) -> List[str]:
+        return [self.block(problem_id, tc, language, slot, function_name) for tc in test_cases]
+
+    def warm(self, problem_id, test_cases, languages, slot="TEST_VARIABLES", function_name=None) -> int:
+        """Render a problem's test cases ahead of its first submission; returns
+        how many blocks were rendered. Warm-up does not count as hits or misses."""
+        rendered = 0
+        for language in languages:
+            for tc in test_cases:
+                test_input = (tc or {}).get("input", "")
+                key = (problem_id, function_name, _input_digest(test_input), language, slot, TEMPLATE_VERSION)
+                with self._lock:
+                    if key in self._blocks:
+                        continue
+                self._store(key, self.render(slot, test_input, language, function_name))
+                rendered += 1
+        return rendered
+
+    def evict(self, problem_id=None) -> int:
+        """Drop one problem's blocks (its test cases changed), or all of them."""
+        with self._lock:
+            if problem_id is None:
+                keys = list(self._blocks)
+            else:
+                keys = [key for key in self._blocks if key[0] == problem_id]
+            for key in keys:
+                self.chars -= len(self._blocks.pop(key))
+            self.evictions += len(keys)
+            return len(keys)
+
+    def _store(self, key, block: str):
+        if len(block) > self.max_chars:
+            return
+        with self._lock:
+            old = self._blocks.pop(key, None)
+            if old is not None:
+                self.chars -= len(old)
+            self._blocks[key] = block
+            self.chars += len(block)
+            while len(self._blocks) > self.capacity or self.chars > self.max_chars:
+                _, dropped = self._blocks.popitem(last=False)
+                self.chars -= len(dropped)
+                self.evictions += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._blocks),
+                "capacity": self.capacity,
+                "chars": self.chars,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            }
+
+
+# ----------------------------------------------------------------------
+# WRAPPER GENERATION USING PRECOMPILED TEMPLATES
+# ----------------------------------------------------------------------
+
+
+def job_function_name(job_data):
+    """The function under test, from the job or from its problem."""
+    function_name = job_data.get("function_name", "")
+    if not function_name:
+        problem = job_data.get("problem") or {}
+        function_name = problem.get("function_name", "")
+    return function_name
+
+
+def _prepare(user_code, job_data, language, suppress_prints, lookup):
+    function_name = job_function_name(job_data)
+    if not function_name:
+        print("No function_name found in job data")
+        return None
+
+    template = lookup(function_name, language)
+    if template is None:
+        print(f"No template found for {function_name} in {language}")
+        return None
+
+    cleaned_code = clean_user_code(user_code, language)
+    if suppress_prints:
+        cleaned_code = remove_user_prints(cleaned_code, language)
+    return template.bind(USER_CODE=cleaned_code, USER_TYPES=user_types(language, cleaned_code))
+
+
+def prepare_wrapper(user_code, job_data, language, suppress_prints=False) -> Optional[Template]:
+    """Clean the user code once and bind it into the problem template.
+
+    Returns None when the job names no function or the function has no
+    template for `language`; callers then run the user code as is.
+    """
+    return _prepare(user_code, job_data, language, suppress_prints, problem_template)
+
+
+def render_wrapper(job_template: Template, test_case, language, variables: Optional[str] = None,
+                   function_name=None) -> str:
+    """One test case's program: format its variables (unless already rendered,
+    e.g. by a VariableCache) and join."""
+    if variables is None:
+        test_input = test_case.get("input", "") if test_case else ""
+        variables = parse_and_format_test_variables(test_input, language, function_name)
+    return job_template.render(TEST_VARIABLES=variables)
+
+
+def generate_wrapper(user_code, job_data, test_case, language, suppress_prints=False):
+    """Generate a single wrapper from the problem's harness (see templates.problem_text)"""
+    job_template = prepare_wrapper(user_code, job_data, language, suppress_prints)
+    if job_template is None:
+        return user_code
+    return render_wrapper(job_template, test_case, language, function_name=job_function_name(job_data))
+
+
+# ----------------------------------------------------------------------
+# BATCH HARNESS: ONE PROGRAM FOR MANY TEST CASES
+# ----------------------------------------------------------------------
+BATCH_CASE_MARKER = "<<<dockexec-case {}>>>"
+BATCH_ERROR_MARKER = "<<<dockexec-error {}>>>"
+_BATCH_LINE_RE = re.compile(r"^<<<dockexec-(case|error) (\d+)>>> ?(.*)$", re.MULTILINE)
+
+
+def _indent(code: str, prefix: str) -> str:
+    return "\n".join(prefix + line if line.strip() else line for line in code.split("\n"))
+
+
+def _batch_python(head: str, cases: List[Tuple[int, str]], tail: str) -> str:
+    out = [head]
+    for n, body in cases:
+        code = _indent(body, "    ") if body.strip() else "    pass"
+        out.append(f"def _dockexec_case_{n}():\n{code}\n\n")
+    for n, _ in cases:
+        out.append(
+            f'print("{BATCH_CASE_MARKER.format(n)}")\n'
+            f"try:\n"
+            f"    _dockexec_case_{n}()\n"
+            f"except Exception as _dockexec_error:\n"
+            f'    print("{BATCH_ERROR_MARKER.format(n)}", type(_dockexec_error).__name__ + ":", _dockexec_error)\n'
+        )
+    out.append(tail)
+    return "".join(out)
+
+
+def _batch_javascript(head: str, cases: List[Tuple[int, str]], tail: str) -> str:
+    out = [head]
+    for n, body in cases:
+        out.append(f"function __dockexecCase{n}() {{\n{body}\n}}\n\n")
+    for n, _ in cases:
+        out.append(
+            f'console.log("{BATCH_CASE_MARKER.format(n)}");\n'
+            f"try {{ __dockexecCase{n}(); }} catch (e) {{ "
+            f'console.log("{BATCH_ERROR_MARKER.format(n)} " + String(e)); }}\n'
+        )
+    out.append(tail)
+    return "".join(out)
+
+
+def _batch_java(head: str, cases: List[Tuple[int, str]], tail: str) -> str:
+    # one method per case keeps each under the JVM's 64 KB method size limit
+    out = [head]
+    for n, body in cases:
+        out.append(f"    static void dockexecCase{n}() throws Exception {{{body}}}\n\n")
+    out.append("    public static void main(String[] args) {\n")
+    for n, _ in cases:
+        out.append(
+            f'        System.out.println("{BATCH_CASE_MARKER.format(n)}");\n'
+            f"        try {{ dockexecCase{n}(); }} catch (Throwable e) {{ "
+            f'System.out.println("{BATCH_ERROR_MARKER.format(n)} " + e); }}\n'
+        )
+    out.append("    }")
+    out.append(tail)
+    return "".join(out)
+
+
+def _batch_go(head: str, cases: List[Tuple[int, str]], tail: str) -> str:
+    out = [head]
+    for n, body in cases:
+        out.append(f"func dockexecCase{n}() {{{body}}}\n\n")
+    out.append(
+        "func dockexecRun(n int, run func()) {\n"
+        "    defer func() {\n"
+        "        if r := recover(); r != nil {\n"
+        f'            fmt.Printf("{BATCH_ERROR_MARKER.format("%d")} %v\\n", n, r)\n'
+        "        }\n"
+        "    }()\n"
+        f'    fmt.Printf("{BATCH_CASE_MARKER.format("%d")}\\n", n)\n'
+        "    run()\n"
+        "}\n\n"
+        "func main() {\n"
+    )
+    for n, _ in cases:
+        out.append(f"    dockexecRun({n}, dockexecCase{n})\n")
+    out.append("}")
+    out.append(tail)
+    return "".join(out)
+
+
+def _batch_c(head: str, cases: List[Tuple[int, str]], tail: str) -> str:
+    # C has no exceptions: every case runs in a forked child, so a crash or an
+    # exit() in one case is reported as that case's error and the rest still run
+    out = ["#include <sys/wait.h>\n#include <unistd.h>\n", head]
+    for n, body in cases:
+        out.append(f"static int dockexec_case_{n}(void) {{{body}}}\n\n")
+    out.append(
+        "static void dockexec_run(int n, int (*run)(void)) {\n"
+        f'    printf("{BATCH_CASE_MARKER.format("%d")}\\n", n);\n'
+        "    fflush(stdout);\n"
+        "    pid_t pid = fork();\n"
+        "    if (pid < 0) {\n"
+        "        run();\n"
+        "        return;\n"
+        "    }\n"
+        "    if (pid == 0) {\n"
+        "        run();\n"
+        "        fflush(stdout);\n"
+        "        _exit(0);\n"
+        "    }\n"
+        "    int status = 0;\n"
+        "    waitpid(pid, &status, 0);\n"
+        "    if (WIFSIGNALED(status)) {\n"
+        f'        printf("{BATCH_ERROR_MARKER.format("%d")} signal %d\\n", n, WTERMSIG(status));\n'
+        "    } else if (WIFEXITED(status) && WEXITSTATUS(status) != 0) {\n"
+        f'        printf("{BATCH_ERROR_MARKER.format("%d")} exit status %d\\n", n, WEXITSTATUS(status));\n'
+        "    }\n"
+        "}\n\n"
+        "int main() {\n"
+    )
+    for n, _ in cases:
+        out.append(f"    dockexec_run({n}, dockexec_case_{n});\n")
+    out.append("    return 0;\n}")
+    out.append(tail)
+    return "".join(out)
+
+
+_BATCH_EMITTERS: Dict[str, Callable[[str, List[Tuple[int, str]], str], str]] = {
+    "python": _batch_python,
+    "javascript": _batch_javascript,
+    "java": _batch_java,
+    "go": _batch_go,
+    "c": _batch_c,
+}
+
+
+def render_batch(batch: BatchTemplate, case_values: List[str], language, first_number=1) -> str:
+    """One program running every case; `case_values` fills the case slot per case."""
+    emit = _BATCH_EMITTERS[language]
+    slot = batch.case_slot
+    cases = [(first_number + i, batch.case.render(**{slot: value})) for i, value in enumerate(case_values)]
+    return emit(batch.head.render(), cases, batch.tail.render())
+
+
+def prepare_batch(user_code, job_data, language) -> Optional[BatchTemplate]:
+    """Like prepare_wrapper, for batch mode (prints are always suppressed)."""
+    if language not in _BATCH_EMITTERS:
+        return None
+    return _prepare(user_code, job_data, language, True, batch_template)
+
+
+def render_batch_wrapper(batch: BatchTemplate, test_cases, language, first_number=1,
+                         variables: Optional[List[str]] = None, function_name=None) -> str:
+    """The batch program for `test_cases`, numbered from `first_number`;
+    `variables` are their already rendered blocks, if any."""
+    if variables is None:
+        variables = [parse_and_format_test_variables((tc or {}).get("input", ""), language, function_name)
+                     for tc in test_cases]
+    return render_batch(batch, variables, language, first_number)
+
+
+def iter_chunks(test_cases, chunk_size) -> Iterator[Tuple[int, list]]:
+    """(first test case number, test cases) per chunk of at most `chunk_size`."""
+    for start in range(0, len(test_cases), chunk_size):
+        yield start + 1, test_cases[start:start + chunk_size]
+
+
+def split_batch_output(stdout: str) -> Dict[int, Dict[str, Optional[str]]]:
+    """Per case number: its `output` and the `error` it raised, if any."""
+    results: Dict[int, Dict[str, Optional[str]]] = {}
+    current = None
+    pos = 0
+    for m in _BATCH_LINE_RE.finditer(stdout):
+        if current is not None:
+            current["output"] += stdout[pos:m.start()]
+        n = int(m.group(2))
+        if m.group(1) == "case":
+            current = results.setdefault(n, {"output": "", "error": None})
+        elif n in results:
+            results[n]["error"] = m.group(3)
+        pos = m.end() + 1
+    if current is not None:
+        current["output"] += stdout[pos:]
+    for result in results.values():
+        result["output"] = result["output"].rstrip("\n")
+    return results
+
+
+# ----------------------------------------------------------------------
+# PROGRAM HASHES FOR EXECUTOR COMPILE CACHES
+# ----------------------------------------------------------------------
+# What go-exec builds and runs each language with. Bump an entry when the
+# executors change compiler/runtime, so cached artifacts are not reused.
+TOOLCHAIN_IDS = {
+    "python": "python3",
+    "javascript": "node",
+    "c": "gcc",
+    "go": "go-build",
+    "java": "javac+java",
+}
+# Template version for programs that are the user code as submitted.
+RAW_TEMPLATE_VERSION = "raw"
+
+
+def program_hash(source: str, language, template_version=TEMPLATE_VERSION) -> str:
+    """sha256 over the template version, the toolchain id and the program source."""
+    toolchain = TOOLCHAIN_IDS.get(language, language or "")
+    digest = hashlib.sha256(f"{template_version}\0{toolchain}\0".encode())
+    digest.update((source or "").encode())
+    return digest.hexdigest()
+
+
+class ProgramHashes:
+    """LRU of the program hashes this worker emitted recently."""
+
+    def __init__(self, capacity: int = 4096):
+        self.capacity = capacity
+        self._seen: "OrderedDict[str, None]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._last = None  # (source, language, template_version, hash): stdin jobs repeat one program
+        self.first = 0
+        self.repeat = 0
+
+    def stamp(self, message: dict, source: str, language, template_version=TEMPLATE_VERSION) -> dict:
+        """Add `programHash` and `programHashSeen` to an execution message."""
+        last = self._last
+        if last is not None and last[0] is source and last[1] == language and last[2] == template_version:
+            digest = last[3]
+        else:
+            digest = program_hash(source, language, template_version)
+            self._last = (source, language, template_version, digest)
+        with self._lock:
+            if digest in self._seen:
+                self._seen.move_to_end(digest)
+                self.repeat += 1
+                seen = "repeat"
+            else:
+                self._seen[digest] = None
+                if len(self._seen) > self.capacity:
+                    self._seen.popitem(last=False)
+                self.first += 1
+                seen = "first"
+        message["programHash"] = digest
+        message["programHashSeen"] = seen
+        return message
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.first + self.repeat
+            return {
+                "size": len(self._seen),
+                "capacity": self.capacity,
+                "first": self.first,
+                "repeat": self.repeat,
+                "repeat_rate": round(self.repeat / total, 3) if total else 0.0,
+            }
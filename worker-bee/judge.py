@@ -7,467 +7,2037 @@ Key behaviors:
 - Allow only a small whitelist of imports per language.
 - Reject submissions that import more than a small configured number of modules.
 - Explicitly disallow filesystem / OS / process modules/APIs in all languages.
-- Detect and block large memory allocation attempts (configurable threshold).
+- Detect and block large memory allocation attempts (configurable threshold), including
+  sizes given through simple named constants (`N = 10**9`, `#define N`, `const n = 1e9`, ...).
+- Reject oversized or deeply nested submissions in a cheap pre-gate before any parsing.
+- C/Java/Go/JS rules ignore comments, and identifier/allocation rules ignore string
+  literals (see lexer.py), so commented-out or quoted code is not rejected.
+- Flag loops that provably never exit (`while True:` with no break/return/raise and
+  nothing that can throw, `for(;;)` / `while(1)` likewise, Go `for {}`) with a
+  "<language>.infinite_loop" verdict; Verdict.will_time_out tells it apart from a
+  safety rejection.
+- Verdicts are cached per (language, code hash, policy version) in a bounded LRU with TTL.
+- Batches (and large single submissions) can be fanned out over a process pool.
+- Whitelists, limits and forbidden patterns form a SafetyPolicy, compiled once and
+  optionally loaded from a JSON file (see policy.json) that is re-read when it changes.
+  Every verdict records the version of the policy that produced it.
 - Configuration defaults are conservative (small) but can be adjusted on instantiation.
 
+- check() returns an immutable Verdict and keeps no per-call state, so one
+  checker is safe to share between threads.
+- Every uncached check runs under a wall-clock budget (time_budget); a check that
+  runs over is cut off with a "check.timeout" verdict, and latency_stats() shows
+  how close normal traffic gets to the budget. Checks on a pool process or on the
+  main thread are interrupted by a real-time alarm, even inside one long regex
+  call; checks on other threads can only stop between rule stages.
+- rule_stats() counts calls, hits and nanoseconds per language and rule stage
+  (per-thread shards, no locks); rule_stats_prometheus() renders them for scraping.
+
 Usage:
     checker = SafetyChecker(threshold_bytes=128*1024**2, max_imports=3)
-    ok = checker.check(code_string, "python")
-    if not ok:
-        print(checker.reason())
+    checker = SafetyChecker(policy_path="policy.json")  # hot-reloaded on change
+    verdict = checker.check(code_string, "python")
+    if not verdict:
+        print(verdict.rule, verdict.reason)
+    print(checker.cache_stats())
+    print(checker.rule_stats_prometheus())
+
+    verdicts = checker.check_many([(code_a, "python"), (code_b, "c")])
+    blocked = [v.reason for v in verdicts if not v]
 """
 import ast
+import bisect
+import hashlib
+import heapq
+import json
+import multiprocessing
+import os
+import pickle
 import re
-from typing import List, Set, Optional
+import signal
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache, partial
+from typing import Dict, Iterable, List, Set, Optional, Sequence, Tuple
+
+from lexer import lex
+
+
+# ----- precompiled extraction regexes (shared by every checker instance) -----
+# These run on untrusted input, so each is written to match in roughly linear
+# time: possessive quantifiers (`*+`, `++`) where neighbouring atoms could
+# share characters, and size captures that stop at the next bracket so that
+# many unclosed `malloc(` / `new Array(` openers cannot each rescan the file.
+_INT_SUFFIX_RE = re.compile(r'(?i)(?<=\d)[uUlL]+')
+
+_JS_IMPORT_RE = re.compile(r'^[ \t]*+import\s++(?:.+(?<=\s)from\s++)?[\'"]([^\'"]+)[\'"]', re.M)
+_JS_REQUIRE_RE = re.compile(r'require\s*\(\s*[\'"]([^\'"]+)[\'"]\s*\)')
+_JS_BUFFER_ALLOC_RE = re.compile(r'Buffer\.alloc\s*+\(\s*+([^()]++)\)')
+_JS_NEW_ARRAY_RE = re.compile(r'new\s++Array\s*+\(\s*+([^()]++)\)')
+
+_C_INCLUDE_RE = re.compile(r'^[ \t]*#\s*include\s*[<"]([^>"]+)[>"]', re.M)
+# sizes are often written with `sizeof(T)`, so size groups may hold one level of parens
+_C_ALLOC_RES = (
+    re.compile(r'\bmalloc\s*+\(\s*+((?:[^()]|\([^()]*+\))++)\)'),
+    re.compile(r'\bcalloc\s*+\(\s*+([^(),]++),\s*+((?:[^()]|\([^()]*+\))++)\)'),
+    re.compile(r'\brealloc\s*+\((?:[^,()]|\((?:[^,()]|\([^,()]*+\))*+\))++,\s*+((?:[^()]|\([^()]*+\))++)\)'),
+)
+_C_STATIC_ARRAY_RE = re.compile(r'\b[a-zA-Z_]\w*+\s++[a-zA-Z_]\w*+\s*+\[\s*+([^\[\];]++)\]\s*+;')
+
+_GO_SINGLE_IMPORT_RE = re.compile(r'(?m)^[ \t]*+import\s+"([^"]+)"')
+_GO_BLOCK_IMPORT_RE = re.compile(r'import\s*+\(([^()]*+)\)')
+_GO_QUOTED_RE = re.compile(r'"([^"]+)"')
+_GO_ALIASED_IMPORT_RE = re.compile(r'(?m)^[ \t]*+import\s+[\w_]+\s+"([^"]+)"')
+_GO_MAKE_SLICE_RE = re.compile(r'make\s*\(\s*\[\]\s*\w+\s*,\s*([^\),]+)')
+_GO_MAKE_RE = re.compile(r'make\s*+\((?:[^,()]|\([^()]*+\))++,\s*+([^\),]+)')
+
+_JAVA_IMPORT_RE = re.compile(r'^[ \t]*+import\s+([\w\.]+)(?:\.\*)?;', re.M)
+_JAVA_NEW_BYTES_RE = re.compile(r'new\s++byte\s*+\[\s*+([^\[\]]++)\]')
+_JAVA_BYTEBUFFER_RE = re.compile(r'ByteBuffer\.allocate\s*+\(\s*+([^()]++)\)')
+
+# ----- forbidden-pattern lists (order matters: first listed match is reported) -----
+_JS_FORBIDDEN_PATTERNS = (
+    r'\bprocess\b',
+    r'\bfs\b',
+    r'\bchild_process\b',
+    r'\bexecSync\b',
+    r'Buffer\.alloc\s*\(',
+    r'new\s+Array\s*\(',
+    r'Uint8Array\s*\(',
+    r'Int8Array\s*\(',
+)
+# patterns whose hit first gets a size check for a more specific reason
+_JS_SIZED_ALLOC_PATTERNS = frozenset({r'new\s+Array\s*\(', r'Uint8Array\s*\('})
+
+_C_BLOCKED_FUNCS = (
+    r"\bsystem\s*\(",
+    r"\bfork\s*\(",
+    r"\bexec(?:ve|vp|v)?\b",
+    r"\bpopen\s*\(",
+    r"\bunlink\s*\(",
+    r"\bchmod\s*\(",
+    r"\bfopen\s*\(",
+    r"\bopen\s*\(",
+)
+
+_GO_SUSPICIOUS_PATTERNS = (
+    r'\bos\b',
+    r'\bexec\.Command\b',
+    r'\bsyscall\b',
+    r'\bnet\b',
+    r'\bruntime\b',
+    r'\bplugin\b',
+    r'\bunsafe\b',
+)
+
+_JAVA_FORBIDDEN_PATTERNS = (
+    r"Runtime\.getRuntime",
+    r"ProcessBuilder",
+    r"System\.exit\s*\(",
+    r"java\.io",
+    r"java\.net",
+    r"java\.nio",
+    r"Files\.",
+    r"Paths\.",
+    r"FileInputStream",
+    r"FileOutputStream",
+)
+
+
+# hex digits after \x, \u, \U
+_ESCAPE_PAYLOAD = {"x": 2, "u": 4, "U": 8}
+
+
+def _required_literal(pattern: str) -> str:
+    """
+    Return the longest literal substring every match of `pattern` must contain,
+    or "" when none can be derived (alternation at top level, classes only, ...).
+    Only understands the simple patterns used in this module; anything unusual
+    just ends the current literal run, which is always safe.
+    """
+    if re.search(r'\(\?[^:]', pattern):  # inline flags such as (?i), lookarounds
+        return ""
+    runs: List[str] = []
+    current = ""
+    i, n = 0, len(pattern)
+    while i < n:
+        ch = pattern[i]
+        if ch == "\\" and i + 1 < n:
+            nxt = pattern[i + 1]
+            if nxt.isalnum():
+                # \b, \s, \w, \d ... are not literals, and \x65, \u0065, \N{...} or
+                # \101 stand for one character: skip their payload, never read it as text
+                runs.append(current)
+                current = ""
+                i += 2
+                if nxt in _ESCAPE_PAYLOAD:
+                    size = _ESCAPE_PAYLOAD[nxt]
+                    if not re.fullmatch(r'[0-9a-fA-F]{%d}' % size, pattern[i:i + size]):
+                        return ""
+                    i += size
+                elif nxt == "N":
+                    close = pattern.find("}", i)
+                    if not pattern.startswith("{", i) or close < 0:
+                        return ""
+                    i = close + 1
+                elif nxt.isdigit():
+                    while i < n and pattern[i].isdigit():
+                        i += 1
+                elif not nxt.isascii():
+                    return ""  # not an escape this parser knows: leave the pattern ungated
+                continue
+            current += nxt
+            i += 2
+        elif ch == "|":
+            return ""
+        elif ch in "([{":
+            # a {m,n} quantifier may make the preceding atom optional
+            runs.append(current[:-1] if ch == "{" else current)
+            current = ""
+            depth, close = 0, {"(": ")", "[": "]", "{": "}"}[ch]
+            while i < n:
+                if pattern[i] == "\\":
+                    i += 2
+                    continue
+                if pattern[i] == ch:
+                    depth += 1
+                elif pattern[i] == close:
+                    depth -= 1
+                    if depth == 0:
+                        break
+                i += 1
+            i += 1
+        elif ch in "?*+":
+            # the quantified atom is optional/repeated: drop it from the run
+            runs.append(current[:-1] if ch in "?*" else current)
+            current = ""
+            i += 1
+        elif ch in ".^$":
+            runs.append(current)
+            current = ""
+            i += 1
+        else:
+            current += ch
+            i += 1
+    runs.append(current)
+    return max(runs, key=len)
+
+
+class _PatternSet:
+    """
+    An ordered list of forbidden regexes compiled once per policy.
+
+    Each pattern is gated on a literal it cannot match without, so a clean
+    submission costs one C-level substring scan per pattern instead of a full
+    regex-engine pass; the regex only runs when its literal is present.
+    `first_match` reports the earliest *listed* pattern that matches, which is
+    exactly what the old `for p in patterns: if re.search(p, code)` loops did.
+    """
+
+    __slots__ = ("patterns", "_entries")
+
+    def __init__(self, patterns: Sequence[str]):
+        self.patterns: Tuple[str, ...] = tuple(patterns)
+        self._entries = tuple((p, _required_literal(p), re.compile(p)) for p in self.patterns)
+
+    def first_match(self, text: str) -> Optional[str]:
+        for pattern, literal, rx in self._entries:
+            if literal and literal not in text:
+                continue
+            if rx.search(text):
+                return pattern
+        return None
+
+
+class _SourceIndex:
+    """
+    Line-offset index over one submission, built once per check.
+
+    `segment(node)` returns the same text as `ast.get_source_segment(code, node)`
+    without re-splitting the whole source on every call. AST column offsets
+    are UTF-8 byte offsets, so slicing happens on the encoded source.
+    """
+
+    __slots__ = ("code", "_data", "_line_starts")
+
+    def __init__(self, code: str):
+        self.code = code
+        self._data: Optional[bytes] = None
+        self._line_starts: Optional[List[int]] = None
+
+    def _build(self) -> None:
+        self._line_starts = []
+        if "\r" in self.code:  # rare: let ast deal with \r and \r\n line ends
+            return
+        data = self.code.encode("utf-8")
+        starts = [0]
+        pos = data.find(b"\n")
+        while pos != -1:
+            starts.append(pos + 1)
+            pos = data.find(b"\n", pos + 1)
+        self._data = data
+        self._line_starts = starts
+
+    def segment(self, node: ast.AST) -> str:
+        end_lineno = getattr(node, "end_lineno", None)
+        end_col = getattr(node, "end_col_offset", None)
+        if end_lineno is None or end_col is None:
+            return ""
+        if self._line_starts is None:
+            self._build()
+        if self._data is None:
+            return ast.get_source_segment(self.code, node) or ""
+        starts = self._line_starts
+        start = starts[node.lineno - 1] + node.col_offset
+        end = starts[end_lineno - 1] + end_col
+        return self._data[start:end].decode("utf-8", "replace")
+
+
+# (rule id, reason) of the first violation, or None when the code is clean
+_Hit = Optional[Tuple[str, str]]
+
+# Keep only brackets, folded to "(" / ")"; every other ASCII character is dropped.
+_FOLD_BRACKETS = str.maketrans(
+    "[{]}", "(())", "".join(chr(c) for c in range(128) if chr(c) not in "()[]{}")
+)
+_NON_BRACKET_RE = re.compile(r'[^()]+')
+# Rough Python tokens: names, numbers, and any other single non-space character.
+_PY_TOKEN_RE = re.compile(r'[A-Za-z_]\w*|\d[\w.]*|\S')
+
+
+# ----- cost-bounded numeric evaluator for allocation sizes -----
+# Intermediate results are kept below _MAX_BITS bits. Any operation whose
+# result would be larger is not performed; the whole expression saturates to
+# _SATURATED, which is far past any allocation threshold. Together with the
+# length cap this bounds evaluation time regardless of input (`1 << 10**12`,
+# long `*` chains, ...).
+_MAX_BITS = 256
+_SATURATED = 1 << _MAX_BITS
+_MAX_EXPR_LEN = 512
+# Over-long expressions made only of numeric literals and operators are not
+# evaluated but still treated as huge, so padding cannot hide a big size.
+_PURE_NUMERIC_EXPR_RE = re.compile(r'[0-9a-fA-FxXoObBuUlL_\s+\-*/%<>()]+\Z')
+
+
+class _Saturated(Exception):
+    pass
+
+
+def _bits(v: int) -> int:
+    return v.bit_length()
+
+
+def _eval_size_node(n: ast.AST) -> int:
+    if isinstance(n, ast.Constant):
+        if isinstance(n.value, int):  # includes bool, as before
+            if _bits(n.value) > _MAX_BITS:
+                raise _Saturated
+            return n.value
+        if isinstance(n.value, float):
+            # Go and JS sizes are often written as 1e9; 1e999 parses as inf
+            if n.value == float("inf"):
+                raise _Saturated
+            if n.value.is_integer():
+                return _eval_size_node(ast.Constant(int(n.value)))
+        raise ValueError
+    if isinstance(n, ast.UnaryOp) and isinstance(n.op, (ast.UAdd, ast.USub)):
+        v = _eval_size_node(n.operand)
+        return v if isinstance(n.op, ast.UAdd) else -v
+    if not isinstance(n, ast.BinOp):
+        raise ValueError
+
+    l = _eval_size_node(n.left)
+    r = _eval_size_node(n.right)
+    op = n.op
+    if isinstance(op, ast.Add):
+        result = l + r
+    elif isinstance(op, ast.Sub):
+        result = l - r
+    elif isinstance(op, ast.Mult):
+        if l and r and _bits(l) + _bits(r) > _MAX_BITS + 1:
+            raise _Saturated
+        result = l * r
+    elif isinstance(op, (ast.Div, ast.FloorDiv)):
+        if r == 0:
+            raise ValueError
+        result = l // r
+    elif isinstance(op, ast.Mod):
+        if r == 0:
+            raise ValueError
+        result = l % r
+    elif isinstance(op, ast.LShift):
+        if r < 0:
+            raise ValueError
+        if l and _bits(l) + r > _MAX_BITS:
+            raise _Saturated
+        result = l << r
+    elif isinstance(op, ast.RShift):
+        if r < 0:
+            raise ValueError
+        result = l >> r
+    elif isinstance(op, ast.Pow):
+        if r < 0:
+            raise ValueError
+        if abs(l) > 1 and (r > _MAX_BITS or (_bits(l) - 1) * r > _MAX_BITS):
+            raise _Saturated
+        result = l ** r
+    else:
+        raise ValueError
+
+    if _bits(result) > _MAX_BITS:
+        raise _Saturated
+    return result
+
+
+@lru_cache(maxsize=4096)
+def _eval_size_expr(expr: str) -> Optional[int]:
+    """
+    Evaluate a literal size expression (the `N` of `malloc(N)`, `int a[N]`, ...).
+
+    Returns the value, _SATURATED when some intermediate result would exceed
+    _MAX_BITS bits, or None when the expression is not a plain integer
+    expression. Memoised: the same #define / constant strings recur across
+    many submissions, and the result does not depend on the policy.
+    """
+    if len(expr) > _MAX_EXPR_LEN:
+        return _SATURATED if _PURE_NUMERIC_EXPR_RE.match(expr) else None
+    cleaned = _INT_SUFFIX_RE.sub('', expr)  # strip integer suffixes
+    cleaned = cleaned.replace("_", "")
+    try:
+        node = ast.parse(cleaned.strip(), mode="eval").body
+    except Exception:
+        return None
+    try:
+        return _eval_size_node(node)
+    except _Saturated:
+        return _SATURATED
+    except Exception:  # ValueError, RecursionError, ...
+        return None
+
+
+# ----- named constants in allocation sizes -----
+# `N = 10**9; bytearray(N)`, `#define N ...` / `int a[N];`, `const n = 1e9` ...
+# Each language collects (name, expression) definitions in source order; they
+# are folded into values once per submission, and only when an allocation
+# size actually refers to a name. A name defined more than once (or bound in
+# any other way, for Python) is never treated as a constant.
+_CONST_NAME_RE = re.compile(r'(?<![\w.$])[A-Za-z_]\w*+')
+
+_C_DEFINE_RE = re.compile(r'(?m)^[ \t]*#[ \t]*define[ \t]++([A-Za-z_]\w*+)[ \t]++([^\n]+)')
+# bounded, possessive runs: `const` can repeat without a terminator, so an
+# open-ended run would make every occurrence rescan the rest of the file
+_C_CONST_RE = re.compile(r'\bconst\s([^;{}()=]{1,120}+)=([^;{}=]{1,400}+);')
+_C_IDENT_RE = re.compile(r'[A-Za-z_]\w*\Z')
+_C_SIZEOF_RE = re.compile(
+    r'sizeof\s*+\(\s*+(?:(?:unsigned|signed)\s++)?'
+    r'(char|short|int|long\s++long|long|float|double|size_t|bool|_Bool|u?int(?:8|16|32|64)_t)\s*+(\*?)\s*+\)'
+)
+_C_SIZEOF_BYTES = {
+    "char": 1, "bool": 1, "_Bool": 1, "short": 2, "int": 4, "float": 4, "long": 8, "double": 8, "size_t": 8,
+    "int8_t": 1, "uint8_t": 1, "int16_t": 2, "uint16_t": 2, "int32_t": 4, "uint32_t": 4, "int64_t": 8, "uint64_t": 8,
+}
+
+_GO_CONST_RE = re.compile(r'(?m)^[ \t]*const[ \t]++([A-Za-z_]\w*+)(?:[ \t]++[\w.\[\]]++)?[ \t]*+=[ \t]*+([^\n;]++)')
+_GO_CONST_BLOCK_RE = re.compile(r'\bconst\s*+\(([^()]*+)\)')
+_GO_CONST_SPEC_RE = re.compile(r'(?m)^[ \t]*+([A-Za-z_]\w*+)(?:[ \t]++[\w.\[\]]++)?[ \t]*+=[ \t]*+([^\n;]++)')
+
+_JAVA_FINAL_RE = re.compile(r'\bfinal\s++[\w.<>\[\]]++\s++([A-Za-z_]\w*+)\s*+=\s*+([^;{}]++);')
+
+_JS_CONST_RE = re.compile(r'\bconst\s++([A-Za-z_$][\w$]*+)\s*+=\s*+([^;,\n]++)')
+
+
+def _substitute_constants(expr: str, consts: Dict[str, int]) -> str:
+    return _CONST_NAME_RE.sub(lambda m: f"({consts[m.group()]})" if m.group() in consts else m.group(), expr)
+
+
+def _fold_constants(definitions: Iterable[Tuple[str, Optional[str]]]) -> Dict[str, int]:
+    """
+    Evaluate (name, expression) definitions in order; later ones may use
+    earlier ones. An expression of None marks a non-constant binding.
+    """
+    consts: Dict[str, int] = {}
+    seen: Set[str] = set()
+    for name, expr in definitions:
+        if name in seen:
+            consts.pop(name, None)
+            continue
+        seen.add(name)
+        if expr is not None:
+            value = _eval_size_expr(_substitute_constants(expr, consts))
+            if value is not None:
+                consts[name] = value
+    return consts
+
+
+def _c_sizeof(expr: str) -> str:
+    return _C_SIZEOF_RE.sub(lambda m: "8" if m.group(2) else str(_C_SIZEOF_BYTES[m.group(1).split()[0]]), expr)
+
+
+def _c_constants(code: str) -> Dict[str, int]:
+    defs = [(m.start(), m.group(1), m.group(2)) for m in _C_DEFINE_RE.finditer(code)]
+    for m in _C_CONST_RE.finditer(code):
+        # `const unsigned long *N` -> N; array or other declarators are skipped
+        words = m.group(1).split()
+        name = words[-1].lstrip("*") if words else ""
+        if _C_IDENT_RE.match(name):
+            defs.append((m.start(), name, m.group(2)))
+    return _fold_constants((name, _c_sizeof(expr)) for _, name, expr in sorted(defs))
+
+
+def _go_constants(code: str) -> Dict[str, int]:
+    defs = [(m.start(), m.group(1), m.group(2)) for m in _GO_CONST_RE.finditer(code)]
+    for block in _GO_CONST_BLOCK_RE.finditer(code):
+        defs += [(block.start(1) + m.start(), m.group(1), m.group(2))
+                 for m in _GO_CONST_SPEC_RE.finditer(block.group(1))]
+    return _fold_constants((name, expr) for _, name, expr in sorted(defs))
+
+
+def _java_constants(code: str) -> Dict[str, int]:
+    return _fold_constants(m.groups() for m in _JAVA_FINAL_RE.finditer(code))
+
+
+def _js_constants(code: str) -> Dict[str, int]:
+    return _fold_constants(m.groups() for m in _JS_CONST_RE.finditer(code))
+
+
+def _python_constants(tree: ast.AST, src: "_SourceIndex") -> Dict[str, int]:
+    """Names bound exactly once, by a plain `NAME = expr` (or annotated) assignment."""
+    defs: List[Tuple[int, int, str, Optional[str]]] = []
+    assigned: Set[int] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.Assign, ast.AnnAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            if len(targets) == 1 and isinstance(targets[0], ast.Name) and node.value is not None:
+                target = targets[0]
+                assigned.add(id(target))
+                defs.append((target.lineno, target.col_offset, target.id, src.segment(node.value)))
+        elif isinstance(node, ast.Name) and not isinstance(node.ctx, ast.Load):
+            if id(node) not in assigned:
+                defs.append((node.lineno, node.col_offset, node.id, None))
+        elif isinstance(node, ast.arg):
+            defs.append((node.lineno, node.col_offset, node.arg, None))
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            defs.append((node.lineno, node.col_offset, node.name, None))
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            for alias in node.names:
+                name = alias.asname or alias.name.split(".")[0]
+                defs.append((node.lineno, node.col_offset, name, None))
+        elif isinstance(node, (ast.Global, ast.Nonlocal)):
+            for name in node.names:
+                defs.append((node.lineno, node.col_offset, name, None))
+    defs.sort(key=lambda d: (d[0], d[1]))
+    return _fold_constants((name, expr) for _, _, name, expr in defs)
+
+
+class _Sizes:
+    """
+    Allocation-size evaluation for one submission: literal expressions first,
+    then with named constants substituted. Constants are collected on first
+    need by the zero-argument `collect` callable.
+    """
+
+    __slots__ = ("threshold", "_collect", "_consts", "_prepare")
+
+    def __init__(self, threshold: int, collect, prepare=None):
+        self.threshold = threshold
+        self._collect = collect
+        self._consts: Optional[Dict[str, int]] = None
+        self._prepare = prepare  # language-specific rewrite, e.g. C sizeof(T)
+
+    def value(self, expr: str) -> Optional[int]:
+        if self._prepare is not None:
+            expr = self._prepare(expr)
+        v = _eval_size_expr(expr)
+        if v is None and _CONST_NAME_RE.search(expr):
+            if self._consts is None:
+                self._consts = self._collect()
+            if self._consts:
+                v = _eval_size_expr(_substitute_constants(expr, self._consts))
+        return v
+
+    def too_large(self, expr: str) -> bool:
+        v = self.value(expr)
+        return v is not None and v >= self.threshold
+
+
+class _PyScan:
+    """Per-check state shared by the Python AST handlers."""
+
+    __slots__ = ("tree", "src", "policy", "sizes", "imports_found", "endless_loop")
+
+    def __init__(self, tree: ast.AST, src: "_SourceIndex", policy: "SafetyPolicy", sizes: _Sizes):
+        self.tree = tree
+        self.src = src
+        self.policy = policy
+        self.sizes = sizes
+        self.imports_found: Set[str] = set()
+        self.endless_loop: _Hit = None  # reported only if no safety rule fires
+
+
+# ----- non-terminating loops -----
+# A loop is flagged only when its condition is constant-true and nothing in
+# its body can leave it: no break (at its own level), return, goto, yield,
+# throw/raise or process exit, and nothing in it can raise: an exception
+# leaves the loop whether or not a try/catch around it handles it, so a body
+# with a call, an index, a member access or a division (anything that can
+# throw or fault) is never flagged. C has no exceptions, so a C body with
+# calls is flagged only when the file contains no exit/abort/longjmp site.
+INFINITE_LOOP_RULE = "infinite_loop"  # rule ids are "<language>.infinite_loop"
+
+# while(1) / while(true) / for(;;) followed by a body or an empty statement, and
+# Go's for { / for true { / for ;; {. Each pattern starts with a literal so the
+# regex engine can skip ahead to it; the word boundary before it is checked by
+# hand (a leading \b makes the search try every position).
+_LOOP_HEAD_RES = {
+    "brace": (
+        re.compile(r'while\s*+\(\s*+(?:1|true)\s*+\)\s*+([{;])'),
+        re.compile(r'for\s*+\(\s*+;\s*+;\s*+\)\s*+([{;])'),
+    ),
+    "go": (re.compile(r'for(?:\s++true\b|\s*+;\s*+;)?\s*+(\{)'),),
+}
+_BRACE_RE = re.compile(r'[{}]')
+_CALL_RE = re.compile(r'\b(?!(?:if|while|for|switch|return|sizeof|catch)\b)[A-Za-z_$][\w$]*+\s*+\(')
+# Java string literals are not blanked by the lexer; JS template text is left as code.
+# Always matches from an opening quote (unclosed literals end at the line break), so it is linear.
+_JAVA_LITERAL_RE = re.compile(r'"(?:[^"\\\n]|\\[\s\S])*+\\?(?:"|(?=\n)|\Z)|\'(?:[^\'\\\n]|\\[\s\S])*+\\?(?:\'|(?=\n)|\Z)')
+_JS_PLAIN_TEMPLATE_RE = re.compile(r'`[^`$]*+`')
+_NOT_NEWLINE_RE = re.compile(r'[^\n]')
+
+# tokens of an expression that can throw or fault: a member access or index
+# (null/undefined, out of range), a division or remainder, an allocation
+_RAISING_RE = re.compile(r'[\[.%/]|->|\bnew\b')
+_LOOP_ESCAPES = {
+    "c": re.compile(r'\b(?:break|return|goto|exit|_Exit|_exit|quick_exit|abort|longjmp|assert)\b'),
+    "java": re.compile(r'\b(?:break|return|yield|throw|exit|halt|assert)\b'),
+    "javascript": re.compile(r'\b(?:break|return|yield|throw|exit)\b'),
+    "go": re.compile(r'\b(?:break|return|goto|panic|Exit|Fatal|Fatalf|Fatalln|Goexit)\b'),
+}
+# a C call can end the program only through one of these, somewhere in the file
+_C_UNWIND_RE = re.compile(r'\b(?:exit|_Exit|_exit|quick_exit|abort|longjmp|assert)\b')
+
+_PY_LOOPS = (ast.For, ast.AsyncFor, ast.While)
+_PY_SCOPES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)
+# what a loop body may consist of and still never raise; anything else (a
+# call, an index, an attribute, iteration, unpacking, ...) can throw
+_PY_QUIET_NODES = (ast.Expr, ast.Assign, ast.AugAssign, ast.AnnAssign, ast.Pass, ast.Continue, ast.If,
+                   ast.While, ast.Name, ast.Constant, ast.expr_context, ast.BoolOp, ast.boolop, ast.UnaryOp,
+                   ast.unaryop, ast.IfExp, ast.Compare, ast.cmpop, ast.BinOp, ast.operator)
+_PY_QUIET_OPS = (ast.Add, ast.Sub, ast.Mult, ast.BitAnd, ast.BitOr, ast.BitXor,
+                 ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE, ast.Is, ast.IsNot)
+
+
+def _py_may_raise(node: ast.AST) -> bool:
+    if isinstance(node, (ast.BinOp, ast.AugAssign)):
+        return not isinstance(node.op, _PY_QUIET_OPS)
+    if isinstance(node, ast.Compare):
+        return not all(isinstance(op, _PY_QUIET_OPS) for op in node.ops)
+    return not isinstance(node, _PY_QUIET_NODES)
+
+
+def _py_loop_escapes(loop: ast.While) -> bool:
+    """Whether control can leave `loop` at all: a break, return, yield, or
+    anything that can raise (caught or not, the exception ends the loop)."""
+    todo = [(stmt, False) for stmt in loop.body]
+    while todo:
+        node, nested = todo.pop()
+        if isinstance(node, ast.Break):
+            if not nested:
+                return True
+            continue
+        if isinstance(node, _PY_SCOPES):
+            continue
+        if _py_may_raise(node):
+            return True
+        if isinstance(node, _PY_LOOPS):
+            # a break in a nested loop's body only leaves that loop; one in its else clause leaves ours
+            body = set(map(id, node.body))
+            todo.extend((child, nested or id(child) in body) for child in ast.iter_child_nodes(node))
+        else:
+            todo.extend((child, nested) for child in ast.iter_child_nodes(node))
+    return False
+
+
+def _blank_literal(m: "re.Match") -> str:
+    """Blank a literal's contents, keeping its delimiters and line breaks (unclosed: to end of line)."""
+    tok = m.group(0)
+    if len(tok) >= 2 and tok[-1] == tok[0]:
+        return tok[0] + _NOT_NEWLINE_RE.sub(" ", tok[1:-1]) + tok[-1]
+    return tok[0] + _NOT_NEWLINE_RE.sub(" ", tok[1:])
+
+
+def _find_endless_loop(code: str, lang: str, deadline: float) -> Optional[Tuple[int, str]]:
+    """(line, loop header) of the first loop in a lexed `code` view that can never exit."""
+    head_res = _LOOP_HEAD_RES["go" if lang == "go" else "brace"]
+    if not any(rx.search(code) for rx in head_res):
+        return None
+    if lang == "java":
+        code = _JAVA_LITERAL_RE.sub(_blank_literal, code)
+    elif lang == "javascript" and "`" in code:
+        code = _JS_PLAIN_TEMPLATE_RE.sub(_blank_literal, code)
+
+    escape_rx = _LOOP_ESCAPES[lang]
+    pairs: Optional[Dict[int, int]] = None
+    unwinds: Optional[bool] = None
+    heads = heapq.merge(*(rx.finditer(code) for rx in head_res), key=lambda m: m.start())
+    for m in heads:
+        _check_deadline(deadline)
+        if m.start() and (code[m.start() - 1].isalnum() or code[m.start() - 1] in "_$"):
+            continue  # e.g. `dowhile(1)` or `xfor {`
+        opener = m.start(1)
+        if code[opener] == ";":
+            # `while (1);` spins forever, unless it is the tail of `do { ... } while (1);`
+            i = m.start() - 1
+            while i >= 0 and code[i].isspace():
+                i -= 1
+            if i >= 0 and code[i] == "}":
+                continue
+        else:
+            if pairs is None:
+                pairs = {}
+                stack: List[int] = []
+                for b in _BRACE_RE.finditer(code):
+                    if b.group() == "{":
+                        stack.append(b.start())
+                    elif stack:
+                        pairs[stack.pop()] = b.start()
+            close = pairs.get(opener)
+            if close is None or escape_rx.search(code, opener, close) or _RAISING_RE.search(code, opener, close):
+                continue
+            if _CALL_RE.search(code, opener, close):
+                if lang != "c":
+                    continue  # any call can throw
+                if unwinds is None:
+                    unwinds = _C_UNWIND_RE.search(code) is not None
+                if unwinds:
+                    continue
+        return code.count("\n", 0, m.start()) + 1, " ".join(code[m.start():opener].split())
+    return None
+
+
+def _endless_loop_hit(header: str, line: int, rule_prefix: str) -> Tuple[str, str]:
+    return (f"{rule_prefix}.{INFINITE_LOOP_RULE}",
+            f"Loop '{header}' on line {line} can never exit (no break, return or exit); "
+            f"it would run until the time limit on every test case.")
+
+
+class PreGateLimits:
+    """
+    Cheap shape limits checked before any parsing or regex work.
+
+    Every check is O(1) or a single C-level scan, and most are skipped
+    outright when a trivial bound (e.g. total length) already proves the limit
+    cannot be exceeded. A limit of 0 disables that check.
+    """
+
+    __slots__ = ("max_bytes", "max_lines", "max_line_length", "max_nesting", "max_python_tokens")
+
+    def __init__(
+        self,
+        max_bytes: int = 512 * 1024,
+        max_lines: int = 10_000,
+        max_line_length: int = 10_000,
+        max_nesting: int = 100,
+        max_python_tokens: int = 200_000,
+    ):
+        self.max_bytes = int(max_bytes)
+        self.max_lines = int(max_lines)
+        self.max_line_length = int(max_line_length)
+        self.max_nesting = int(max_nesting)
+        self.max_python_tokens = int(max_python_tokens)
+
+    def describe(self) -> str:
+        return ",".join(f"{name}={getattr(self, name)}" for name in self.__slots__)
+
+    def check(self, code: str, lang: str) -> _Hit:
+        n = len(code)
+        if self.max_bytes and n * 4 > self.max_bytes:  # 4 = worst-case UTF-8 bytes per char
+            size = n if code.isascii() else len(code.encode("utf-8", "surrogatepass"))
+            if size > self.max_bytes:
+                return "pregate.bytes", f"Submission too large ({size} bytes > {self.max_bytes})."
+
+        if self.max_lines and n >= self.max_lines:
+            lines = code.count("\n") + 1
+            if lines > self.max_lines:
+                return "pregate.lines", f"Submission has too many lines ({lines} > {self.max_lines})."
+
+        if self.max_line_length and n > self.max_line_length:
+            longest = max(map(len, code.split("\n")))
+            if longest > self.max_line_length:
+                return "pregate.line_length", f"Submission line too long ({longest} chars > {self.max_line_length})."
+
+        if self.max_nesting:
+            openers = code.count("(") + code.count("[") + code.count("{")
+            if openers > self.max_nesting:
+                # Peel innermost pairs one level per pass; each pass is a C-level
+                # replace, and we stop as soon as the limit is exceeded.
+                brackets = code.translate(_FOLD_BRACKETS)
+                if not brackets.isascii():
+                    brackets = _NON_BRACKET_RE.sub("", brackets)
+                depth = 0
+                while "()" in brackets:
+                    depth += 1
+                    if depth > self.max_nesting:
+                        return "pregate.nesting", f"Brackets nested too deeply (> {self.max_nesting} levels)."
+                    brackets = brackets.replace("()", "")
+
+        if lang == "python" and self.max_python_tokens and n > self.max_python_tokens:
+            tokens = len(_PY_TOKEN_RE.findall(code))
+            if tokens > self.max_python_tokens:
+                return "pregate.tokens", f"Python submission has too many tokens ({tokens} > {self.max_python_tokens})."
+
+        return None
+
+
+# ----- safety policy -----
+# Built-in defaults. A policy file only needs the keys it wants to change;
+# sections are merged key by key over these.
+_DEFAULT_POLICY = {
+    "version": "builtin",
+    "threshold_bytes": 128 * 1024 ** 2,  # 128 MiB
+    "max_imports": 4,  # maximum allowed distinct imports per submission
+    "limits": {name: getattr(PreGateLimits(), name) for name in PreGateLimits.__slots__},
+    "python": {
+        "allowed_modules": [
+            "math", "random", "re", "functools", "itertools", "collections",
+            "heapq", "bisect", "statistics", "typing", "dataclasses",
+        ],
+        "disallowed_modules": [
+            "os", "pathlib", "shutil", "subprocess", "socket", "ctypes",
+            "multiprocessing", "threading", "posix", "importlib", "sys",
+        ],
+    },
+    "javascript": {
+        "allowed_bare_modules": ["assert"],
+        "disallowed_modules": ["fs", "child_process", "process", "worker_threads", "cluster"],
+        "forbidden_patterns": list(_JS_FORBIDDEN_PATTERNS),
+    },
+    "c": {
+        "allowed_headers": [
+            "stdio.h", "stdlib.h", "string.h", "math.h",
+            "limits.h", "stdbool.h", "stdint.h", "stddef.h",
+        ],
+        "blocked_patterns": list(_C_BLOCKED_FUNCS),
+    },
+    "go": {
+        "allowed_imports": ["fmt", "math", "strings", "strconv", "time", "bytes", "unicode"],
+        "suspicious_patterns": list(_GO_SUSPICIOUS_PATTERNS),
+    },
+    "java": {
+        "allowed_prefixes": ["java.lang", "java.util", "java.math"],
+        "forbidden_patterns": list(_JAVA_FORBIDDEN_PATTERNS),
+    },
+}
+
+
+def _merge_policy(config: dict) -> dict:
+    """
+    Validate `config` and merge it over _DEFAULT_POLICY. Name lists come back
+    sorted and de-duplicated; pattern lists keep their order (the first listed
+    match is the one reported). Raises ValueError on anything malformed.
+    """
+    if not isinstance(config, dict):
+        raise ValueError("policy must be a JSON object")
+    unknown = set(config) - set(_DEFAULT_POLICY)
+    if unknown:
+        raise ValueError(f"unknown policy keys: {', '.join(sorted(unknown))}")
+
+    doc: dict = {"version": str(config.get("version", _DEFAULT_POLICY["version"]))}
+    for key in ("threshold_bytes", "max_imports"):
+        value = config.get(key, _DEFAULT_POLICY[key])
+        if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+            raise ValueError(f"policy '{key}' must be a non-negative integer")
+        doc[key] = value
+
+    for section in ("limits", "python", "javascript", "c", "go", "java"):
+        defaults = _DEFAULT_POLICY[section]
+        given = config.get(section, {})
+        if not isinstance(given, dict):
+            raise ValueError(f"policy section '{section}' must be an object")
+        unknown = set(given) - set(defaults)
+        if unknown:
+            raise ValueError(f"unknown keys in policy section '{section}': {', '.join(sorted(unknown))}")
+        merged = {}
+        for key, default in defaults.items():
+            value = given.get(key, default)
+            name = f"{section}.{key}"
+            if isinstance(default, int):
+                if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+                    raise ValueError(f"policy '{name}' must be a non-negative integer")
+            elif not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+                raise ValueError(f"policy '{name}' must be a list of strings")
+            elif key.endswith("_patterns"):
+                for pattern in value:
+                    try:
+                        re.compile(pattern)
+                    except re.error as e:
+                        raise ValueError(f"policy '{name}': bad pattern {pattern!r}: {e}") from None
+                value = list(dict.fromkeys(value))
+            else:
+                value = sorted(set(value))
+            merged[key] = value
+        doc[section] = merged
+    return doc
+
+
+class SafetyPolicy:
+    """
+    One compiled, read-only safety policy.
+
+    Whitelists become frozensets and forbidden-pattern lists become
+    _PatternSets once, when the policy is built. Policies are never mutated:
+    a reload builds a new one and the checker swaps its reference, so a check
+    that is already running finishes on the policy it started with.
+
+    `version` is the declared version plus a digest of the rules, so it
+    changes whenever any rule does and can be used as a cache key.
+    """
+
+    __slots__ = (
+        "source", "fingerprint", "version", "threshold_bytes", "max_imports", "limits",
+        "python_allowed", "python_disallowed",
+        "js_allowed_bare", "js_disallowed", "js_forbidden",
+        "c_allowed_headers", "c_blocked",
+        "go_allowed", "go_suspicious",
+        "java_allowed_prefixes", "java_forbidden",
+    )
+
+    def __init__(self, config: Optional[dict] = None):
+        doc = _merge_policy(config if config is not None else {})
+        rules = {k: v for k, v in doc.items() if k != "version"}
+        self.source = doc
+        self.fingerprint = hashlib.sha256(json.dumps(rules, sort_keys=True).encode()).hexdigest()[:16]
+        self.threshold_bytes: int = doc["threshold_bytes"]
+        self.max_imports: int = doc["max_imports"]
+        self.limits = PreGateLimits(**doc["limits"])
+
+        self.python_allowed = frozenset(doc["python"]["allowed_modules"])
+        self.python_disallowed = frozenset(doc["python"]["disallowed_modules"])
+        self.js_allowed_bare = frozenset(doc["javascript"]["allowed_bare_modules"])
+        self.js_disallowed = frozenset(doc["javascript"]["disallowed_modules"])
+        self.js_forbidden = _PatternSet(doc["javascript"]["forbidden_patterns"])
+        self.c_allowed_headers = frozenset(doc["c"]["allowed_headers"])
+        self.c_blocked = _PatternSet(doc["c"]["blocked_patterns"])
+        self.go_allowed = frozenset(doc["go"]["allowed_imports"])
+        self.go_suspicious = _PatternSet(doc["go"]["suspicious_patterns"])
+        self.java_allowed_prefixes = tuple(doc["java"]["allowed_prefixes"])
+        self.java_forbidden = _PatternSet(doc["java"]["forbidden_patterns"])
+        self.version = f"{doc['version']}@{self.fingerprint}"  # set last: freezes the policy
+
+    @classmethod
+    def from_file(cls, path: str) -> "SafetyPolicy":
+        """Load a JSON policy file; raises OSError or ValueError."""
+        with open(path, "r", encoding="utf-8") as f:
+            try:
+                config = json.load(f)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path}: invalid JSON: {e}") from None
+        return cls(config)
+
+    def with_overrides(self, **changes) -> "SafetyPolicy":
+        """A copy with top-level keys replaced; None values are ignored."""
+        doc = dict(self.source)
+        doc.update({k: v for k, v in changes.items() if v is not None})
+        return SafetyPolicy(doc)
+
+    def __setattr__(self, name, value):
+        if hasattr(self, "version"):
+            raise AttributeError("SafetyPolicy is immutable")
+        object.__setattr__(self, name, value)
+
+    def __reduce__(self):
+        return SafetyPolicy, (self.source,)
+
+    def __repr__(self) -> str:
+        return f"SafetyPolicy(version={self.version!r})"
+
+
+# ----- time budget -----
+TIMEOUT_RULE = "check.timeout"
+
+
+class _CheckTimeout(BaseException):
+    """
+    Raised inside a check once its time budget is spent. A BaseException so
+    the `except Exception` fallbacks around parsing and size evaluation let it
+    through instead of turning it into "invalid syntax" or a memoised None.
+    """
+
+
+def _check_deadline(deadline: float) -> None:
+    if time.perf_counter() > deadline:
+        raise _CheckTimeout
+
+
+def _alarm(signum, frame) -> None:
+    raise _CheckTimeout
+
+
+def _alarm_available() -> bool:
+    """
+    A real-time alarm can bound this check: signals are only delivered to the
+    main thread, and an application's own SIGALRM handler or pending timer
+    is left alone.
+    """
+    return (hasattr(signal, "setitimer")
+            and threading.current_thread() is threading.main_thread()
+            and signal.getsignal(signal.SIGALRM) in (signal.SIG_DFL, _alarm)
+            and signal.getitimer(signal.ITIMER_REAL)[0] == 0)
+
+
+class Verdict:
+    """
+    Immutable outcome of one check; truthy when the code is safe to execute.
+
+    `rule` is the id of the rule that rejected the code (None when ok),
+    `elapsed` the seconds the uncached check took and `policy_version` the
+    SafetyPolicy.version it was checked against. Verdicts hold no reference
+    to the checker, so they can be cached, shared between threads and pickled.
+    """
+
+    __slots__ = ("ok", "reasons", "rule", "elapsed", "policy_version")
+
+    def __init__(
+        self,
+        ok: bool,
+        reasons: Tuple[str, ...] = (),
+        rule: Optional[str] = None,
+        elapsed: float = 0.0,
+        policy_version: Optional[str] = None,
+    ):
+        object.__setattr__(self, "ok", ok)
+        object.__setattr__(self, "reasons", tuple(reasons))
+        object.__setattr__(self, "rule", rule)
+        object.__setattr__(self, "elapsed", elapsed)
+        object.__setattr__(self, "policy_version", policy_version)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Verdict is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Verdict is immutable")
+
+    def __reduce__(self):
+        return Verdict, (self.ok, self.reasons, self.rule, self.elapsed, self.policy_version)
+
+    @property
+    def reason(self) -> str:
+        return "; ".join(self.reasons) if self.reasons else "Safe to execute."
+
+    @property
+    def timed_out(self) -> bool:
+        """True when the check was cut off by the time budget, not rejected by a rule."""
+        return self.rule == TIMEOUT_RULE
+
+    @property
+    def will_time_out(self) -> bool:
+        """
+        True when the code passed every safety rule but has a loop that can
+        never exit, so running it would only burn the executor's time limit.
+        """
+        return self.rule is not None and self.rule.endswith("." + INFINITE_LOOP_RULE)
+
+    def __bool__(self) -> bool:
+        return self.ok
+
+    def __repr__(self) -> str:
+        return f"Verdict(ok={self.ok!r}, rule={self.rule!r}, reason={self.reason!r})"
+
+
+class _VerdictCache:
+    """
+    Bounded LRU of verdicts with per-entry TTL.
+
+    Entries expire `ttl_seconds` after insertion and the least recently used
+    entry is dropped once `max_entries` is reached. All operations take a
+    short lock so one cache can serve every consumer thread.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = int(max_entries)
+        self.ttl_seconds = float(ttl_seconds)
+        self._entries: "OrderedDict[tuple, Tuple[float, Verdict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: tuple) -> Optional[Verdict]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, verdict = entry
+            if expires_at <= now:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return verdict
+
+    def put(self, key: tuple, verdict: Verdict) -> None:
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            self._entries[key] = (expires_at, verdict)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            }
+
+
+class _LatencyHistogram:
+    """
+    Cumulative histogram of uncached check latencies (seconds), Prometheus
+    style: each bucket counts the checks that took at most its bound. Also
+    tracks timeouts and checks that used more than half of the budget.
+    """
+
+    BOUNDS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+    def __init__(self, budget_seconds: float):
+        self.budget_seconds = float(budget_seconds)
+        self._counts = [0] * (len(self.BOUNDS) + 1)  # last slot is +Inf
+        self._lock = threading.Lock()
+        self.count = 0
+        self.sum_seconds = 0.0
+        self.max_seconds = 0.0
+        self.timeouts = 0
+        self.over_half_budget = 0
+
+    def observe(self, seconds: float, timed_out: bool = False) -> None:
+        index = bisect.bisect_left(self.BOUNDS, seconds)
+        with self._lock:
+            self._counts[index] += 1
+            self.count += 1
+            self.sum_seconds += seconds
+            if seconds > self.max_seconds:
+                self.max_seconds = seconds
+            if timed_out:
+                self.timeouts += 1
+            if self.budget_seconds and seconds > self.budget_seconds / 2:
+                self.over_half_budget += 1
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            buckets, running = {}, 0
+            for bound, n in zip(self.BOUNDS + (float("inf"),), self._counts):
+                running += n
+                buckets["+Inf" if bound == float("inf") else repr(bound)] = running
+            return {
+                "budget_seconds": self.budget_seconds,
+                "count": self.count,
+                "sum_seconds": self.sum_seconds,
+                "max_seconds": self.max_seconds,
+                "timeouts": self.timeouts,
+                "over_half_budget": self.over_half_budget,
+                "buckets": buckets,
+            }
+
+
+# ----- per-rule counters -----
+# Counters are keyed by (language, rule). A rule is either a stage of a check,
+# named after the rule id it enforces ("c.alloc", "python.import", "go.lex"
+# for lexing, "pregate" for the pre-gate), or a rule id a check returned; a
+# stage that can return two ids (e.g. "<lang>.import" and
+# "<lang>.import_count") keeps its time under the first and each hit under
+# the id that fired.
+_STATS_LANGUAGES = {"python": "python", "js": "javascript", "javascript": "javascript",
+                    "c": "c", "go": "go", "java": "java"}
+
+
+def _stats_language(lang: str) -> str:
+    """Label for counters; anything unsupported shares one label so untrusted input cannot add series."""
+    return _STATS_LANGUAGES.get(lang, "unsupported")
+
+
+class _StageClock:
+    """
+    Splits the wall time of one check between the stages it runs through.
+    `enter(stage)` closes the running stage and starts the next; `nested()`
+    books time measured inside the running stage to another rule and takes
+    it out of the running one. Used by one thread for one check.
+    """
+
+    __slots__ = ("times", "_stage", "_start")
+
+    def __init__(self):
+        self.times: Dict[str, List[int]] = {}  # rule -> [calls, hits, ns]
+        self._stage: Optional[str] = None
+        self._start = 0
+
+    def _add(self, rule: str, calls: int, hits: int, ns: int) -> None:
+        entry = self.times.get(rule)
+        if entry is None:
+            self.times[rule] = [calls, hits, ns]
+        else:
+            entry[0] += calls
+            entry[1] += hits
+            entry[2] += ns
+
+    def enter(self, stage: Optional[str]) -> None:
+        now = time.perf_counter_ns()
+        if self._stage is not None:
+            self._add(self._stage, 1, 0, now - self._start)
+        self._stage = stage
+        self._start = now
+
+    def nested(self, rule: str, calls: int, ns: int) -> None:
+        self._add(rule, calls, 0, ns)
+        self._start += ns
+
+    def finish(self, hit_rule: Optional[str]) -> Dict[str, List[int]]:
+        self.enter(None)
+        if hit_rule is not None:
+            self._add(hit_rule, 0, 1, 0)
+        return self.times
+
+
+class _RuleStats:
+    """
+    Calls, hits and cumulative nanoseconds per (language, rule), without locks.
+
+    Every thread adds into its own shard, registered once on first use
+    (list.append is atomic), so a check never waits on another thread to
+    count. snapshot() sums the shards; it can miss an update that is in
+    flight, never double-count one.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards: List[Dict[Tuple[str, str], List[int]]] = []
+
+    def _shard(self) -> Dict[Tuple[str, str], List[int]]:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = {}
+            self._shards.append(shard)
+        return shard
+
+    def add(self, lang: str, times: Dict[str, List[int]]) -> None:
+        shard = self._shard()
+        for rule, (calls, hits, ns) in times.items():
+            entry = shard.get((lang, rule))
+            if entry is None:
+                shard[(lang, rule)] = [calls, hits, ns]
+            else:
+                entry[0] += calls
+                entry[1] += hits
+                entry[2] += ns
+
+    def drain(self) -> List[Tuple[str, Dict[str, List[int]]]]:
+        """Take and reset this thread's counts (pool processes hand them back to the parent)."""
+        shard = self._shard()
+        by_lang: Dict[str, Dict[str, List[int]]] = {}
+        for (lang, rule), entry in shard.items():
+            by_lang.setdefault(lang, {})[rule] = entry
+        shard.clear()
+        return list(by_lang.items())
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, int]]]:
+        totals: Dict[Tuple[str, str], List[int]] = {}
+        for shard in list(self._shards):
+            for key, entry in list(shard.items()):  # one C-level copy; the owner may be writing
+                total = totals.setdefault(key, [0, 0, 0])
+                total[0] += entry[0]
+                total[1] += entry[1]
+                total[2] += entry[2]
+        out: Dict[str, Dict[str, Dict[str, int]]] = {}
+        for (lang, rule), (calls, hits, ns) in sorted(totals.items()):
+            out.setdefault(lang, {})[rule] = {"calls": calls, "hits": hits, "ns": ns}
+        return out
+
+
+def _prom_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _prometheus_text(snapshot: Dict[str, Dict[str, Dict[str, int]]], prefix: str) -> str:
+    """Render a _RuleStats snapshot in the Prometheus text exposition format."""
+    metrics = (
+        ("rule_calls_total", "Times a rule or check stage ran.", lambda c: str(c["calls"])),
+        ("rule_hits_total", "Submissions rejected by a rule.", lambda c: str(c["hits"])),
+        ("rule_seconds_total", "Wall time spent in a rule or check stage.", lambda c: f"{c['ns'] / 1e9:.9f}"),
+    )
+    lines: List[str] = []
+    for name, help_text, value in metrics:
+        lines.append(f"# HELP {prefix}_{name} {help_text}")
+        lines.append(f"# TYPE {prefix}_{name} counter")
+        for lang, rules in snapshot.items():
+            for rule, counts in rules.items():
+                labels = f'language="{_prom_label(lang)}",rule="{_prom_label(rule)}"'
+                lines.append(f"{prefix}_{name}{{{labels}}} {value(counts)}")
+    return "\n".join(lines) + "\n"
+
+
+# ----- process-pool backend -----
+# The pool is forked when the checker is created: the worker scripts build
+# their checker at import time, before any consumer thread exists, and
+# forking a process that already runs threads can leave the child holding
+# locks nobody will release. Only a pool that broke or got stuck is forked
+# again later, as the lesser evil next to checking everything inline. The policy travels with the tasks, pickled once
+# per version; each pool process builds its own checker from it the first
+# time it sees that version.
+_pool_checker: Optional["SafetyChecker"] = None
+_pool_budget = 0.0
+
+
+def _pool_init(time_budget: float) -> None:
+    global _pool_budget
+    _pool_budget = time_budget
+
+
+def _pool_check(policy_version: str, policy_blob: bytes, code: str, lang: str) -> Tuple[Verdict, list]:
+    """Run one check; returns the verdict and the rule counters it produced, for the parent to add."""
+    global _pool_checker
+    checker = _pool_checker
+    if checker is None or checker.policy_version != policy_version:
+        checker = _pool_checker = SafetyChecker(cache_size=0, policy=pickle.loads(policy_blob),
+                                                time_budget=_pool_budget)
+    verdict = checker._run_timed(code, lang, checker.policy)
+    return verdict, checker._rule_stats.drain()
 
 
 class SafetyChecker:
     def __init__(
         self,
-        threshold_bytes: int = 128 * 1024 ** 2,  # default 128 MiB
-        max_imports: int = 4,  # maximum allowed distinct imports per submission
+        threshold_bytes: Optional[int] = None,  # overrides the policy's (default 128 MiB)
+        max_imports: Optional[int] = None,  # overrides the policy's (default 4)
+        cache_size: int = 1024,  # verdict cache entries; 0 disables caching
+        cache_ttl: float = 600.0,  # seconds a cached verdict stays valid
+        processes: int = 0,  # process-pool size for check_many/large checks, forked here; 0 runs inline
+        offload_bytes: int = 64 * 1024,  # single checks at least this large go to the pool
+        limits: Optional[PreGateLimits] = None,  # overrides the policy's pre-gate limits
+        policy: Optional[SafetyPolicy] = None,  # None uses the built-in defaults
+        policy_path: Optional[str] = None,  # JSON policy file, re-read when it changes
+        reload_interval: float = 5.0,  # seconds between policy file mtime checks; 0 never reloads
+        time_budget: float = 1.0,  # wall-clock seconds per uncached check; 0 disables the budget
     ):
-        self.reasons: List[str] = []
-
-        # Configurable limits
-        self.THRESHOLD_BYTES = int(threshold_bytes)
-        self.MAX_IMPORTS = int(max_imports)
-
-        # Whitelists (small and conservative)
-        self._allowed_python_modules: Set[str] = {
-            "math",
-            "random",
-            "re",
-            "functools",
-            "itertools",
-            "collections",
-            "heapq",
-            "bisect",
-            "statistics",
-            "typing",
-            "dataclasses",
-        }
-        self._disallowed_python_modules: Set[str] = {
-            "os",
-            "pathlib",
-            "shutil",
-            "subprocess",
-            "socket",
-            "ctypes",
-            "multiprocessing",
-            "threading",
-            "posix",
-            "importlib",
-            "sys",
+        # check() keeps no per-call state on the instance: it reads the current
+        # policy reference once and uses only that, so one checker can serve any
+        # number of threads and a reload never changes rules mid-check.
+        self._overrides = {
+            "threshold_bytes": None if threshold_bytes is None else int(threshold_bytes),
+            "max_imports": None if max_imports is None else int(max_imports),
+            "limits": None if limits is None else {n: getattr(limits, n) for n in PreGateLimits.__slots__},
         }
+        self.policy_path = policy_path
+        self.reload_interval = float(reload_interval)
+        self._reload_lock = threading.Lock()
+        self._next_reload_check = 0.0
+        self._policy_mtime: Optional[int] = None
+        if policy_path is not None:
+            # a broken policy file at startup is a deployment error: fail loudly
+            self._policy_mtime = os.stat(policy_path).st_mtime_ns
+            policy = SafetyPolicy.from_file(policy_path)
+            self._next_reload_check = time.monotonic() + self.reload_interval
+        self._policy: SafetyPolicy = self._apply_overrides(policy if policy is not None else SafetyPolicy())
 
-        self._allowed_js_bare_modules: Set[str] = {"assert"}
-        self._disallowed_js_modules: Set[str] = {"fs", "child_process", "process", "worker_threads", "cluster"}
-
-        self._allowed_c_headers: Set[str] = {
-            "stdio.h",
-            "stdlib.h",
-            "string.h",
-            "math.h",
-            "limits.h",
-            "stdbool.h",
-            "stdint.h",
-            "stddef.h",
-        }
+        self._pregate_rejections: Dict[str, int] = {}
+        self._pregate_lock = threading.Lock()
+
+        # Time budget for one uncached check, and how long checks actually take
+        self.time_budget = float(time_budget)
+        self._latency = _LatencyHistogram(self.time_budget)
+        self._rule_stats = _RuleStats()
 
-        self._allowed_go_imports: Set[str] = {
-            "fmt",
-            "math",
-            "strings",
-            "strconv",
-            "time",
-            "bytes",
-            "unicode",
+        # Python AST checks, dispatched on exact node type; the index is the
+        # handler's slot in _PY_HANDLER_STAGES, for the per-rule counters
+        self._py_dispatch = {
+            ast.Import: (self._py_import, 0),
+            ast.ImportFrom: (self._py_import_from, 0),
+            ast.Attribute: (self._py_attribute, 1),
+            ast.Call: (self._py_call, 2),
+            ast.BinOp: (self._py_binop, 3),
+            ast.While: (self._py_while, 4),
         }
 
-        self._allowed_java_prefixes: Set[str] = {"java.lang", "java.util", "java.math"}
+        self._cache: Optional[_VerdictCache] = _VerdictCache(cache_size, cache_ttl) if cache_size > 0 else None
+
+        # Process pool, forked now, while the caller is (normally) still single-threaded;
+        # a pool that breaks or gets stuck is replaced by a new one
+        self.processes = int(processes)
+        self.offload_bytes = int(offload_bytes)
+        self._pool_lock = threading.Lock()
+        self._pool_policy: Tuple[str, bytes] = ("", b"")
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_workers: List[multiprocessing.process.BaseProcess] = []
+        if self.processes > 0:
+            self._pool, self._pool_workers = self._start_pool()
+
+    # Current policy and its settings (read-only views)
+    @property
+    def policy(self) -> SafetyPolicy:
+        return self._policy
+
+    @property
+    def policy_version(self) -> str:
+        return self._policy.version
+
+    @property
+    def policy_fingerprint(self) -> str:
+        return self._policy.fingerprint
+
+    @property
+    def THRESHOLD_BYTES(self) -> int:
+        return self._policy.threshold_bytes
+
+    @property
+    def MAX_IMPORTS(self) -> int:
+        return self._policy.max_imports
+
+    @property
+    def limits(self) -> PreGateLimits:
+        return self._policy.limits
 
     # Public API
-    def check(self, code: str, language: str) -> bool:
-        self.reasons.clear()
+    def check(self, code: str, language: str) -> Verdict:
+        self._maybe_reload()
+        policy = self._policy
         lang = language.lower().strip()
+        rejected = self._pre_gate(code, lang, policy)
+        if rejected is not None:
+            return rejected
+        key = self._cache_key(code, lang, policy)
+        if key is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+        if self.processes > 0 and isinstance(code, str) and len(code) >= self.offload_bytes:
+            verdict = self._run_on_pool([(code, lang)], policy)[0]
+        else:
+            verdict = self._run_timed(code, lang, policy)
+        self._latency.observe(verdict.elapsed, verdict.timed_out)
+        # a timeout says more about load than about the code: do not cache it
+        if key is not None and not verdict.timed_out:
+            self._cache.put(key, verdict)
+        return verdict
 
-        if lang == "python":
-            return self._check_python(code)
-        if lang in {"js", "javascript"}:
-            return self._check_javascript(code)
-        if lang == "c":
-            return self._check_c(code)
-        if lang == "go":
-            return self._check_go(code)
-        if lang == "java":
-            return self._check_java(code)
+    def check_many(self, items: Iterable[Tuple[str, str]]) -> List[Verdict]:
+        """
+        Check many (code, language) pairs and return one Verdict per pair, in
+        order. Cache hits are answered in-process; the misses are spread over
+        the process pool when `processes` > 0, otherwise checked inline.
+        The whole batch is checked against one policy.
+        """
+        self._maybe_reload()
+        policy = self._policy
+        verdicts: List[Optional[Verdict]] = []
+        pending: List[Tuple[int, str, str, Optional[tuple]]] = []
+        for code, language in items:
+            lang = language.lower().strip()
+            rejected = self._pre_gate(code, lang, policy)
+            if rejected is not None:
+                verdicts.append(rejected)
+                continue
+            key = self._cache_key(code, lang, policy)
+            cached = self._cache.get(key) if key is not None else None
+            if cached is not None:
+                verdicts.append(cached)
+            else:
+                pending.append((len(verdicts), code, lang, key))
+                verdicts.append(None)
 
-        self.reasons.append(f"Unsupported language: {lang}")
-        return False
+        if self.processes > 0 and len(pending) > 1:
+            fresh = self._run_on_pool([(code, lang) for _, code, lang, _ in pending], policy)
+        else:
+            fresh = [self._run_timed(code, lang, policy) for _, code, lang, _ in pending]
 
-    def reason(self) -> str:
-        return "; ".join(self.reasons) if self.reasons else "Safe to execute."
+        for (index, _, _, key), verdict in zip(pending, fresh):
+            verdicts[index] = verdict
+            self._latency.observe(verdict.elapsed, verdict.timed_out)
+            if key is not None and not verdict.timed_out:
+                self._cache.put(key, verdict)
+        return verdicts
+
+    def reload_policy(self) -> bool:
+        """
+        Re-read `policy_path` now. Returns True when a different policy was
+        swapped in. A missing or invalid file keeps the current policy.
+        """
+        if self.policy_path is None:
+            return False
+        with self._reload_lock:
+            return self._reload_locked()
+
+    def set_policy(self, policy: SafetyPolicy) -> None:
+        """Swap in `policy` (constructor overrides still apply)."""
+        self._policy = self._apply_overrides(policy)
+
+    def pregate_stats(self) -> Dict[str, int]:
+        """Number of submissions rejected by each pre-gate rule."""
+        with self._pregate_lock:
+            return dict(self._pregate_rejections)
 
-    # ----- numeric evaluator for literal/expression sizes -----
-    def _safe_eval_numeric_expr(self, expr: str) -> Optional[int]:
+    def latency_stats(self) -> Dict[str, object]:
+        """Latency histogram of uncached checks, with timeouts and the budget itself."""
+        return self._latency.stats()
+
+    def rule_stats(self) -> Dict[str, Dict[str, Dict[str, int]]]:
         """
-        Safely evaluate numeric expressions consisting only of literals and allowed operators.
-        Returns int value or None if expression is not statically evaluable / safe.
+        Per-language, per-rule counters: {language: {rule: {"calls", "hits", "ns"}}}.
+        "pregate" counts every check; the other stages only uncached ones.
+        Counts from pool processes are included once their checks return.
         """
-        cleaned = re.sub(r'(?i)(?<=\d)[uUlL]+', '', expr)  # strip integer suffixes
-        cleaned = cleaned.replace("_", "")
+        return self._rule_stats.snapshot()
+
+    def rule_stats_prometheus(self, prefix: str = "safety_checker") -> str:
+        """rule_stats() in the Prometheus text exposition format."""
+        return _prometheus_text(self._rule_stats.snapshot(), prefix)
+
+    def cache_stats(self) -> Dict[str, float]:
+        """Hit/miss/eviction counters of the verdict cache (empty when disabled)."""
+        return self._cache.stats() if self._cache is not None else {}
+
+    def clear_cache(self) -> None:
+        if self._cache is not None:
+            self._cache.clear()
+
+    def close(self) -> None:
+        """Shut down the process pool, if one was started."""
+        with self._pool_lock:
+            pool, self._pool, self._pool_workers = self._pool, None, []
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _apply_overrides(self, policy: SafetyPolicy) -> SafetyPolicy:
+        if all(v is None for v in self._overrides.values()):
+            return policy
+        return policy.with_overrides(**self._overrides)
+
+    def _maybe_reload(self) -> None:
+        """Reload the policy file if its mtime changed; stats it at most every reload_interval seconds."""
+        if self.policy_path is None or self.reload_interval <= 0:
+            return
+        if time.monotonic() < self._next_reload_check:
+            return
+        if not self._reload_lock.acquire(blocking=False):
+            return  # another thread is already reloading
         try:
-            node = ast.parse(cleaned, mode="eval").body
-        except Exception:
+            self._reload_locked()
+        finally:
+            self._reload_lock.release()
+
+    def _reload_locked(self) -> bool:
+        self._next_reload_check = time.monotonic() + self.reload_interval
+        current = self._policy
+        try:
+            mtime = os.stat(self.policy_path).st_mtime_ns
+        except OSError as e:
+            print(f"Policy file unavailable, keeping {current.version}: {e}")
+            return False
+        if mtime == self._policy_mtime:
+            return False
+        # remember the mtime even if loading fails, so a broken file is
+        # reported once rather than on every check
+        self._policy_mtime = mtime
+        try:
+            policy = self._apply_overrides(SafetyPolicy.from_file(self.policy_path))
+        except (OSError, ValueError) as e:
+            print(f"Policy reload failed, keeping {current.version}: {e}")
+            return False
+        if policy.version == current.version:
+            return False
+        self._policy = policy
+        print(f"Safety policy reloaded: {current.version} -> {policy.version}")
+        return True
+
+    def _cache_key(self, code: str, lang: str, policy: SafetyPolicy) -> Optional[tuple]:
+        if self._cache is None or not isinstance(code, str):
             return None
+        return lang, hashlib.sha256(code.encode("utf-8", "surrogatepass")).hexdigest(), policy.version
 
-        def _eval(n):
-            if isinstance(n, ast.Constant) and isinstance(n.value, int):
-                return n.value
-            if isinstance(n, ast.Num):
-                return n.n
-            if isinstance(n, ast.BinOp):
-                l = _eval(n.left)
-                r = _eval(n.right)
-                if l is None or r is None:
-                    raise ValueError
-                if isinstance(n.op, ast.Add):
-                    return l + r
-                if isinstance(n.op, ast.Sub):
-                    return l - r
-                if isinstance(n.op, ast.Mult):
-                    return l * r
-                if isinstance(n.op, (ast.Div, ast.FloorDiv)):
-                    if r == 0:
-                        raise ValueError
-                    return l // r
-                if isinstance(n.op, ast.Mod):
-                    return l % r
-                if isinstance(n.op, ast.LShift):
-                    return l << r
-                if isinstance(n.op, ast.RShift):
-                    return l >> r
-                if isinstance(n.op, ast.Pow):
-                    if r > 64:
-                        raise ValueError
-                    return l ** r
-                raise ValueError
-            if isinstance(n, ast.UnaryOp) and isinstance(n.op, (ast.UAdd, ast.USub)):
-                v = _eval(n.operand)
-                return +v if isinstance(n.op, ast.UAdd) else -v
+    def _pre_gate(self, code: str, lang: str, policy: SafetyPolicy) -> Optional[Verdict]:
+        """Reject oversized or pathologically shaped code before parsing or hashing it."""
+        if not isinstance(code, str):
             return None
+        start = time.perf_counter_ns()
+        hit = policy.limits.check(code, lang)
+        spent = time.perf_counter_ns() - start
+        if hit is None:
+            self._rule_stats.add(_stats_language(lang), {"pregate": [1, 0, spent]})
+            return None
+        rule, reason = hit
+        self._rule_stats.add(_stats_language(lang), {"pregate": [1, 0, spent], rule: [0, 1, 0]})
+        with self._pregate_lock:
+            self._pregate_rejections[rule] = self._pregate_rejections.get(rule, 0) + 1
+        return Verdict(False, (reason,), rule, spent / 1e9, policy.version)
 
+    def _run(self, code: str, lang: str, policy: SafetyPolicy) -> Verdict:
+        start = time.perf_counter()
+        deadline = start + self.time_budget if self.time_budget > 0 else float("inf")
+        clock = _StageClock()
         try:
-            val = _eval(node)
-            return val if isinstance(val, int) else None
-        except Exception:
-            return None
+            hit = self._check_uncached(code, lang, policy, deadline, clock)
+        except _CheckTimeout:
+            self._rule_stats.add(_stats_language(lang), clock.finish(TIMEOUT_RULE))
+            return self._timeout_verdict(policy, time.perf_counter() - start)
+        elapsed = time.perf_counter() - start
+        self._rule_stats.add(_stats_language(lang), clock.finish(None if hit is None else hit[0]))
+        if hit is None:
+            return Verdict(True, elapsed=elapsed, policy_version=policy.version)
+        rule, reason = hit
+        return Verdict(False, (reason,), rule, elapsed, policy.version)
+
+    def _run_timed(self, code: str, lang: str, policy: SafetyPolicy) -> Verdict:
+        """
+        _run under a real-time alarm where one is available, so the budget also
+        interrupts a single long regex or parser call, which the cooperative
+        deadline checks inside _run cannot.
+        """
+        if self.time_budget <= 0 or not _alarm_available():
+            return self._run(code, lang, policy)
+        previous = signal.signal(signal.SIGALRM, _alarm)
+        start = time.perf_counter()
+        try:
+            signal.setitimer(signal.ITIMER_REAL, self.time_budget)
+            try:
+                return self._run(code, lang, policy)
+            finally:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+        except _CheckTimeout:
+            # the alarm went off outside the stages _run guards
+            self._rule_stats.add(_stats_language(lang), {TIMEOUT_RULE: [0, 1, 0]})
+            return self._timeout_verdict(policy, time.perf_counter() - start)
+        finally:
+            signal.signal(signal.SIGALRM, previous)
 
-    def _is_value_too_large(self, expr: str) -> bool:
-        v = self._safe_eval_numeric_expr(expr)
-        return v is not None and v >= self.THRESHOLD_BYTES
+    def _timeout_verdict(self, policy: SafetyPolicy, elapsed: float) -> Verdict:
+        reason = f"Safety check timed out (budget {self.time_budget:g}s)."
+        return Verdict(False, (reason,), TIMEOUT_RULE, elapsed, policy.version)
+
+    def _start_pool(self) -> Tuple[ProcessPoolExecutor, List[multiprocessing.process.BaseProcess]]:
+        """A started pool and its worker processes, kept to kill them if one gets stuck."""
+        # fork: the worker scripts start Kafka/RabbitMQ clients at import
+        # time, so spawn/forkserver children would re-run them.
+        before = set(multiprocessing.active_children())
+        pool = ProcessPoolExecutor(
+            max_workers=self.processes,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_pool_init,
+            initargs=(self.time_budget,),
+        )
+        # a fork pool starts all its processes on the first submit, and
+        # never replaces them
+        pool.submit(int).result()
+        return pool, [proc for proc in multiprocessing.active_children() if proc not in before]
+
+    def _policy_blob(self, policy: SafetyPolicy) -> Tuple[str, bytes]:
+        """(version, pickled policy) for the pool tasks; pickled once per version."""
+        blob = self._pool_policy
+        if blob[0] != policy.version:
+            blob = self._pool_policy = (policy.version, pickle.dumps(policy))
+        return blob
+
+    def _run_on_pool(self, items: List[Tuple[str, str]], policy: SafetyPolicy) -> List[Verdict]:
+        codes = [code for code, _ in items]
+        langs = [lang for _, lang in items]
+        chunksize = max(1, len(items) // (4 * self.processes))
+        timeout = None
+        if self.time_budget > 0:
+            # Pool processes enforce the budget themselves; this backstop only
+            # fires if one is stuck where the alarm cannot reach. It is generous
+            # because other threads' checks may be queued ahead of ours.
+            rounds = -(-len(items) // self.processes)
+            timeout = self.time_budget * (4 * rounds + 1) + 1.0
+        verdicts: List[Verdict] = []
+        pool = self._pool
+        if pool is None:
+            return [self._run_timed(code, lang, policy) for code, lang in items]
+        try:
+            for verdict, counts in pool.map(partial(_pool_check, *self._policy_blob(policy)),
+                                            codes, langs, chunksize=chunksize, timeout=timeout):
+                verdicts.append(verdict)
+                for lang, times in counts:
+                    self._rule_stats.add(lang, times)
+        except BrokenProcessPool:
+            # a pool process died (OOM kill, ...): finish this call inline
+            print("Safety check pool broken; starting a new one")
+            self._replace_pool(pool, kill=False)
+            return verdicts + [self._run_timed(code, lang, policy) for code, lang in items[len(verdicts):]]
+        except FutureTimeoutError:
+            print("Safety check pool stuck; starting a new one")
+            self._replace_pool(pool, kill=True)
+            stuck = self._timeout_verdict(policy, timeout)
+            for lang in langs[len(verdicts):]:
+                self._rule_stats.add(_stats_language(lang), {TIMEOUT_RULE: [0, 1, 0]})
+            return verdicts + [stuck] * (len(items) - len(verdicts))
+        return verdicts
+
+    def _replace_pool(self, lost: ProcessPoolExecutor, kill: bool) -> None:
+        """
+        Swap a broken or stuck pool for a new one. `kill` ends the old workers
+        first (shutdown() alone would wait for a stuck one forever). A no-op
+        when another thread already replaced the pool or close() dropped it.
+        """
+        with self._pool_lock:
+            if self._pool is not lost:
+                return
+            if kill:
+                for proc in self._pool_workers:
+                    proc.kill()
+            lost.shutdown(wait=False, cancel_futures=True)
+            self._pool, self._pool_workers = None, []
+            try:
+                self._pool, self._pool_workers = self._start_pool()
+            except OSError as e:
+                print(f"Safety check pool could not be restarted, checking inline: {e}")
+
+    def _check_uncached(self, code: str, lang: str, policy: SafetyPolicy, deadline: float,
+                        clock: _StageClock) -> _Hit:
+        if lang == "python":
+            return self._check_python(code, policy, deadline, clock)
+        if lang in {"js", "javascript"}:
+            return self._check_javascript(code, policy, deadline, clock)
+        if lang == "c":
+            return self._check_c(code, policy, deadline, clock)
+        if lang == "go":
+            return self._check_go(code, policy, deadline, clock)
+        if lang == "java":
+            return self._check_java(code, policy, deadline, clock)
+
+        return "language.unsupported", f"Unsupported language: {lang}"
+
+    def _endless_loop(self, code: str, lang: str, rule_prefix: str, deadline: float, clock: _StageClock) -> _Hit:
+        """Runs after every safety rule, so a will-time-out verdict means the code is otherwise safe."""
+        clock.enter(f"{rule_prefix}.{INFINITE_LOOP_RULE}")
+        found = _find_endless_loop(code, lang, deadline)
+        if found is None:
+            return None
+        line, header = found
+        return _endless_loop_hit(header, line, rule_prefix)
 
     # ---------------- Python ----------------
-    def _check_python(self, code: str) -> bool:
+    _PY_BLOCKED_BUILTINS = frozenset({"open", "exec", "eval", "__import__", "compile", "input"})
+    # counter names of the AST handlers, by the slot in _py_dispatch
+    _PY_HANDLER_STAGES = ("python.import", "python.module_access", "python.builtin", "python.alloc",
+                          "python.infinite_loop")
+
+    def _check_python(self, code: str, policy: SafetyPolicy, deadline: float, clock: _StageClock) -> _Hit:
+        clock.enter("python.syntax")
         try:
             tree = ast.parse(code)
         except Exception:
-            self.reasons.append("Invalid Python syntax.")
-            return False
+            return "python.syntax", "Invalid Python syntax."
 
-        imports_found: Set[str] = set()
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    root = alias.name.split(".")[0]
-                    imports_found.add(root)
-                    if root in self._disallowed_python_modules:
-                        self.reasons.append(f"Import of disallowed module '{alias.name}'.")
-                        return False
-                    if root not in self._allowed_python_modules:
-                        self.reasons.append(f"Import of module '{alias.name}' not allowed by whitelist.")
-                        return False
-
-            if isinstance(node, ast.ImportFrom):
-                mod = node.module or ""
-                if not mod:
-                    self.reasons.append("Relative imports are not allowed.")
-                    return False
-                root = mod.split(".")[0]
-                imports_found.add(root)
-                if root in self._disallowed_python_modules:
-                    self.reasons.append(f"Import from disallowed module '{mod}'.")
-                    return False
-                if root not in self._allowed_python_modules:
-                    self.reasons.append(f"Import from module '{mod}' not allowed by whitelist.")
-                    return False
-
-            # disallow attribute access on disallowed modules (e.g., os.system)
-            if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
-                if node.value.id in self._disallowed_python_modules:
-                    self.reasons.append(f"Access to module '{node.value.id}' is not allowed.")
-                    return False
-
-            # block dangerous builtins
-            if isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Name) and node.func.id in {
-                    "open",
-                    "exec",
-                    "eval",
-                    "__import__",
-                    "compile",
-                    "input",
-                }:
-                    self.reasons.append(f"Use of builtin '{node.func.id}' not allowed.")
-                    return False
-
-                # detect large bytearray/bytes allocations: bytearray(N)/bytes(N)
-                if isinstance(node.func, ast.Name) and node.func.id in {"bytearray", "bytes"} and node.args:
-                    arg = node.args[0]
-                    if isinstance(arg, (ast.Constant, ast.Num)) and isinstance(getattr(arg, "n", getattr(arg, "value", None)), int):
-                        val = arg.n if hasattr(arg, "n") else arg.value
-                        if val >= self.THRESHOLD_BYTES:
-                            self.reasons.append(f"Large allocation request: {node.func.id}({val}) >= threshold")
-                            return False
-                    else:
-                        seg = ast.get_source_segment(code, arg) or ""
-                        if seg and self._is_value_too_large(seg):
-                            self.reasons.append(f"Large allocation expression in Python: {seg}")
-                            return False
-
-                # list(range(N)) detection
-                if isinstance(node.func, ast.Name) and node.func.id == "list" and node.args:
-                    inner = node.args[0]
-                    if isinstance(inner, ast.Call) and isinstance(inner.func, ast.Name) and inner.func.id == "range":
-                        if inner.args:
-                            seg = ast.get_source_segment(code, inner.args[0]) or ""
-                            if seg and self._is_value_too_large(seg):
-                                self.reasons.append(f"Large list(range(...)) requested: {seg}")
-                                return False
-
-            # list * N multiplication
-            if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Mult):
-                left, right = node.left, node.right
-                for lit in (left, right):
-                    other = right if lit is left else left
-                    if isinstance(lit, (ast.Constant, ast.Num)) and isinstance(getattr(lit, "n", getattr(lit, "value", None)), int):
-                        val = lit.n if hasattr(lit, "n") else lit.value
-                        if val >= self.THRESHOLD_BYTES:
-                            self.reasons.append(f"Large list multiplication in Python: multiplier {val} >= threshold")
-                            return False
-                    elif isinstance(other, (ast.List, ast.Tuple)) and isinstance(lit, ast.Call):
-                        seg = ast.get_source_segment(code, lit) or ""
-                        if seg and self._is_value_too_large(seg):
-                            self.reasons.append(f"Large list multiplication expression: {seg}")
-                            return False
-
-        if len(imports_found) > self.MAX_IMPORTS:
-            self.reasons.append(f"Too many distinct imports in Python ({len(imports_found)} > {self.MAX_IMPORTS}).")
-            return False
+        clock.enter("python.walk")
+        src = _SourceIndex(code)
+        scan = _PyScan(tree, src, policy, _Sizes(policy.threshold_bytes, lambda: _python_constants(tree, src)))
+        dispatch = self._py_dispatch
+        spent = [0] * len(self._PY_HANDLER_STAGES)
+        calls = [0] * len(self._PY_HANDLER_STAGES)
+        now = time.perf_counter_ns
 
-        return True
+        _check_deadline(deadline)
+        # breadth-first like ast.walk, so the first violation reported is unchanged
+        todo = deque([tree])
+        visited = 0
+        try:
+            while todo:
+                node = todo.popleft()
+                visited += 1
+                if not visited & 0x3FF:
+                    _check_deadline(deadline)
+                entry = dispatch.get(type(node))
+                if entry is not None:
+                    handler, slot = entry
+                    t0 = now()
+                    hit = handler(node, scan)
+                    spent[slot] += now() - t0
+                    calls[slot] += 1
+                    if hit is not None:
+                        return hit
+                todo.extend(ast.iter_child_nodes(node))
+        finally:
+            # handler time is booked to the handler's rule, not to the walk
+            for stage, n, ns in zip(self._PY_HANDLER_STAGES, calls, spent):
+                if n:
+                    clock.nested(stage, n, ns)
+
+        imports_found = scan.imports_found
+        if len(imports_found) > policy.max_imports:
+            return "python.import_count", f"Too many distinct imports in Python ({len(imports_found)} > {policy.max_imports})."
+
+        return scan.endless_loop
+
+    def _py_import(self, node: ast.Import, scan: "_PyScan") -> _Hit:
+        policy = scan.policy
+        for alias in node.names:
+            root = alias.name.split(".")[0]
+            scan.imports_found.add(root)
+            if root in policy.python_disallowed:
+                return "python.import", f"Import of disallowed module '{alias.name}'."
+            if root not in policy.python_allowed:
+                return "python.import", f"Import of module '{alias.name}' not allowed by whitelist."
+        return None
+
+    def _py_import_from(self, node: ast.ImportFrom, scan: "_PyScan") -> _Hit:
+        mod = node.module or ""
+        if not mod:
+            return "python.import", "Relative imports are not allowed."
+        root = mod.split(".")[0]
+        scan.imports_found.add(root)
+        if root in scan.policy.python_disallowed:
+            return "python.import", f"Import from disallowed module '{mod}'."
+        if root not in scan.policy.python_allowed:
+            return "python.import", f"Import from module '{mod}' not allowed by whitelist."
+        return None
+
+    def _py_attribute(self, node: ast.Attribute, scan: "_PyScan") -> _Hit:
+        # disallow attribute access on disallowed modules (e.g., os.system)
+        if isinstance(node.value, ast.Name) and node.value.id in scan.policy.python_disallowed:
+            return "python.module_access", f"Access to module '{node.value.id}' is not allowed."
+        return None
+
+    def _py_call(self, node: ast.Call, scan: "_PyScan") -> _Hit:
+        func = node.func
+        if not isinstance(func, ast.Name):
+            return None
+        name = func.id
+
+        # block dangerous builtins
+        if name in self._PY_BLOCKED_BUILTINS:
+            return "python.builtin", f"Use of builtin '{name}' not allowed."
+
+        # detect large bytearray/bytes allocations: bytearray(N)/bytes(N)
+        if name in ("bytearray", "bytes") and node.args:
+            arg = node.args[0]
+            if isinstance(arg, ast.Constant) and isinstance(arg.value, int):
+                if arg.value >= scan.policy.threshold_bytes:
+                    return "python.alloc", f"Large allocation request: {name}({arg.value}) >= threshold"
+            else:
+                seg = scan.src.segment(arg)
+                if seg and scan.sizes.too_large(seg):
+                    return "python.alloc", f"Large allocation expression in Python: {seg}"
+
+        # list(range(N)) detection
+        elif name == "list" and node.args:
+            inner = node.args[0]
+            if (isinstance(inner, ast.Call) and isinstance(inner.func, ast.Name)
+                    and inner.func.id == "range" and inner.args):
+                seg = scan.src.segment(inner.args[0])
+                if seg and scan.sizes.too_large(seg):
+                    return "python.alloc", f"Large list(range(...)) requested: {seg}"
+        return None
+
+    def _py_binop(self, node: ast.BinOp, scan: "_PyScan") -> _Hit:
+        # list * N multiplication
+        if not isinstance(node.op, ast.Mult):
+            return None
+        left, right = node.left, node.right
+        for lit, other in ((left, right), (right, left)):
+            if isinstance(lit, ast.Constant) and isinstance(lit.value, int):
+                if lit.value >= scan.policy.threshold_bytes:
+                    return "python.alloc", f"Large list multiplication in Python: multiplier {lit.value} >= threshold"
+            elif isinstance(other, (ast.List, ast.Tuple)) and isinstance(lit, (ast.Call, ast.Name, ast.BinOp)):
+                seg = scan.src.segment(lit)
+                if seg and scan.sizes.too_large(seg):
+                    return "python.alloc", f"Large list multiplication expression: {seg}"
+        return None
+
+    def _py_while(self, node: ast.While, scan: "_PyScan") -> _Hit:
+        # recorded rather than returned, so a safety rule found later in the walk still wins
+        test = node.test
+        if (scan.endless_loop is None and isinstance(test, ast.Constant) and test.value
+                and not _py_loop_escapes(node)):
+            scan.endless_loop = _endless_loop_hit(f"while {scan.src.segment(test)}:", node.lineno, "python")
+        return None
 
     # ---------------- JavaScript ----------------
-    def _check_javascript(self, code: str) -> bool:
-        imports = re.findall(r'^\s*import\s+(?:.+\s+from\s+)?[\'"]([^\'"]+)[\'"]', code, flags=re.M)
-        requires = re.findall(r'require\s*\(\s*[\'"]([^\'"]+)[\'"]\s*\)', code)
+    def _check_javascript(self, code: str, policy: SafetyPolicy, deadline: float, clock: _StageClock) -> _Hit:
+        clock.enter("js.lex")
+        src = lex(code, "javascript")
+        _check_deadline(deadline)
+        clock.enter("js.import")
+        imports = _JS_IMPORT_RE.findall(src.text)
+        requires = _JS_REQUIRE_RE.findall(src.text)
         all_targets = set(imports + requires)
 
         # count non-relative imports
         nonlocal_imports = [t for t in all_targets if not (t.startswith(".") or t.startswith("/"))]
-        if len(nonlocal_imports) > self.MAX_IMPORTS:
-            self.reasons.append(f"Too many non-local JS imports ({len(nonlocal_imports)} > {self.MAX_IMPORTS}).")
-            return False
+        if len(nonlocal_imports) > policy.max_imports:
+            return "js.import_count", f"Too many non-local JS imports ({len(nonlocal_imports)} > {policy.max_imports})."
 
         for target in all_targets:
             if target.startswith(".") or target.startswith("/"):
                 continue
-            if target in self._allowed_js_bare_modules:
+            if target in policy.js_allowed_bare:
                 continue
-            if target in self._disallowed_js_modules:
-                self.reasons.append(f"JS import/require disallowed target '{target}'.")
-                return False
-            self.reasons.append(f"JS import/require target '{target}' not allowed.")
-            return False
+            if target in policy.js_disallowed:
+                return "js.import", f"JS import/require disallowed target '{target}'."
+            return "js.import", f"JS import/require target '{target}' not allowed."
 
         # block known process/fs/child_process usage and large allocation APIs
-        forbidden_patterns = [
-            r'\bprocess\b',
-            r'\bfs\b',
-            r'\bchild_process\b',
-            r'\bexecSync\b',
-            r'Buffer\.alloc\s*\(',
-            r'new\s+Array\s*\(',
-            r'Uint8Array\s*\(',
-            r'Int8Array\s*\(',
-        ]
-        for p in forbidden_patterns:
-            if re.search(p, code):
-                # handle Buffer.alloc/new Array size checks
-                if "Buffer.alloc" in p or "new\s+Array" in p or "Uint8Array" in p:
-                    m = re.search(r'Buffer\.alloc\s*\(\s*([^\)]+)\)', code)
-                    if m and self._is_value_too_large(m.group(1)):
-                        self.reasons.append(f"Large JS allocation detected: Buffer.alloc({m.group(1)})")
-                        return False
-                    m2 = re.search(r'new\s+Array\s*\(\s*([^\)]+)\)', code)
-                    if m2 and self._is_value_too_large(m2.group(1)):
-                        self.reasons.append(f"Large JS allocation detected: new Array({m2.group(1)})")
-                        return False
-                self.reasons.append(f"Blocked JS pattern: {p}")
-                return False
+        _check_deadline(deadline)
+        clock.enter("js.forbidden")
+        p = policy.js_forbidden.first_match(src.code)
+        if p is not None:
+            # handle Buffer.alloc/new Array size checks
+            if p in _JS_SIZED_ALLOC_PATTERNS:
+                _check_deadline(deadline)
+                clock.enter("js.alloc")
+                sizes = _Sizes(policy.threshold_bytes, partial(_js_constants, src.code))
+                m = _JS_BUFFER_ALLOC_RE.search(src.code)
+                if m and sizes.too_large(m.group(1)):
+                    return "js.alloc", f"Large JS allocation detected: Buffer.alloc({m.group(1)})"
+                m2 = _JS_NEW_ARRAY_RE.search(src.code)
+                if m2 and sizes.too_large(m2.group(1)):
+                    return "js.alloc", f"Large JS allocation detected: new Array({m2.group(1)})"
+            return "js.forbidden", f"Blocked JS pattern: {p}"
 
-        return True
+        return self._endless_loop(src.code, "javascript", "js", deadline, clock)
 
     # ---------------- C ----------------
-    def _check_c(self, code: str) -> bool:
-        includes = re.findall(r'#\s*include\s*[<"]([^>"]+)[>"]', code)
-        if len(includes) > self.MAX_IMPORTS:
-            self.reasons.append(f"Too many C includes ({len(includes)} > {self.MAX_IMPORTS}).")
-            return False
+    def _check_c(self, code: str, policy: SafetyPolicy, deadline: float, clock: _StageClock) -> _Hit:
+        clock.enter("c.lex")
+        src = lex(code, "c")
+        _check_deadline(deadline)
+        clock.enter("c.include")
+        includes = _C_INCLUDE_RE.findall(src.text)
+        if len(includes) > policy.max_imports:
+            return "c.include_count", f"Too many C includes ({len(includes)} > {policy.max_imports})."
         for header in includes:
-            if header not in self._allowed_c_headers:
-                self.reasons.append(f"C header not allowed: {header}")
-                return False
-
-        blocked_funcs = [
-            r"\bsystem\s*\(",
-            r"\bfork\s*\(",
-            r"\bexec(?:ve|vp|v)?\b",
-            r"\bpopen\s*\(",
-            r"\bunlink\s*\(",
-            r"\bchmod\s*\(",
-            r"\bfopen\s*\(",
-            r"\bopen\s*\(",
-        ]
-        for p in blocked_funcs:
-            if re.search(p, code):
-                self.reasons.append(f"Blocked function/pattern in C: {p}")
-                return False
+            if header not in policy.c_allowed_headers:
+                return "c.include", f"C header not allowed: {header}"
+
+        _check_deadline(deadline)
+        clock.enter("c.blocked_call")
+        p = policy.c_blocked.first_match(src.code)
+        if p is not None:
+            return "c.blocked_call", f"Blocked function/pattern in C: {p}"
 
         # detect malloc/calloc/realloc large requests
-        alloc_patterns = [
-            r'\bmalloc\s*\(\s*([^\)]+)\)',
-            r'\bcalloc\s*\(\s*([^\),]+)\s*,\s*([^\)]+)\)',
-            r'\brealloc\s*\(\s*[^,]+,\s*([^\)]+)\)',
-        ]
-        for pat in alloc_patterns:
-            for m in re.finditer(pat, code):
-                for grp in m.groups():
-                    if not grp:
-                        continue
-                    if self._is_value_too_large(grp):
-                        self.reasons.append(f"C allocation too large: {m.group(0)}")
-                        return False
+        clock.enter("c.alloc")
+        sizes = _Sizes(policy.threshold_bytes, partial(_c_constants, src.code), prepare=_c_sizeof)
+        for rx in _C_ALLOC_RES:
+            for m in rx.finditer(src.code):
+                _check_deadline(deadline)
+                values = [sizes.value(grp) for grp in m.groups() if grp]
+                if any(v is not None and v >= sizes.threshold for v in values):
+                    return "c.alloc", f"C allocation too large: {m.group(0)}"
+                # calloc(count, size): the product is what gets allocated
+                if len(values) == 2 and None not in values and values[0] * values[1] >= sizes.threshold:
+                    return "c.alloc", f"C allocation too large: {m.group(0)}"
 
         # static arrays like int buf[N];
-        static_arrs = re.findall(r'\b[a-zA-Z_]\w*\s+[a-zA-Z_]\w*\s*\[\s*([^\]]+)\s*\]\s*;', code)
-        for expr in static_arrs:
-            if self._is_value_too_large(expr):
-                self.reasons.append(f"Static array allocation too large: [{expr}]")
-                return False
+        clock.enter("c.static_array")
+        for m in _C_STATIC_ARRAY_RE.finditer(src.code):
+            _check_deadline(deadline)
+            expr = m.group(1)
+            if sizes.too_large(expr):
+                return "c.static_array", f"Static array allocation too large: [{expr}]"
 
-        return True
+        return self._endless_loop(src.code, "c", "c", deadline, clock)
 
     # ---------------- Go ----------------
-    def _check_go(self, code: str) -> bool:
-        single_imports = re.findall(r'(?m)^\s*import\s+"([^"]+)"', code)
-        block_matches = re.findall(r'import\s*\(\s*([\s\S]*?)\s*\)', code)
+    def _check_go(self, code: str, policy: SafetyPolicy, deadline: float, clock: _StageClock) -> _Hit:
+        clock.enter("go.lex")
+        src = lex(code, "go")
+        _check_deadline(deadline)
+        clock.enter("go.import")
+        single_imports = _GO_SINGLE_IMPORT_RE.findall(src.text)
+        block_matches = _GO_BLOCK_IMPORT_RE.findall(src.text)
         block_imports = []
         for bm in block_matches:
-            block_imports += re.findall(r'"([^"]+)"', bm)
-        aliased = re.findall(r'(?m)^\s*import\s+[\w_]+\s+"([^"]+)"', code)
+            block_imports += _GO_QUOTED_RE.findall(bm)
+        aliased = _GO_ALIASED_IMPORT_RE.findall(src.text)
         all_imports = set(single_imports + block_imports + aliased)
 
-        if len(all_imports) > self.MAX_IMPORTS:
-            self.reasons.append(f"Too many Go imports ({len(all_imports)} > {self.MAX_IMPORTS}).")
-            return False
+        if len(all_imports) > policy.max_imports:
+            return "go.import_count", f"Too many Go imports ({len(all_imports)} > {policy.max_imports})."
 
         for imp in all_imports:
             short = imp.split("/")[-1]
-            if short not in self._allowed_go_imports:
-                self.reasons.append(f"Go import not allowed: {imp}")
-                return False
+            if short not in policy.go_allowed:
+                return "go.import", f"Go import not allowed: {imp}"
             if short == "os":
-                self.reasons.append("Go 'os' package is disallowed.")
-                return False
-
-        suspicious_patterns = [
-            r'\bos\b',
-            r'\bexec\.Command\b',
-            r'\bsyscall\b',
-            r'\bnet\b',
-            r'\bruntime\b',
-            r'\bplugin\b',
-            r'\bunsafe\b',
-        ]
-        for p in suspicious_patterns:
-            if re.search(p, code):
-                self.reasons.append(f"Suspicious pattern in Go: {p}")
-                return False
+                return "go.import", "Go 'os' package is disallowed."
+
+        _check_deadline(deadline)
+        clock.enter("go.forbidden")
+        p = policy.go_suspicious.first_match(src.code)
+        if p is not None:
+            return "go.forbidden", f"Suspicious pattern in Go: {p}"
 
         # detect make([]T, N) allocations
-        for m in re.finditer(r'make\s*\(\s*\[\]\s*\w+\s*,\s*([^\),]+)', code):
+        clock.enter("go.alloc")
+        sizes = _Sizes(policy.threshold_bytes, partial(_go_constants, src.code))
+        for m in _GO_MAKE_SLICE_RE.finditer(src.code):
+            _check_deadline(deadline)
             expr = m.group(1)
-            if self._is_value_too_large(expr):
-                self.reasons.append(f"Large Go allocation detected: make(..., {expr})")
-                return False
+            if sizes.too_large(expr):
+                return "go.alloc", f"Large Go allocation detected: make(..., {expr})"
 
         # detect make with two args make([]byte, N) general pattern
-        for m in re.finditer(r'make\s*\(\s*[^,]+,\s*([^\),]+)', code):
+        for m in _GO_MAKE_RE.finditer(src.code):
+            _check_deadline(deadline)
             expr = m.group(1)
-            if self._is_value_too_large(expr):
-                self.reasons.append(f"Large Go allocation detected: make(..., {expr})")
-                return False
+            if sizes.too_large(expr):
+                return "go.alloc", f"Large Go allocation detected: make(..., {expr})"
 
-        return True
+        return self._endless_loop(src.code, "go", "go", deadline, clock)
 
     # ---------------- Java ----------------
-    def _check_java(self, code: str) -> bool:
-        imports = re.findall(r'^\s*import\s+([\w\.]+)(?:\.\*)?;', code, flags=re.M)
-        if len(imports) > self.MAX_IMPORTS:
-            self.reasons.append(f"Too many Java imports ({len(imports)} > {self.MAX_IMPORTS}).")
-            return False
+    def _check_java(self, code: str, policy: SafetyPolicy, deadline: float, clock: _StageClock) -> _Hit:
+        clock.enter("java.lex")
+        src = lex(code, "java")
+        _check_deadline(deadline)
+        clock.enter("java.import")
+        imports = _JAVA_IMPORT_RE.findall(src.text)
+        if len(imports) > policy.max_imports:
+            return "java.import_count", f"Too many Java imports ({len(imports)} > {policy.max_imports})."
 
         for imp in imports:
-            allowed = any(imp == prefix or imp.startswith(prefix + ".") for prefix in self._allowed_java_prefixes)
+            allowed = any(imp == prefix or imp.startswith(prefix + ".") for prefix in policy.java_allowed_prefixes)
             if not allowed:
                 if imp.startswith("java.io") or imp.startswith("java.net") or imp.startswith("java.nio"):
-                    self.reasons.append(f"Java import for filesystem/network not allowed: {imp}")
-                    return False
-                self.reasons.append(f"Java import not allowed: {imp}")
-                return False
-
-        forbidden_patterns = [
-            r"Runtime\.getRuntime",
-            r"ProcessBuilder",
-            r"System\.exit\s*\(",
-            r"java\.io",
-            r"java\.net",
-            r"java\.nio",
-            r"Files\.",
-            r"Paths\.",
-            r"FileInputStream",
-            r"FileOutputStream",
-        ]
-        for p in forbidden_patterns:
-            if re.search(p, code):
-                self.reasons.append(f"Blocked Java pattern: {p}")
-                return False
+                    return "java.import", f"Java import for filesystem/network not allowed: {imp}"
+                return "java.import", f"Java import not allowed: {imp}"
+
+        _check_deadline(deadline)
+        clock.enter("java.forbidden")
+        p = policy.java_forbidden.first_match(src.code)
+        if p is not None:
+            return "java.forbidden", f"Blocked Java pattern: {p}"
 
         # new byte[SIZE]
-        for m in re.finditer(r'new\s+byte\s*\[\s*([^\]]+)\s*\]', code):
+        clock.enter("java.alloc")
+        sizes = _Sizes(policy.threshold_bytes, partial(_java_constants, src.code))
+        for m in _JAVA_NEW_BYTES_RE.finditer(src.code):
+            _check_deadline(deadline)
             expr = m.group(1)
-            if self._is_value_too_large(expr):
-                self.reasons.append(f"Large Java byte[] allocation: new byte[{expr}]")
-                return False
+            if sizes.too_large(expr):
+                return "java.alloc", f"Large Java byte[] allocation: new byte[{expr}]"
 
         # ByteBuffer.allocate(N)
-        for m in re.finditer(r'ByteBuffer\.allocate\s*\(\s*([^\)]+)\)', code):
+        for m in _JAVA_BYTEBUFFER_RE.finditer(src.code):
+            _check_deadline(deadline)
             expr = m.group(1)
-            if self._is_value_too_large(expr):
-                self.reasons.append(f"Large ByteBuffer allocation: ByteBuffer.allocate({expr})")
-                return False
+            if sizes.too_large(expr):
+                return "java.alloc", f"Large ByteBuffer allocation: ByteBuffer.allocate({expr})"
 
-        return True
\ No newline at end of file
+        return self._endless_loop(src.code, "java", "java", deadline, clock)
\ No newline at end of file
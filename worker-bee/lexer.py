@@ -0,0 +1,205 @@
+"""
+lexer.py
+
+Comment- and literal-aware source views for the regex-based SafetyChecker
+languages (C, Java, Go, JavaScript).
+
+One linear pass over a submission produces two views of identical length and
+line layout:
+
+- `text`: comments blanked out, literals intact. Import/include rules run on
+  this view, so a commented-out `#include <unistd.h>` no longer counts.
+- `code`: comments blanked and the *contents* of string/char/regex literals
+  blanked (delimiters kept). Forbidden-identifier and allocation-size rules run
+  on this view, so `"process"` inside a JS string is not mistaken for code.
+
+Literals that are themselves looked up or executed by name stay visible in
+`code`: JS computed keys (`globalThis["process"]`) and arguments of
+`eval`/`Function`/`setTimeout`/`setInterval`, and every Java string (reflection
+via `Class.forName("...")`).
+
+Java `\\uXXXX` escapes are decoded first, as javac does before it parses, so
+`// \\u000a code` is code on a new line and not a comment. Both views are then
+laid out like the decoded source.
+
+Where a JS `/` after `)`, `]` or `}` could open a regex literal as well as be
+a division, the two readings split the rest of the source into different
+literals and comments. Rather than pick one, the lexer stops there and leaves
+the remainder unblanked in both views, so every rule sees it as written.
+
+Usage:
+    src = lex(code_string, "c")
+    includes = INCLUDE_RE.findall(src.text)
+    blocked = BLOCKED_RE.search(src.code)
+"""
+import re
+from typing import Dict, List, Pattern
+
+# Line and block comments are shared by every supported language; only the
+# literal forms differ. Branch order matters: text blocks before plain strings.
+_COMMENT = r'(?P<comment>//[^\n]*|/\*[\s\S]*?(?:\*/|\Z))'
+# A trailing lone backslash is allowed before the end of input, so an unclosed
+# literal always matches instead of backtracking from every later quote.
+_DQ_STRING = r'"(?:\\[\s\S]|[^"\\\n])*+\\?(?:"|(?=\n)|\Z)'
+_SQ_LITERAL = r"'(?:\\[\s\S]|[^'\\\n])*+\\?(?:'|(?=\n)|\Z)"
+
+_LEXERS: Dict[str, Pattern] = {
+    "c": re.compile(_COMMENT + r'|(?P<string>' + _DQ_STRING + '|' + _SQ_LITERAL + ')'),
+    "java": re.compile(_COMMENT + r'|(?P<string>"""[\s\S]*?(?:"""|\Z)|' + _DQ_STRING + '|' + _SQ_LITERAL + ')'),
+    "go": re.compile(_COMMENT + r'|(?P<string>`[^`]*(?:`|\Z)|' + _DQ_STRING + '|' + _SQ_LITERAL + ')'),
+    # Template literals are left as code: their ${...} parts are executable.
+    "javascript": re.compile(_COMMENT + r'|(?P<string>' + _DQ_STRING + '|' + _SQ_LITERAL + r')|(?P<slash>/)'),
+}
+# Characters that can open a comment or literal; a plain character-class search
+# skips ordinary code far faster than running the alternation at every offset.
+_TOKEN_STARTS: Dict[str, Pattern] = {
+    "c": re.compile(r'[/"\']'),
+    "java": re.compile(r'[/"\']'),
+    "go": re.compile(r'[/"\'`]'),
+    "javascript": re.compile(r'[/"\']'),
+}
+_LANGUAGE_ALIASES = {"js": "javascript"}
+
+# Languages whose string contents are blanked in the `code` view.
+_BLANK_STRINGS = frozenset({"c", "go", "javascript"})
+
+# A JS string right after one of these is a computed key or evaluated source.
+_JS_DYNAMIC_TAIL = re.compile(r'(?:\[|\b(?:eval|Function|setTimeout|setInterval)\s*\()\s*$')
+_JS_DYNAMIC_LOOKBEHIND = 48
+
+# JS `/` starts a regex literal (not a division) after these tokens.
+_JS_REGEX_PREV_CHARS = frozenset("(,=:[!&|?{};+-*%<>~^")
+_JS_REGEX_PREV_WORDS = frozenset({
+    "return", "typeof", "instanceof", "in", "of", "new", "delete", "void",
+    "throw", "case", "do", "else", "yield", "await",
+})
+_JS_REGEX_BODY = re.compile(r'/(?:\\.|\[(?:\\.|[^\]\\\n])*\]|[^/\\\n\[])+/[A-Za-z]*')
+_JS_PREV_WORD = re.compile(r'([A-Za-z_$][\w$]*)\s*$')
+# After these a `/` is a division unless the bracket closed an `if (...)`,
+# a block, ...: the reading cannot be told from the token alone.
+_JS_AMBIGUOUS_PREV_CHARS = frozenset(")]}")
+
+# A Java unicode escape: a backslash preceded by an even number of backslashes,
+# one or more `u`, four hex digits (JLS 3.3).
+_JAVA_UNICODE_ESCAPE = re.compile(r'(?<!\\)((?:\\\\)*)\\u+([0-9a-fA-F]{4})')
+
+
+def _blank(s: str) -> str:
+    """Spaces of the same length, keeping newlines so line numbers survive."""
+    if "\n" not in s:
+        return " " * len(s)
+    return "\n".join(" " * len(line) for line in s.split("\n"))
+
+
+def _blank_inner(tok: str) -> str:
+    """Blank a literal's contents but keep its delimiters."""
+    if tok.startswith('"""') and tok.endswith('"""') and len(tok) >= 6:
+        return '"""' + _blank(tok[3:-3]) + '"""'
+    closed = len(tok) >= 2 and tok[-1] == tok[0]
+    if closed:
+        return tok[0] + _blank(tok[1:-1]) + tok[-1]
+    return tok[0] + _blank(tok[1:])
+
+
+def _js_prev_token(parts: List[str]) -> str:
+    """The code emitted so far, up to the last non-blank chunk ("" at the start)."""
+    for chunk in reversed(parts):
+        stripped = chunk.rstrip()
+        if stripped:
+            return stripped
+    return ""
+
+
+def _js_regex_allowed(prev: str) -> bool:
+    """Decide whether a `/` after `prev` opens a regex literal."""
+    if not prev:
+        return True  # start of input
+    if prev[-1] in _JS_REGEX_PREV_CHARS:
+        return True
+    m = _JS_PREV_WORD.search(prev)
+    return bool(m) and m.group(1) in _JS_REGEX_PREV_WORDS
+
+
+def _decode_java_unicode(source: str) -> str:
+    """`source` with its `\\uXXXX` escapes replaced by the characters they encode."""
+    if "\\u" not in source:
+        return source
+    return _JAVA_UNICODE_ESCAPE.sub(lambda m: m.group(1) + chr(int(m.group(2), 16)), source)
+
+
+class LexedSource:
+    """The `text` (comments stripped) and `code` (literals blanked too) views."""
+
+    __slots__ = ("language", "text", "code")
+
+    def __init__(self, language: str, text: str, code: str):
+        self.language = language
+        self.text = text
+        self.code = code
+
+
+def lex(source: str, language: str) -> LexedSource:
+    """Produce both views of `source` in a single left-to-right pass."""
+    lang = _LANGUAGE_ALIASES.get(language, language)
+    rx = _LEXERS.get(lang)
+    if rx is None:
+        return LexedSource(lang, source, source)
+    if lang == "java":
+        source = _decode_java_unicode(source)
+
+    blank_strings = lang in _BLANK_STRINGS
+    is_js = lang == "javascript"
+    text_parts: List[str] = []
+    code_parts: List[str] = []
+    starts = _TOKEN_STARTS[lang]
+    pos = scan = 0
+    while True:
+        hit = starts.search(source, scan)
+        if hit is None:
+            break
+        m = rx.match(source, hit.start())
+        if m is None:  # e.g. a division sign in C
+            scan = hit.end()
+            continue
+        start, end = m.span()
+        if start > pos:
+            chunk = source[pos:start]
+            text_parts.append(chunk)
+            code_parts.append(chunk)
+        tok = m.group()
+        kind = m.lastgroup
+
+        if kind == "comment":
+            blank = _blank(tok)
+            text_parts.append(blank)
+            code_parts.append(blank)
+        elif kind == "string":
+            text_parts.append(tok)
+            keep = not blank_strings or (
+                is_js and _JS_DYNAMIC_TAIL.search(source, max(0, start - _JS_DYNAMIC_LOOKBEHIND), start)
+            )
+            code_parts.append(tok if keep else _blank_inner(tok))
+        else:  # a lone JS slash: division or regex literal
+            prev = _js_prev_token(code_parts)
+            if prev and prev[-1] in _JS_AMBIGUOUS_PREV_CHARS and _JS_REGEX_BODY.match(source, start):
+                # either reading is possible: leave the rest as written
+                pos = start
+                break
+            rm = _JS_REGEX_BODY.match(source, start) if _js_regex_allowed(prev) else None
+            if rm is not None:
+                end = rm.end()
+                tok = rm.group()
+                text_parts.append(tok)
+                close = tok.rindex("/")
+                code_parts.append("/" + _blank(tok[1:close]) + tok[close:])
+            else:
+                text_parts.append(tok)
+                code_parts.append(tok)
+        pos = scan = end
+
+    if pos == 0:
+        return LexedSource(lang, source, source)
+    tail = source[pos:]
+    text_parts.append(tail)
+    code_parts.append(tail)
+    return LexedSource(lang, "".join(text_parts), "".join(code_parts))
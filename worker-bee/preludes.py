@@ -0,0 +1,399 @@
+"""
+preludes.py
+
+Helper code shared by the harnesses: the ListNode definitions, the linked
+list converters and the output formatters, one fragment per helper and
+language. A template marks where its helpers go with {{PRELUDE}} (and, for
+Go, its extra imports with {{PRELUDE_IMPORTS}}); `compose()` fills the slot
+with the fragments the template references, plus the ones those reference
+in turn, in definition order. A helper is written once here and every
+harness that uses it (generator.py, the registry's templates, wrapper.py)
+picks it up.
+
+ListNode is different: starter code declares it for some problems and not
+for others, and declaring it twice does not compile. compose() leaves a
+{{USER_TYPES}} slot in its place (or the template places one itself), which
+the caller fills with `user_types(language, user_code)` when it binds the
+user code: the declaration, unless the user code already has one. A C
+template that puts its helpers after the user code, so they can use a
+struct the user declared, also gets their prototypes in {{PRELUDE_DECLS}}.
+
+Usage:
+    text = compose("c", "#include <stdio.h>\\n{{PRELUDE}}\\nint main() { printList(head); }")
+"""
+import hashlib
+import re
+from typing import Dict, List, Optional, Sequence
+
+from lexer import lex
+
+PRELUDE_SLOT = "{{PRELUDE}}"
+IMPORTS_SLOT = "{{PRELUDE_IMPORTS}}"
+TYPES_SLOT = "{{USER_TYPES}}"
+DECLS_SLOT = "{{PRELUDE_DECLS}}"
+
+
+class Fragment:
+    """One helper. `name` is how code refers to it (`Class.method` for the
+    members of a Java helper class), `group` the class it belongs in.
+    `declared` matches a declaration of the same type in user code (with
+    comments blanked); such a fragment goes into the {{USER_TYPES}} slot."""
+
+    __slots__ = ("name", "text", "requires", "imports", "group", "pattern", "declared")
+
+    def __init__(self, name: str, text: str, requires: Sequence[str] = (), imports: Sequence[str] = (),
+                 declared: Optional[str] = None):
+        self.name = name
+        self.text = text
+        self.requires = tuple(requires)
+        self.imports = tuple(imports)
+        self.group = name.split(".")[0] if "." in name else None
+        self.pattern = re.compile(r"(?<![\w.])" + re.escape(name) + r"(?!\w)")
+        self.declared = re.compile(declared) if declared is not None else None
+
+
+# ---------------- python ----------------
+_PYTHON = [
+    Fragment("ListNode", '''# Definition for singly-linked list.
+class ListNode:
+    def __init__(self, val=0, next=None):
+        self.val = val
+        self.next = next
+''', declared=r"(?m)^class\s+ListNode\b"),
+    Fragment("array_to_list", '''def array_to_list(arr):
+    if not arr:
+        return None
+    head = ListNode(arr[0])
+    current = head
+    for val in arr[1:]:
+        current.next = ListNode(val)
+        current = current.next
+    return head
+'''),
+    Fragment("list_to_array", '''def list_to_array(head):
+    if isinstance(head, list):
+        return head
+    result = []
+    while head:
+        result.append(head.val)
+        head = head.next
+    return result
+'''),
+    Fragment("format_chars", '''def format_chars(chars):
+    return "[" + ",".join("'" + c + "'" for c in chars) + "]"
+'''),
+]
+
+
+# ---------------- javascript ----------------
+_JAVASCRIPT = [
+    Fragment("ListNode", '''function ListNode(val, next) {
+    this.val = (val===undefined ? 0 : val)
+    this.next = (next===undefined ? null : next)
+}
+''', declared=r"\b(?:class|function|const|let|var)\s+ListNode\b"),
+    Fragment("arrayToList", '''function arrayToList(arr) {
+    if (!arr || arr.length === 0) return null;
+    let head = new ListNode(arr[0]);
+    let current = head;
+    for (let i = 1; i < arr.length; i++) {
+        current.next = new ListNode(arr[i]);
+        current = current.next;
+    }
+    return head;
+}
+'''),
+    Fragment("listToArray", '''function listToArray(head) {
+    if (Array.isArray(head)) return head;
+    let result = [];
+    while (head) {
+        result.push(head.val);
+        head = head.next;
+    }
+    return result;
+}
+'''),
+    Fragment("formatChars", '''function formatChars(chars) {
+    return "[" + chars.map(c => "'" + c + "'").join(",") + "]";
+}
+'''),
+]
+
+
+# ---------------- java ----------------
+_JAVA = [
+    Fragment("ListNode", '''class ListNode {
+    int val;
+    ListNode next;
+    ListNode() {}
+    ListNode(int val) { this.val = val; }
+    ListNode(int val, ListNode next) { this.val = val; this.next = next; }
+}
+''', declared=r"\b(?:class|interface|record)\s+ListNode\b"),
+    Fragment("ArrayListConverter.arrayToList", '''    public static ListNode arrayToList(int[] arr) {
+        if (arr == null || arr.length == 0) return null;
+        ListNode head = new ListNode(arr[0]);
+        ListNode current = head;
+        for (int i = 1; i < arr.length; i++) {
+            current.next = new ListNode(arr[i]);
+            current = current.next;
+        }
+        return head;
+    }
+'''),
+    Fragment("ArrayListConverter.listToArray", '''    public static int[] listToArray(ListNode head) {
+        List<Integer> result = new ArrayList<>();
+        while (head != null) {
+            result.add(head.val);
+            head = head.next;
+        }
+        return result.stream().mapToInt(i -> i).toArray();
+    }
+'''),
+    Fragment("DockexecFormat.quote", '''    static String quote(String s) {
+        StringBuilder out = new StringBuilder("\\"");
+        for (int i = 0; i < s.length(); i++) {
+            char c = s.charAt(i);
+            if (c == '"' || c == '\\\\') out.append('\\\\').append(c);
+            else if (c < 0x20) out.append(String.format("\\\\u%04x", (int) c));
+            else out.append(c);
+        }
+        return out.append('"').toString();
+    }
+'''),
+    Fragment("DockexecFormat.chars", '''    static String chars(char[] a) {
+        StringBuilder out = new StringBuilder("[");
+        for (int i = 0; i < a.length; i++) {
+            if (i > 0) out.append(',');
+            out.append('\\'').append(a[i]).append('\\'');
+        }
+        return out.append(']').toString();
+    }
+'''),
+]
+
+
+# ---------------- go ----------------
+_GO = [
+    Fragment("ListNode", '''type ListNode struct {
+    Val  int
+    Next *ListNode
+}
+''', declared=r"\btype\s+ListNode\b"),
+    Fragment("arrayToList", '''func arrayToList(arr []int) *ListNode {
+    if len(arr) == 0 {
+        return nil
+    }
+    head := &ListNode{Val: arr[0]}
+    current := head
+    for i := 1; i < len(arr); i++ {
+        current.Next = &ListNode{Val: arr[i]}
+        current = current.Next
+    }
+    return head
+}
+'''),
+    Fragment("listToArray", '''func listToArray(head *ListNode) []int {
+    result := []int{}
+    for head != nil {
+        result = append(result, head.Val)
+        head = head.Next
+    }
+    return result
+}
+'''),
+    Fragment("dockexecJSON", '''func dockexecJSON(v interface{}) string {
+    b, _ := json.Marshal(v)
+    return string(b)
+}
+''', imports=("encoding/json",)),
+    Fragment("dockexecChars", '''func dockexecChars(b []byte) string {
+    out := []byte{'['}
+    for i, c := range b {
+        if i > 0 {
+            out = append(out, ',')
+        }
+        out = append(out, '\\'', c, '\\'')
+    }
+    return string(append(out, ']'))
+}
+'''),
+]
+
+
+# ---------------- c ----------------
+_C = [
+    Fragment("ListNode", '''struct ListNode {
+    int val;
+    struct ListNode *next;
+};
+''', declared=r"\bstruct\s+ListNode\s*\{"),
+    Fragment("createNode", '''struct ListNode* createNode(int val) {
+    struct ListNode* node = (struct ListNode*)malloc(sizeof(struct ListNode));
+    node->val = val;
+    node->next = NULL;
+    return node;
+}
+'''),
+    Fragment("arrayToList", '''struct ListNode* arrayToList(int arr[], int size) {
+    if (size == 0) return NULL;
+    struct ListNode* head = createNode(arr[0]);
+    struct ListNode* current = head;
+    for (int i = 1; i < size; i++) {
+        current->next = createNode(arr[i]);
+        current = current->next;
+    }
+    return head;
+}
+'''),
+    Fragment("printList", '''void printList(struct ListNode* head) {
+    printf("[");
+    int first = 1;
+    while (head) {
+        if (!first) printf(",");
+        printf("%d", head->val);
+        first = 0;
+        head = head->next;
+    }
+    printf("]\\n");
+}
+'''),
+    Fragment("dockexecPrintChar", '''void dockexecPrintChar(char c) {
+    if (c == '"' || c == '\\\\') printf("\\\\%c", c);
+    else if ((unsigned char)c < 0x20) printf("\\\\u%04x", c);
+    else putchar(c);
+}
+'''),
+    Fragment("dockexecPrintInts", '''void dockexecPrintInts(const int* a, int n) {
+    if (a == NULL) n = 0;
+    printf("[");
+    for (int i = 0; i < n; i++) {
+        if (i > 0) printf(",");
+        printf("%d", a[i]);
+    }
+    printf("]\\n");
+}
+'''),
+    Fragment("dockexecPrintChars", '''void dockexecPrintChars(const char* a, int n) {
+    if (a == NULL) n = 0;
+    printf("[");
+    for (int i = 0; i < n; i++) {
+        if (i > 0) printf(",");
+        printf("'%c'", a[i]);
+    }
+    printf("]\\n");
+}
+'''),
+    Fragment("dockexecPrintString", '''void dockexecPrintString(const char* s) {
+    if (s == NULL) {
+        printf("null\\n");
+        return;
+    }
+    printf("\\"");
+    for (; *s; s++) dockexecPrintChar(*s);
+    printf("\\"\\n");
+}
+'''),
+]
+
+FRAGMENTS: Dict[str, List[Fragment]] = {
+    "python": _PYTHON,
+    "javascript": _JAVASCRIPT,
+    "java": _JAVA,
+    "go": _GO,
+    "c": _C,
+}
+
+
+def _prelude_version() -> str:
+    """Digest of every fragment; part of templates.TEMPLATE_VERSION."""
+    digest = hashlib.sha256()
+    for language in sorted(FRAGMENTS):
+        for fragment in FRAGMENTS[language]:
+            digest.update(f"{language}\0{fragment.name}\0{fragment.text}\0".encode())
+    return digest.hexdigest()[:16]
+
+
+PRELUDE_VERSION = _prelude_version()
+
+
+# ---------------- composition ----------------
+def referenced(language: str, text: str, extra: Sequence[str] = ()) -> List[Fragment]:
+    """The fragments `text` uses, directly or through other fragments, plus
+    the ones named in `extra`, in definition order."""
+    fragments = FRAGMENTS.get(language, [])
+    by_name = {fragment.name: fragment for fragment in fragments}
+    used = {name for name in extra if name in by_name}
+    pending = [text] + [by_name[name].text for name in used]
+    while pending:
+        scanned = pending.pop()
+        for fragment in fragments:
+            if fragment.name not in used and fragment.pattern.search(scanned):
+                used.add(fragment.name)
+                pending.append(fragment.text)
+        for fragment in fragments:
+            for name in fragment.requires:
+                if fragment.name in used and name not in used:
+                    used.add(name)
+                    pending.append(by_name[name].text)
+    return [fragment for fragment in fragments if fragment.name in used]
+
+
+def _render(fragments: List[Fragment], types_placed: bool = False) -> str:
+    """Fragments as source, the members of a Java helper class inside it, and
+    the ones user code may declare as the {{USER_TYPES}} slot."""
+    blocks: List[str] = []
+    groups: Dict[str, List[str]] = {}
+    for fragment in fragments:
+        if fragment.declared is not None:
+            if not types_placed and TYPES_SLOT not in blocks:
+                blocks.append(TYPES_SLOT)
+        elif fragment.group is None:
+            blocks.append(fragment.text)
+        elif fragment.group in groups:
+            groups[fragment.group].append(fragment.text)
+        else:
+            groups[fragment.group] = [fragment.text]
+            blocks.append(fragment.group)
+    out = []
+    for block in blocks:
+        members = groups.get(block)
+        if members:
+            out.append(f"class {block} {{\n" + "\n".join(members) + "}\n")
+        else:
+            out.append(block + "\n" if block == TYPES_SLOT else block)
+    return "\n".join(out)
+
+
+def compose(language: str, text: str, extra: Sequence[str] = ()) -> str:
+    """`text` with {{PRELUDE}} replaced by the fragments it references (and
+    those named in `extra`), and {{PRELUDE_IMPORTS}} by their imports.
+
+    References are looked up in the template itself, so a helper used only
+    by user code is not included unless named in `extra`.
+    """
+    if PRELUDE_SLOT not in text and IMPORTS_SLOT not in text:
+        return text
+    scanned = text.replace(PRELUDE_SLOT, "").replace(IMPORTS_SLOT, "").replace(DECLS_SLOT, "")
+    fragments = referenced(language, scanned, extra)
+    prelude = _render(fragments, TYPES_SLOT in text)
+    text = text.replace(PRELUDE_SLOT + "\n", prelude + "\n" if prelude else "", 1).replace(PRELUDE_SLOT, prelude, 1)
+    if DECLS_SLOT in text:
+        # a C function fragment opens with its signature
+        decls = "".join(fragment.text.split("{", 1)[0].rstrip() + ";\n" for fragment in fragments
+                        if fragment.declared is None and fragment.text.rstrip().endswith("}"))
+        text = text.replace(DECLS_SLOT + "\n", decls, 1)
+    imports: List[str] = []
+    for fragment in fragments:
+        imports += [name for name in fragment.imports if name not in imports]
+    return text.replace(IMPORTS_SLOT + "\n", "".join(f'import "{name}"\n' for name in imports), 1)
+
+
+def user_types(language: str, user_code: str) -> str:
+    """What fills {{USER_TYPES}} for `user_code`: the declarations of the
+    types user code may declare (ListNode) that it does not declare itself."""
+    fragments = [fragment for fragment in FRAGMENTS.get(language, []) if fragment.declared is not None]
+    if not fragments:
+        return ""
+    code = lex(user_code, language).text
+    return "\n".join(fragment.text for fragment in fragments if not fragment.declared.search(code))
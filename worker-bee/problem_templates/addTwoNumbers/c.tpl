@@ -0,0 +1,44 @@
+#include <stdio.h>
+#include <stdlib.h>
+
+// User code contains struct ListNode definition
+{{USER_CODE}}
+
+struct ListNode* createNode(int val) {
+    struct ListNode* node = (struct ListNode*)malloc(sizeof(struct ListNode));
+    node->val = val;
+    node->next = NULL;
+    return node;
+}
+
+struct ListNode* arrayToList(int arr[], int size) {
+    if (size == 0) return NULL;
+    struct ListNode* head = createNode(arr[0]);
+    struct ListNode* current = head;
+    for (int i = 1; i < size; i++) {
+        current->next = createNode(arr[i]);
+        current = current->next;
+    }
+    return head;
+}
+
+void printList(struct ListNode* head) {
+    printf("[");
+    int first = 1;
+    while (head) {
+        if (!first) printf(",");
+        printf("%d", head->val);
+        first = 0;
+        head = head->next;
+    }
+    printf("]\n");
+}
+
+int main() {
+    {{TEST_VARIABLES}}
+    struct ListNode* l1List = arrayToList(l1, l1_size);
+    struct ListNode* l2List = arrayToList(l2, l2_size);
+    struct ListNode* result = addTwoNumbers(l1List, l2List);  // or mergeTwoLists, reverseList
+    printList(result);
+    return 0;
+}
\ No newline at end of file
@@ -0,0 +1,35 @@
+package main
+import "fmt"
+
+
+func arrayToList(arr []int) *ListNode {
+    if len(arr) == 0 {
+        return nil
+    }
+    head := &ListNode{Val: arr[0]}
+    current := head
+    for i := 1; i < len(arr); i++ {
+        current.Next = &ListNode{Val: arr[i]}
+        current = current.Next
+    }
+    return head
+}
+
+func listToArray(head *ListNode) []int {
+    var result []int
+    for head != nil {
+        result = append(result, head.Val)
+        head = head.Next
+    }
+    return result
+}
+
+{{USER_CODE}}
+
+func main() {
+    {{TEST_VARIABLES}}
+    l1List := arrayToList(l1)
+    l2List := arrayToList(l2)
+    result := addTwoNumbers(l1List, l2List)
+    fmt.Println(listToArray(result))
+}
\ No newline at end of file
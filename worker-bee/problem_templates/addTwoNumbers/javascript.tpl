@@ -0,0 +1,34 @@
+function ListNode(val, next) {
+    this.val = (val===undefined ? 0 : val);
+    this.next = (next===undefined ? null : next);
+}
+
+function arrayToList(arr) {
+    if (!arr || arr.length === 0) return null;
+    let head = new ListNode(arr[0]);
+    let current = head;
+    for (let i = 1; i < arr.length; i++) {
+        current.next = new ListNode(arr[i]);
+        current = current.next;
+    }
+    return head;
+}
+
+function listToArray(head) {
+    if (Array.isArray(head)) return head;  // Handle direct array return
+    let result = [];
+    while (head) {
+        result.push(head.val);
+        head = head.next;
+    }
+    return result;
+}
+
+{{USER_CODE}}
+
+// Test execution
+{{TEST_VARIABLES}}
+const l1_list = arrayToList(l1);
+const l2_list = arrayToList(l2);
+const result = addTwoNumbers(l1_list, l2_list);
+console.log(JSON.stringify(listToArray(result)));
\ No newline at end of file
@@ -0,0 +1,10 @@
+#include <stdio.h>
+
+{{USER_CODE}}
+
+int main() {
+    {{TEST_VARIABLES}}
+    int result = fib(n);
+    printf("%d\n", result);
+    return 0;
+}
\ No newline at end of file
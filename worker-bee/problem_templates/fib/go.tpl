@@ -0,0 +1,10 @@
+package main
+import "fmt"
+
+{{USER_CODE}}
+
+func main() {
+    {{TEST_VARIABLES}}
+    result := fib(n)
+    fmt.Println(result)
+}
\ No newline at end of file
@@ -0,0 +1,10 @@
+package main
+import "fmt"
+
+{{USER_CODE}}
+
+func main() {
+    {{TEST_VARIABLES}}
+    result := findMax(nums)
+    fmt.Println(result)
+}
\ No newline at end of file
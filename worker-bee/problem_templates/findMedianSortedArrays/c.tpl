@@ -0,0 +1,11 @@
+#include <stdio.h>
+#include <stdlib.h>
+
+{{USER_CODE}}
+
+int main() {
+    {{TEST_VARIABLES}}
+    double result = findMedianSortedArrays(nums1, nums1Size, nums2, nums2Size);
+    printf("%.5f\n", result);
+    return 0;
+}
\ No newline at end of file
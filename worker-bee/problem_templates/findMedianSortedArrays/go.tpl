@@ -0,0 +1,10 @@
+package main
+import "fmt"
+
+{{USER_CODE}}
+
+func main() {
+    {{TEST_VARIABLES}}
+    result := findMedianSortedArrays(nums1, nums2)
+    fmt.Printf("%.5f\n", result)
+}
\ No newline at end of file
@@ -0,0 +1,12 @@
+import java.util.*;
+
+{{USER_CODE}}
+
+class Main {
+    public static void main(String[] args) {
+        Solution solution = new Solution();
+        {{TEST_VARIABLES}}
+        double result = solution.findMedianSortedArrays(nums1, nums2);
+        System.out.println(String.format("%.5f", result));
+    }
+}
\ No newline at end of file
@@ -0,0 +1,6 @@
+{{USER_CODE}}
+
+// Test execution
+{{TEST_VARIABLES}}
+const result = findMedianSortedArrays(nums1, nums2);
+console.log(JSON.stringify(result));
\ No newline at end of file
@@ -0,0 +1,6 @@
+{{USER_CODE}}
+
+# Test execution
+{{TEST_VARIABLES}}
+result = findMedianSortedArrays(nums1, nums2)
+print(result)
\ No newline at end of file
@@ -0,0 +1,12 @@
+#include <stdio.h>
+#include <stdlib.h>
+#include <stdbool.h>
+
+{{USER_CODE}}
+
+int main() {
+    {{TEST_VARIABLES}}
+    bool result = isArmstrong(n);
+    printf("%s\n", result ? "true" : "false");
+    return 0;
+}
\ No newline at end of file
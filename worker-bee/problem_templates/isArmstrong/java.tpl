@@ -0,0 +1,12 @@
+import java.util.*;
+
+{{USER_CODE}}
+
+class Main {
+    public static void main(String[] args) {
+        Solution solution = new Solution();
+        {{TEST_VARIABLES}}
+        boolean result = solution.isArmstrong(n);
+        System.out.println(result);
+    }
+}
\ No newline at end of file
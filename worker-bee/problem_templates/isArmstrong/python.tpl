@@ -0,0 +1,6 @@
+{{USER_CODE}}
+
+# Test execution
+{{TEST_VARIABLES}}
+result = isArmstrong(n)
+print(result)
\ No newline at end of file
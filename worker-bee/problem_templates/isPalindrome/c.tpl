@@ -0,0 +1,13 @@
+#include <stdio.h>
+#include <stdlib.h>
+#include <stdbool.h>
+#include <string.h>
+
+{{USER_CODE}}
+
+int main() {
+    {{TEST_VARIABLES}}
+    bool result = isPalindrome(s);
+    printf("%s\n", result ? "true" : "false");
+    return 0;
+}
\ No newline at end of file
@@ -0,0 +1,12 @@
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+
+{{USER_CODE}}
+
+int main() {
+    {{TEST_VARIABLES}}
+    int result = lengthOfLongestSubstring(s);
+    printf("%d\n", result);
+    return 0;
+}
\ No newline at end of file
@@ -0,0 +1,48 @@
+#include <stdio.h>
+#include <stdlib.h>
+
+struct ListNode {
+    int val;
+    struct ListNode *next;
+};
+
+struct ListNode* createNode(int val) {
+    struct ListNode* node = (struct ListNode*)malloc(sizeof(struct ListNode));
+    node->val = val;
+    node->next = NULL;
+    return node;
+}
+
+struct ListNode* arrayToList(int arr[], int size) {
+    if (size == 0) return NULL;
+    struct ListNode* head = createNode(arr[0]);
+    struct ListNode* current = head;
+    for (int i = 1; i < size; i++) {
+        current->next = createNode(arr[i]);
+        current = current->next;
+    }
+    return head;
+}
+
+void printList(struct ListNode* head) {
+    printf("[");
+    int first = 1;
+    while (head) {
+        if (!first) printf(",");
+        printf("%d", head->val);
+        first = 0;
+        head = head->next;
+    }
+    printf("]\n");
+}
+
+{{USER_CODE}}
+
+int main() {
+    {{TEST_VARIABLES}}
+    struct ListNode* l1List = arrayToList(l1, l1_size);
+    struct ListNode* l2List = arrayToList(l2, l2_size);
+    struct ListNode* result = mergeTwoLists(l1List, l2List);
+    printList(result);
+    return 0;
+}
\ No newline at end of file
@@ -0,0 +1,44 @@
+import java.util.*;
+
+class ListNode {
+    int val;
+    ListNode next;
+    ListNode() {}
+    ListNode(int val) { this.val = val; }
+    ListNode(int val, ListNode next) { this.val = val; this.next = next; }
+}
+
+class ArrayListConverter {
+    public static ListNode arrayToList(int[] arr) {
+        if (arr == null || arr.length == 0) return null;
+        ListNode head = new ListNode(arr[0]);
+        ListNode current = head;
+        for (int i = 1; i < arr.length; i++) {
+            current.next = new ListNode(arr[i]);
+            current = current.next;
+        }
+        return head;
+    }
+    
+    public static int[] listToArray(ListNode head) {
+        List<Integer> result = new ArrayList<>();
+        while (head != null) {
+            result.add(head.val);
+            head = head.next;
+        }
+        return result.stream().mapToInt(i -> i).toArray();
+    }
+}
+
+{{USER_CODE}}
+
+class Main {
+    public static void main(String[] args) {
+        Solution solution = new Solution();
+        {{TEST_VARIABLES}}
+        ListNode l1List = ArrayListConverter.arrayToList(l1);
+        ListNode l2List = ArrayListConverter.arrayToList(l2);
+        ListNode result = solution.mergeTwoLists(l1List, l2List);
+        System.out.println(Arrays.toString(ArrayListConverter.listToArray(result)));
+    }
+}
\ No newline at end of file
@@ -0,0 +1,34 @@
+function ListNode(val, next) {
+    this.val = (val===undefined ? 0 : val);
+    this.next = (next===undefined ? null : next);
+}
+
+function arrayToList(arr) {
+    if (!arr || arr.length === 0) return null;
+    let head = new ListNode(arr[0]);
+    let current = head;
+    for (let i = 1; i < arr.length; i++) {
+        current.next = new ListNode(arr[i]);
+        current = current.next;
+    }
+    return head;
+}
+
+function listToArray(head) {
+    if (Array.isArray(head)) return head;
+    let result = [];
+    while (head) {
+        result.push(head.val);
+        head = head.next;
+    }
+    return result;
+}
+
+{{USER_CODE}}
+
+// Test execution
+{{TEST_VARIABLES}}
+const l1List = arrayToList(l1);
+const l2List = arrayToList(l2);
+const result = mergeTwoLists(l1List, l2List);
+console.log(JSON.stringify(listToArray(result)));
\ No newline at end of file
@@ -0,0 +1,33 @@
+# Definition for singly-linked list.
+class ListNode:
+    def __init__(self, val=0, next=None):
+        self.val = val
+        self.next = next
+
+def array_to_list(arr):
+    if not arr:
+        return None
+    head = ListNode(arr[0])
+    current = head
+    for val in arr[1:]:
+        current.next = ListNode(val)
+        current = current.next
+    return head
+
+def list_to_array(head):
+    if isinstance(head, list):
+        return head
+    result = []
+    while head:
+        result.append(head.val)
+        head = head.next
+    return result
+
+{{USER_CODE}}
+
+# Test execution
+{{TEST_VARIABLES}}
+l1_list = array_to_list(l1)
+l2_list = array_to_list(l2)
+result = mergeTwoLists(l1_list, l2_list)
+print(list_to_array(result))
\ No newline at end of file
@@ -0,0 +1,11 @@
+#include <stdio.h>
+#include <stdlib.h>
+
+{{USER_CODE}}
+
+int main() {
+    {{TEST_VARIABLES}}
+    int result = removeDuplicates(nums, numsSize);
+    printf("%d\n", result);
+    return 0;
+}
\ No newline at end of file
@@ -0,0 +1,47 @@
+#include <stdio.h>
+#include <stdlib.h>
+
+struct ListNode {
+    int val;
+    struct ListNode *next;
+};
+
+struct ListNode* createNode(int val) {
+    struct ListNode* node = (struct ListNode*)malloc(sizeof(struct ListNode));
+    node->val = val;
+    node->next = NULL;
+    return node;
+}
+
+struct ListNode* arrayToList(int arr[], int size) {
+    if (size == 0) return NULL;
+    struct ListNode* head = createNode(arr[0]);
+    struct ListNode* current = head;
+    for (int i = 1; i < size; i++) {
+        current->next = createNode(arr[i]);
+        current = current->next;
+    }
+    return head;
+}
+
+void printList(struct ListNode* head) {
+    printf("[");
+    int first = 1;
+    while (head) {
+        if (!first) printf(",");
+        printf("%d", head->val);
+        first = 0;
+        head = head->next;
+    }
+    printf("]\n");
+}
+
+{{USER_CODE}}
+
+int main() {
+    {{TEST_VARIABLES}}
+    struct ListNode* headList = arrayToList(head, head_size);
+    struct ListNode* result = reverseList(headList);
+    printList(result);
+    return 0;
+}
\ No newline at end of file
@@ -0,0 +1,33 @@
+package main
+import "fmt"
+
+func arrayToList(arr []int) *ListNode {
+    if len(arr) == 0 {
+        return nil
+    }
+    head := &ListNode{Val: arr[0]}
+    current := head
+    for i := 1; i < len(arr); i++ {
+        current.Next = &ListNode{Val: arr[i]}
+        current = current.Next
+    }
+    return head
+}
+
+func listToArray(head *ListNode) []int {
+    var result []int
+    for head != nil {
+        result = append(result, head.Val)
+        head = head.Next
+    }
+    return result
+}
+
+{{USER_CODE}}
+
+func main() {
+    {{TEST_VARIABLES}}
+    headList := arrayToList(head)
+    result := reverseList(headList)
+    fmt.Println(listToArray(result))
+}
\ No newline at end of file
@@ -0,0 +1,17 @@
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+
+{{USER_CODE}}
+
+int main() {
+    {{TEST_VARIABLES}}
+    reverseString(s, s_size);
+    printf("[");
+    for(int i = 0; i < s_size; i++) {
+        printf("'%c'", s[i]);
+        if(i < s_size - 1) printf(",");
+    }
+    printf("]\n");
+    return 0;
+}
\ No newline at end of file
@@ -0,0 +1,10 @@
+package main
+import "fmt"
+
+{{USER_CODE}}
+
+func main() {
+    {{TEST_VARIABLES}}
+    reverseString(s)
+    fmt.Printf("%%q\n", s)
+}
\ No newline at end of file
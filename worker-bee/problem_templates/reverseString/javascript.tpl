@@ -0,0 +1,6 @@
+{{USER_CODE}}
+
+// Test execution
+{{TEST_VARIABLES}}
+reverseString(s);
+console.log(JSON.stringify(s));
\ No newline at end of file
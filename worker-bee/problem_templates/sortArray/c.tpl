@@ -0,0 +1,16 @@
+#include <stdio.h>
+#include <stdlib.h>
+
+{{USER_CODE}}
+
+int main() {
+    {{TEST_VARIABLES}}
+    int* result = sortArray(nums, numsSize);
+    printf("[");
+    for(int i = 0; i < numsSize; i++) {
+        printf("%d", result[i]);
+        if(i < numsSize - 1) printf(",");
+    }
+    printf("]\n");
+    return 0;
+}
\ No newline at end of file
@@ -0,0 +1,6 @@
+{{USER_CODE}}
+
+// Test execution
+{{TEST_VARIABLES}}
+const result = sortArray(nums);
+console.log(JSON.stringify(result));
\ No newline at end of file
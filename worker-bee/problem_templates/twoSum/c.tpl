@@ -0,0 +1,31 @@
+#include <stdio.h>
+#include <stdlib.h>
+
+{{USER_CODE}}
+
+int main() {
+    {{TEST_VARIABLES}}
+    int returnSize = 0;
+    int* result = twoSum(nums, numsSize, target, &returnSize);
+    
+    // Safety check for NULL result
+    if (result == NULL) {
+        printf("NULL\n");
+        return 0;
+    }
+    
+    // Safety check for invalid size
+    if (returnSize <= 0) {
+        printf("[]\n");
+        return 0;
+    }
+    
+    printf("[");
+    for(int i = 0; i < returnSize; i++) {
+        printf("%d", result[i]);
+        if(i < returnSize - 1) printf(",");
+    }
+    printf("]\n");
+    
+    return 0;
+}
\ No newline at end of file
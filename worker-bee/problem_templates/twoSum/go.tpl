@@ -0,0 +1,14 @@
+package main
+import (
+ "encoding/json"
+ "fmt"
+)
+
+{{USER_CODE}}
+
+func main() {
+    {{TEST_VARIABLES}}
+    result := twoSum(nums, target)
+    b, _ := json.Marshal(result) // convert slice to JSON string
+    fmt.Println(string(b))  
+}
\ No newline at end of file
@@ -0,0 +1,6 @@
+{{USER_CODE}}
+
+# Test execution
+{{TEST_VARIABLES}}
+result = twoSum(nums, target)
+print(result)
\ No newline at end of file
@@ -0,0 +1,148 @@
+"""
+registry.py
+
+Hand-written problem harness templates on disk, read on first use. Problems
+with a signature in signatures.py get a generated harness instead (see
+generator.py); the registry is the fallback for everything else: problems
+without a signature, ones that need something the generator cannot
+express, and languages it does not emit.
+
+Each harness lives in problem_templates/<function_name>/<language>.tpl.
+problem_templates/index.json lists every file with its sha256, so a worker
+knows which (function_name, language) pairs exist, and can derive the
+template version, without reading a single template. A template is read the
+first time a job needs it (templates.py compiles it then) and kept; workers
+only ever hold the problems they actually served.
+
+A template can leave its helpers (ListNode, the linked-list converters, ...)
+to preludes.py: put {{PRELUDE}} where they go and the registry fills it with
+the ones the template references when it reads the file.
+
+After adding or editing a template file, rebuild the index:
+    python3 registry.py --reindex
+
+Usage:
+    registry = TemplateRegistry()
+    text = registry.text("myProblem", "java")    # None if there is no such template
+    print(registry.stats())
+"""
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from preludes import compose
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "problem_templates")
+INDEX_FILE = "index.json"
+TEMPLATE_SUFFIX = ".tpl"
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class TemplateRegistry:
+    """The index of problem_templates/, and the templates read so far."""
+
+    def __init__(self, root: str = TEMPLATE_DIR):
+        self.root = root
+        t0 = time.perf_counter()
+        with open(os.path.join(root, INDEX_FILE), "rb") as f:
+            raw = f.read()
+        # function_name -> language -> (relative path, sha256)
+        self._index: Dict[str, Dict[str, Tuple[str, str]]] = {
+            function_name: {language: (entry["file"], entry["sha256"]) for language, entry in by_language.items()}
+            for function_name, by_language in json.loads(raw)["templates"].items()
+        }
+        self.index_ms = (time.perf_counter() - t0) * 1000
+        self.index_bytes = len(raw)
+        self.version = _sha256(raw)[:16]
+        self._texts: Dict[Tuple[str, str], str] = {}
+        self._lock = threading.Lock()
+        self.load_ms = 0.0
+        self.loaded_bytes = 0
+
+    def has(self, function_name: str, language: str) -> bool:
+        return language in self._index.get(function_name, {})
+
+    def function_names(self) -> List[str]:
+        return sorted(self._index)
+
+    def languages(self, function_name: str) -> List[str]:
+        return sorted(self._index.get(function_name, {}))
+
+    def text(self, function_name: str, language: str) -> Optional[str]:
+        """The template's text with its prelude composed, read from disk on
+        first use; None if not indexed."""
+        key = (function_name, language)
+        text = self._texts.get(key)
+        if text is not None:
+            return text
+        entry = self._index.get(function_name, {}).get(language)
+        if entry is None:
+            return None
+        t0 = time.perf_counter()
+        with open(os.path.join(self.root, entry[0]), "rb") as f:
+            data = f.read()
+        if _sha256(data) != entry[1]:
+            print(f"Template {entry[0]} does not match {INDEX_FILE}; run `python3 registry.py --reindex`")
+        text = compose(language, data.decode())
+        with self._lock:
+            if key not in self._texts:
+                self._texts[key] = text
+                self.loaded_bytes += len(data)
+                self.load_ms += (time.perf_counter() - t0) * 1000
+            return self._texts[key]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "problems": len(self._index),
+                "templates": sum(len(by_language) for by_language in self._index.values()),
+                "index_bytes": self.index_bytes,
+                "index_ms": round(self.index_ms, 3),
+                "loaded": len(self._texts),
+                "loaded_bytes": self.loaded_bytes,
+                "load_ms": round(self.load_ms, 3),
+            }
+
+
+def build_index(root: str = TEMPLATE_DIR) -> dict:
+    """The index for every <function_name>/<language>.tpl under `root`."""
+    templates: Dict[str, Dict[str, dict]] = {}
+    for function_name in sorted(os.listdir(root)):
+        directory = os.path.join(root, function_name)
+        if not os.path.isdir(directory):
+            continue
+        for file_name in sorted(os.listdir(directory)):
+            if not file_name.endswith(TEMPLATE_SUFFIX):
+                continue
+            with open(os.path.join(directory, file_name), "rb") as f:
+                digest = _sha256(f.read())
+            language = file_name[:-len(TEMPLATE_SUFFIX)]
+            templates.setdefault(function_name, {})[language] = {
+                "file": f"{function_name}/{file_name}",
+                "sha256": digest,
+            }
+    return {"templates": templates}
+
+
+def write_index(root: str = TEMPLATE_DIR) -> dict:
+    index = build_index(root)
+    with open(os.path.join(root, INDEX_FILE), "w") as f:
+        json.dump(index, f, indent=2, sort_keys=True)
+        f.write("\n")
+    return index
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] != ["--reindex"]:
+        print("usage: python3 registry.py --reindex")
+        sys.exit(2)
+    index = write_index()
+    count = sum(len(by_language) for by_language in index["templates"].values())
+    print(f"Indexed {count} templates for {len(index['templates'])} problems in {TEMPLATE_DIR}")
@@ -0,0 +1,71 @@
+"""
+signatures.py
+
+Signatures of the problems the workers can run: parameter names and types,
+in order, and the return type. generator.py turns one into a harness per
+language, so adding a problem means adding an entry here.
+
+Types:
+    int       a 32-bit integer
+    long      a 64-bit integer (return type only)
+    double    a floating-point number (return type only; printed with 5 decimals
+              where the language formats it)
+    bool      true / false (return type only)
+    int[]     an array of ints
+    string    a string
+    char[]    an array of single characters
+    ListNode  a singly linked list, given in the test input as an int array
+    void      nothing is returned; `output` names the parameter to print
+
+Optional entries:
+    output          print this parameter after the call instead of the result
+    c_result_size   for an array result in C, the parameter whose length it has;
+                    without it the function takes an `int* returnSize`
+
+The C harnesses also expect a length next to every array (`numsSize`,
+`l1_size`, ...); see c_size_name. PROBLEM_INPUTS is the test-input view of the
+signatures: what each harness declares from a test case (linked lists as the
+int arrays they are built from).
+"""
+import hashlib
+import json
+from typing import Dict, Tuple
+
+INPUT_TYPES = ("int", "int[]", "string", "char[]")
+PARAM_TYPES = INPUT_TYPES + ("ListNode",)
+RETURN_TYPES = ("int", "long", "double", "bool", "int[]", "string", "char[]", "ListNode", "void")
+
+PROBLEM_SIGNATURES: Dict[str, dict] = {
+    "twoSum": {"params": (("nums", "int[]"), ("target", "int")), "returns": "int[]"},
+    "addTwoNumbers": {"params": (("l1", "ListNode"), ("l2", "ListNode")), "returns": "ListNode"},
+    "lengthOfLongestSubstring": {"params": (("s", "string"),), "returns": "int"},
+    "findMedianSortedArrays": {"params": (("nums1", "int[]"), ("nums2", "int[]")), "returns": "double"},
+    "reverseList": {"params": (("head", "ListNode"),), "returns": "ListNode"},
+    "sortArray": {"params": (("nums", "int[]"),), "returns": "int[]", "c_result_size": "nums"},
+    "reverseString": {"params": (("s", "char[]"),), "returns": "void", "output": "s"},
+    "isArmstrong": {"params": (("n", "int"),), "returns": "bool"},
+    "mergeTwoLists": {"params": (("l1", "ListNode"), ("l2", "ListNode")), "returns": "ListNode"},
+    "removeDuplicates": {"params": (("nums", "int[]"),), "returns": "int"},
+    "isPalindrome": {"params": (("s", "string"),), "returns": "bool"},
+    "fib": {"params": (("n", "int"),), "returns": "int"},
+    "factorial": {"params": (("n", "int"),), "returns": "long"},
+    "findMax": {"params": (("nums", "int[]"),), "returns": "int"},
+}
+
+PROBLEM_INPUTS: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    function_name: tuple((name, "int[]" if kind == "ListNode" else kind) for name, kind in signature["params"])
+    for function_name, signature in PROBLEM_SIGNATURES.items()
+}
+
+
+def c_size_name(name: str) -> str:
+    """The length variable the C harnesses pass alongside array `name`."""
+    if name in ("nums", "nums1", "nums2"):
+        return name + "Size"
+    return name + "_size"
+
+
+def signature_hash(function_name: str, signature: dict) -> str:
+    """sha256 over a signature's canonical JSON; equal signatures share a harness."""
+    canonical = json.dumps([function_name, signature], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
@@ -0,0 +1,509 @@
+"""
+stdin_harness.py
+
+Harnesses that read their test inputs from stdin instead of having them baked
+into the source.
+
+With the literal harness every test case is a different program, so nothing
+the executor compiles can be reused. Here `{{TEST_VARIABLES}}` becomes code
+that reads the problem's variables (signatures.PROBLEM_INPUTS) from stdin, so
+the program depends only on (problem, language, user code). Each test case
+then only needs its input payload: compile once, run once per test case.
+
+Input format: one line per variable, in signature order, as
+`<type> <payload>`:
+
+    int[] 4 2 7 11 15        count, then the values
+    int 9
+    i32 4 AgAAAAcAAAALAAAADwAAAA==
+                             an int[] as count, then the values as little-endian
+                             int32, base64-encoded
+    string 5 hello           byte length, one space, then the raw UTF-8 bytes
+    char[] 5 hello           same as string
+
+Strings are length-prefixed, so they may contain spaces and newlines. Arrays
+of BINARY_MIN_LENGTH ints or more are sent as i32: about 5.3 bytes per value
+instead of up to 12, and the readers decode them without parsing a number
+per value. Base64 keeps the payload valid in a JSON message. Every reader
+accepts both forms, so this is purely the encoder's choice.
+
+Usage:
+    program = prepare_stdin_program(code, job, "java")
+    for tc in test_cases:
+        payload = encode_stdin_input(tc["input"], inputs)   # fed to the program's stdin
+"""
+import base64
+import sys
+from array import array
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from harness import clean_user_code, job_function_name, remove_user_prints
+from preludes import user_types
+from signatures import INPUT_TYPES, PROBLEM_INPUTS, c_size_name
+from templates import Template, compile_template, problem_text
+from testinput import Value, parse_test_input
+
+Inputs = Tuple[Tuple[str, str], ...]
+
+# int[] inputs at least this long are sent as base64 int32 (the "i32" form)
+BINARY_MIN_LENGTH = 1024
+
+# ---------------- readers, one per language ----------------
+_PYTHON_READER = '''import sys as _dockexec_sys
+from array import array as _dockexec_array
+from binascii import a2b_base64 as _dockexec_b64
+
+
+class _DockexecIn:
+    """Reads the typed input lines the worker sends on stdin."""
+
+    def __init__(self):
+        self.data = _dockexec_sys.stdin.buffer.read()
+        self.pos = 0
+
+    def _fields(self):
+        end = self.data.find(b"\\n", self.pos)
+        if end < 0:
+            end = len(self.data)
+        fields = self.data[self.pos:end].split()
+        self.pos = end + 1
+        return fields
+
+    def read_int(self):
+        return int(self._fields()[1])
+
+    def read_ints(self):
+        fields = self._fields()
+        if fields[0] == b"i32":
+            out = _dockexec_array("i", _dockexec_b64(fields[2]) if len(fields) > 2 else b"")
+            if _dockexec_sys.byteorder == "big":
+                out.byteswap()
+            return out.tolist()
+        return [int(x) for x in fields[2:]]
+
+    def read_str(self):
+        start = self.data.index(b" ", self.pos) + 1
+        space = self.data.index(b" ", start)
+        n = int(self.data[start:space])
+        self.pos = space + 1 + n + 1
+        return self.data[space + 1:space + 1 + n].decode()
+
+
+_dockexec_in = _DockexecIn()
+'''
+
+_JAVASCRIPT_READER = '''const __dockexecIn = (() => {
+    const data = require("fs").readFileSync(0);
+    let pos = 0;
+    const fields = () => {
+        let end = data.indexOf(10, pos);
+        if (end < 0) end = data.length;
+        const out = data.toString("latin1", pos, end).split(/\\s+/).filter(Boolean);
+        pos = end + 1;
+        return out;
+    };
+    return {
+        readInt: () => Number(fields()[1]),
+        readInts: () => {
+            const f = fields();
+            if (f[0] !== "i32") return f.slice(2).map(Number);
+            const raw = Buffer.from(f[2] || "", "base64");
+            const out = new Array(raw.length >> 2);
+            for (let i = 0; i < out.length; i++) out[i] = raw.readInt32LE(i << 2);
+            return out;
+        },
+        readStr: () => {
+            const start = data.indexOf(32, pos) + 1;
+            const space = data.indexOf(32, start);
+            const n = Number(data.toString("latin1", start, space));
+            pos = space + 1 + n + 1;
+            return data.toString("utf8", space + 1, space + 1 + n);
+        },
+    };
+})();
+'''
+
+_JAVA_READER = '''
+
+class DockexecIn {
+    private static byte[] data;
+    private static int pos;
+
+    private static void skipSpace() {
+        if (data == null) {
+            try {
+                data = System.in.readAllBytes();
+            } catch (java.io.IOException e) {
+                data = new byte[0];
+            }
+        }
+        while (pos < data.length && data[pos] <= ' ') pos++;
+    }
+
+    // skips the type tag; true for the base64 int32 form ("i32")
+    private static boolean skipTag() {
+        skipSpace();
+        int start = pos;
+        while (pos < data.length && data[pos] != ' ') pos++;
+        return pos - start == 3 && data[start + 1] == '3';
+    }
+
+    private static int number() {
+        skipSpace();
+        boolean negative = pos < data.length && data[pos] == '-';
+        if (negative) pos++;
+        int value = 0;
+        while (pos < data.length && data[pos] >= '0' && data[pos] <= '9') value = value * 10 + (data[pos++] - '0');
+        return negative ? -value : value;
+    }
+
+    static int readInt() {
+        skipTag();
+        return number();
+    }
+
+    static int[] readInts() {
+        boolean binary = skipTag();
+        int[] out = new int[number()];
+        if (binary) {
+            skipSpace();
+            int start = pos;
+            while (pos < data.length && data[pos] > ' ') pos++;
+            byte[] raw = java.util.Base64.getDecoder().decode(java.util.Arrays.copyOfRange(data, start, pos));
+            java.nio.ByteBuffer.wrap(raw).order(java.nio.ByteOrder.LITTLE_ENDIAN).asIntBuffer().get(out);
+            return out;
+        }
+        for (int i = 0; i < out.length; i++) out[i] = number();
+        return out;
+    }
+
+    static String readStr() {
+        skipTag();
+        int n = number();
+        pos++;
+        String s = new String(data, pos, n, java.nio.charset.StandardCharsets.UTF_8);
+        pos += n;
+        return s;
+    }
+}
+'''
+
+_GO_IMPORTS = ('import dockexecb64 "encoding/base64"\nimport dockexecbin "encoding/binary"\n'
+               'import dockexecio "io"\nimport dockexecos "os"\n')
+
+_GO_READER = '''
+
+var dockexecData, _ = dockexecio.ReadAll(dockexecos.Stdin)
+var dockexecPos = 0
+
+func dockexecSkipSpace() {
+    for dockexecPos < len(dockexecData) && dockexecData[dockexecPos] <= ' ' {
+        dockexecPos++
+    }
+}
+
+// skips the type tag; true for the base64 int32 form ("i32")
+func dockexecSkipTag() bool {
+    dockexecSkipSpace()
+    start := dockexecPos
+    for dockexecPos < len(dockexecData) && dockexecData[dockexecPos] != ' ' {
+        dockexecPos++
+    }
+    return dockexecPos-start == 3 && dockexecData[start+1] == '3'
+}
+
+func dockexecNumber() int {
+    dockexecSkipSpace()
+    negative := dockexecPos < len(dockexecData) && dockexecData[dockexecPos] == '-'
+    if negative {
+        dockexecPos++
+    }
+    value := 0
+    for dockexecPos < len(dockexecData) && dockexecData[dockexecPos] >= '0' && dockexecData[dockexecPos] <= '9' {
+        value = value*10 + int(dockexecData[dockexecPos]-'0')
+        dockexecPos++
+    }
+    if negative {
+        return -value
+    }
+    return value
+}
+
+func dockexecReadInt() int {
+    dockexecSkipTag()
+    return dockexecNumber()
+}
+
+func dockexecReadInts() []int {
+    binary := dockexecSkipTag()
+    out := make([]int, dockexecNumber())
+    if binary {
+        dockexecSkipSpace()
+        start := dockexecPos
+        for dockexecPos < len(dockexecData) && dockexecData[dockexecPos] > ' ' {
+            dockexecPos++
+        }
+        raw := make([]byte, dockexecb64.StdEncoding.DecodedLen(dockexecPos-start))
+        n, _ := dockexecb64.StdEncoding.Decode(raw, dockexecData[start:dockexecPos])
+        for i := range out {
+            if 4*i+4 <= n {
+                out[i] = int(int32(dockexecbin.LittleEndian.Uint32(raw[4*i:])))
+            }
+        }
+        return out
+    }
+    for i := range out {
+        out[i] = dockexecNumber()
+    }
+    return out
+}
+
+func dockexecReadStr() string {
+    dockexecSkipTag()
+    n := dockexecNumber()
+    dockexecPos++
+    s := string(dockexecData[dockexecPos : dockexecPos+n])
+    dockexecPos += n
+    return s
+}
+'''
+
+_C_READER = '''#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+
+static char* dockexec_data;
+static size_t dockexec_len, dockexec_pos;
+
+static void dockexec_skip_space(void) {
+    if (!dockexec_data) {
+        size_t cap = 1 << 16, n;
+        dockexec_data = malloc(cap);
+        while ((n = fread(dockexec_data + dockexec_len, 1, cap - dockexec_len, stdin)) > 0) {
+            dockexec_len += n;
+            if (dockexec_len == cap) dockexec_data = realloc(dockexec_data, cap *= 2);
+        }
+    }
+    while (dockexec_pos < dockexec_len && (unsigned char) dockexec_data[dockexec_pos] <= ' ') dockexec_pos++;
+}
+
+/* skips the type tag; 1 for the base64 int32 form ("i32") */
+static int dockexec_skip_tag(void) {
+    dockexec_skip_space();
+    size_t start = dockexec_pos;
+    while (dockexec_pos < dockexec_len && dockexec_data[dockexec_pos] != ' ') dockexec_pos++;
+    return dockexec_pos - start == 3 && dockexec_data[start + 1] == '3';
+}
+
+static int dockexec_b64(unsigned char c) {
+    if (c >= 'A' && c <= 'Z') return c - 'A';
+    if (c >= 'a' && c <= 'z') return c - 'a' + 26;
+    if (c >= '0' && c <= '9') return c - '0' + 52;
+    return c == '+' ? 62 : c == '/' ? 63 : -1;
+}
+
+/* decodes base64 little-endian int32 values into out[0..n) */
+static void dockexec_read_b64_ints(int* out, int n) {
+    dockexec_skip_space();
+    unsigned int bits = 0, word = 0;
+    int nbits = 0, nbytes = 0, i = 0;
+    while (dockexec_pos < dockexec_len && (unsigned char) dockexec_data[dockexec_pos] > ' ') {
+        int v = dockexec_b64((unsigned char) dockexec_data[dockexec_pos++]);
+        if (v < 0) continue;
+        bits = (bits << 6) | (unsigned int) v;
+        nbits += 6;
+        if (nbits >= 8) {
+            nbits -= 8;
+            word |= ((bits >> nbits) & 0xFFu) << (8 * nbytes);
+            if (++nbytes == 4) {
+                if (i < n) out[i++] = (int) word;
+                word = 0;
+                nbytes = 0;
+            }
+        }
+    }
+    while (i < n) out[i++] = 0;
+}
+
+static int dockexec_number(void) {
+    dockexec_skip_space();
+    int negative = dockexec_pos < dockexec_len && dockexec_data[dockexec_pos] == '-';
+    if (negative) dockexec_pos++;
+    long value = 0;
+    while (dockexec_pos < dockexec_len && dockexec_data[dockexec_pos] >= '0' && dockexec_data[dockexec_pos] <= '9')
+        value = value * 10 + (dockexec_data[dockexec_pos++] - '0');
+    return (int) (negative ? -value : value);
+}
+
+static int dockexec_read_int(void) {
+    dockexec_skip_tag();
+    return dockexec_number();
+}
+
+static int* dockexec_read_ints(int* size) {
+    int binary = dockexec_skip_tag();
+    int n = dockexec_number();
+    int* out = malloc((n > 0 ? n : 1) * sizeof(int));
+    if (binary) dockexec_read_b64_ints(out, n);
+    else for (int i = 0; i < n; i++) out[i] = dockexec_number();
+    *size = n;
+    return out;
+}
+
+static char* dockexec_read_str(int* size) {
+    dockexec_skip_tag();
+    int n = dockexec_number();
+    dockexec_pos++;
+    if (dockexec_pos + n > dockexec_len) n = dockexec_pos < dockexec_len ? (int) (dockexec_len - dockexec_pos) : 0;
+    char* s = malloc(n + 1);
+    memcpy(s, dockexec_data + dockexec_pos, n);
+    s[n] = 0;
+    dockexec_pos += n;
+    if (size) *size = n;
+    return s;
+}
+
+'''
+
+
+# ---------------- declarations ----------------
+def _declare(name: str, kind: str, language: str) -> List[str]:
+    if language == "python":
+        read = {"int": "_dockexec_in.read_int()", "int[]": "_dockexec_in.read_ints()",
+                "string": "_dockexec_in.read_str()", "char[]": "list(_dockexec_in.read_str())"}[kind]
+        return [f"{name} = {read}"]
+    if language == "javascript":
+        read = {"int": "__dockexecIn.readInt()", "int[]": "__dockexecIn.readInts()",
+                "string": "__dockexecIn.readStr()", "char[]": "Array.from(__dockexecIn.readStr())"}[kind]
+        return [f"const {name} = {read};"]
+    if language == "java":
+        return [{"int": f"int {name} = DockexecIn.readInt();",
+                 "int[]": f"int[] {name} = DockexecIn.readInts();",
+                 "string": f"String {name} = DockexecIn.readStr();",
+                 "char[]": f"char[] {name} = DockexecIn.readStr().toCharArray();"}[kind]]
+    if language == "go":
+        return [{"int": f"{name} := dockexecReadInt()",
+                 "int[]": f"{name} := dockexecReadInts()",
+                 "string": f"{name} := dockexecReadStr()",
+                 "char[]": f"{name} := []byte(dockexecReadStr())"}[kind]]
+    # c: arrays carry their length in the variable the templates expect
+    if kind == "int":
+        return [f"int {name} = dockexec_read_int();"]
+    if kind == "int[]":
+        size = c_size_name(name)
+        return [f"int {size} = 0;", f"int* {name} = dockexec_read_ints(&{size});"]
+    if kind == "string":
+        return [f"char* {name} = dockexec_read_str(NULL);"]
+    size = name + "_size"
+    return [f"int {size} = 0;", f"char* {name} = dockexec_read_str(&{size});"]
+
+
+def with_stdin_reader(text: str, language: str, inputs: Inputs) -> Optional[str]:
+    """`text` with {{TEST_VARIABLES}} reading `inputs` from stdin, or None if unsupported."""
+    slot = "{{TEST_VARIABLES}}"
+    if slot not in text or not inputs or any(kind not in INPUT_TYPES for _, kind in inputs):
+        return None
+    at = text.index(slot)
+    indent = text[text.rfind("\n", 0, at) + 1:at]
+    lines = [line for name, kind in inputs for line in _declare(name, kind, language)]
+    declarations = ("\n" + indent).join(lines)
+
+    if language == "python":
+        return text.replace(slot, _PYTHON_READER + "\n" + declarations, 1)
+    if language == "javascript":
+        return text.replace(slot, _JAVASCRIPT_READER + "\n" + declarations, 1)
+    if language == "java":
+        return text.replace(slot, declarations, 1) + _JAVA_READER
+    if language == "go":
+        body = text.replace(slot, declarations, 1)
+        package_end = body.find("\n", body.find("package main")) + 1
+        if package_end <= 0:
+            return None
+        return body[:package_end] + _GO_IMPORTS + body[package_end:] + _GO_READER
+    if language == "c":
+        return _C_READER + text.replace(slot, declarations, 1)
+    return None
+
+
+@lru_cache(maxsize=512)
+def compile_stdin_template(text: str, language: str, inputs: Inputs) -> Optional[Template]:
+    """The compiled stdin form of a raw template; cached per (text, language, inputs)."""
+    stdin_text = with_stdin_reader(text, language, inputs)
+    return compile_template(stdin_text) if stdin_text is not None else None
+
+
+def stdin_problem_template(function_name: str, language: str) -> Optional[Template]:
+    """The stdin form of a problem template, or None if it has none."""
+    text = problem_text(function_name, language)
+    inputs = PROBLEM_INPUTS.get(function_name)
+    if not text or not inputs:
+        return None
+    return compile_stdin_template(text, language, inputs)
+
+
+# ---------------- payloads ----------------
+def _int32_base64(data: List[int]) -> Optional[str]:
+    """`data` as base64 little-endian int32, or None if a value does not fit."""
+    try:
+        packed = array("i", data)
+    except OverflowError:
+        return None
+    if packed.itemsize != 4:
+        return None
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return base64.b64encode(packed.tobytes()).decode("ascii")
+
+
+def _encode(kind: str, value: Value, binary_min: Optional[int]) -> Optional[str]:
+    if kind == "int":
+        return f"int {value.data}" if value.kind == "int" else None
+    if kind == "int[]":
+        if value.kind != "array" or value.elem not in ("int", None):
+            return None
+        if binary_min is not None and value.data and len(value.data) >= binary_min:
+            packed = _int32_base64(value.data)
+            if packed is not None:
+                return f"i32 {len(value.data)} {packed}"
+        return f"int[] {len(value.data)} " + " ".join(map(str, value.data))
+    if kind == "char[]" and value.kind == "array":
+        if value.elem not in ("char", None):
+            return None
+        text = "".join(value.data)
+    elif value.kind in ("string", "char"):
+        text = value.data
+    else:
+        return None
+    return f"{kind} {len(text.encode())} {text}"
+
+
+def encode_stdin_input(test_input: str, inputs: Inputs,
+                       binary_min: Optional[int] = BINARY_MIN_LENGTH) -> Optional[str]:
+    """The stdin payload for one test case, or None if it does not fit `inputs`.
+
+    int[] values of `binary_min` elements or more are sent in the i32 form;
+    None sends every array as decimal text.
+    """
+    values = dict(parse_test_input(test_input))
+    lines = []
+    for name, kind in inputs:
+        if name not in values:
+            return None
+        line = _encode(kind, values[name], binary_min)
+        if line is None:
+            return None
+        lines.append(line)
+    return "\n".join(lines) + "\n"
+
+
+# ---------------- per job ----------------
+def prepare_stdin_program(user_code, job_data, language) -> Optional[Tuple[str, Inputs]]:
+    """(program, input signature) for a job, prints suppressed; None if unsupported."""
+    function_name = job_function_name(job_data)
+    template = stdin_problem_template(function_name, language) if function_name else None
+    if template is None:
+        return None
+    cleaned_code = remove_user_prints(clean_user_code(user_code, language), language)
+    program = template.render(USER_CODE=cleaned_code, USER_TYPES=user_types(language, cleaned_code))
+    return program, PROBLEM_INPUTS[function_name]
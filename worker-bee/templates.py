@@ -0,0 +1,255 @@
+"""
+templates.py
+
+Wrapper templates split once into segment lists.
+
+Every problem template (see registry.py) and every template in wrapper.py is
+cut on its
+`{{NAME}}` placeholders into literal text and named slots. `bind()` fills the
+slots that are fixed for a whole job (the prepared user code, the function
+call) and merges the neighbouring text, so rendering one test case is a single
+`"".join` over a handful of pieces instead of a full-string `str.replace` per
+placeholder. Substituted values are never rescanned: user code that happens to
+contain `{{TEST_VARIABLES}}` stays as written.
+
+Each template is also cut around its test-case section into a BatchTemplate
+(head, per-case code, tail) so that one program can run many test cases; see
+harness.render_batch.
+
+Problem templates are generated from the problem's signature (see
+generator.py), or read from the registry for problems without one, and
+compiled the first time a job needs them; `registry_stats()` reports what
+has been loaded so far.
+
+Usage:
+    tpl = problem_template("twoSum", "java")
+    job = tpl.bind(USER_CODE=prepared_code,        # once per job
+                   USER_TYPES=user_types("java", prepared_code))
+    program = job.render(TEST_VARIABLES=block)     # once per test case
+"""
+import hashlib
+import re
+import time
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import generator
+from generator import generate_harness, generator_stats
+from preludes import PRELUDE_VERSION
+from registry import TemplateRegistry
+from signatures import PROBLEM_SIGNATURES, signature_hash
+from wrapper import SIMPLE_WRAPPER_TEMPLATE, LINKEDLIST_WRAPPER_TEMPLATE
+
+_PLACEHOLDER_RE = re.compile(r"\{\{([A-Z_]+)\}\}")
+# Braces inside string and char literals do not count when pairing main's body.
+_BRACE_SCAN_RE = re.compile(r'"(?:\\.|[^"\\\n])*+"|\'(?:\\.|[^\'\\\n])*+\'|[{}]')
+
+# The slot that changes per test case, and where the compiled languages run it.
+CASE_SLOTS = ("TEST_VARIABLES", "LINKEDLIST_CONVERSIONS")
+_MAIN_SIGNATURES = {"java": "public static void main(", "go": "func main()", "c": "int main("}
+
+
+class Template:
+    """Literal text and named slots; slot positions in `_parts` hold None."""
+
+    __slots__ = ("_parts", "_slots", "placeholders")
+
+    def __init__(self, parts: List[Optional[str]], slots: Tuple[Tuple[int, str], ...]):
+        self._parts = parts
+        self._slots = slots
+        self.placeholders = frozenset(name for _, name in slots)
+
+    def render(self, **values: str) -> str:
+        """Fill every slot; a slot without a value keeps its `{{NAME}}` text."""
+        parts = self._parts[:]
+        for i, name in self._slots:
+            value = values.get(name)
+            parts[i] = "{{" + name + "}}" if value is None else value
+        return "".join(parts)
+
+    def bind(self, **values: str) -> "Template":
+        """A template with the given slots filled and the adjacent text merged."""
+        parts: List[Optional[str]] = []
+        slots: List[Tuple[int, str]] = []
+        text: List[str] = []
+        names = dict(self._slots)
+        for i, part in enumerate(self._parts):
+            if part is not None:
+                text.append(part)
+                continue
+            name = names[i]
+            if name in values:
+                text.append(values[name])
+                continue
+            if text:
+                parts.append("".join(text))
+                text = []
+            slots.append((len(parts), name))
+            parts.append(None)
+        if text:
+            parts.append("".join(text))
+        return Template(parts, tuple(slots))
+
+
+def compile_template(text: str) -> Template:
+    """Split `text` on its placeholders."""
+    parts: List[Optional[str]] = []
+    slots: List[Tuple[int, str]] = []
+    pos = 0
+    for m in _PLACEHOLDER_RE.finditer(text):
+        if m.start() > pos:
+            parts.append(text[pos:m.start()])
+        slots.append((len(parts), m.group(1)))
+        parts.append(None)
+        pos = m.end()
+    if pos < len(text):
+        parts.append(text[pos:])
+    return Template(parts, tuple(slots))
+
+
+def _compile_all(templates: Dict[str, str]) -> Dict[str, Template]:
+    return {language: compile_template(text) for language, text in templates.items() if text}
+
+
+# ---------------- batch templates ----------------
+class BatchTemplate:
+    """A template cut around its test-case section.
+
+    `head` is everything before it (includes, helpers, the user code and, for
+    Java, the `class Main {` header), `case` is the code main ran for one test
+    case (with the `case_slot` placeholder) and `tail` closes what head opened.
+    """
+
+    __slots__ = ("head", "case", "tail", "case_slot")
+
+    def __init__(self, head: Template, case: Template, tail: Template, case_slot: str):
+        self.head = head
+        self.case = case
+        self.tail = tail
+        self.case_slot = case_slot
+
+    def bind(self, **values: str) -> "BatchTemplate":
+        return BatchTemplate(self.head.bind(**values), self.case.bind(**values),
+                             self.tail.bind(**values), self.case_slot)
+
+
+def _matching_brace(text: str, open_at: int) -> int:
+    depth = 0
+    for m in _BRACE_SCAN_RE.finditer(text, open_at):
+        tok = m.group()
+        if tok == "{":
+            depth += 1
+        elif tok == "}":
+            depth -= 1
+            if depth == 0:
+                return m.start()
+    return -1
+
+
+def split_for_batch(text: str, language: str) -> Optional[BatchTemplate]:
+    """Cut `text` around its test-case section, or None if it has no usable one."""
+    case_slot = next((slot for slot in CASE_SLOTS if "{{" + slot + "}}" in text), None)
+    if case_slot is None:
+        return None
+    at = text.index("{{" + case_slot + "}}")
+    signature = _MAIN_SIGNATURES.get(language)
+    if signature is None:
+        # Python and JavaScript run the test section at top level, up to the end.
+        return BatchTemplate(compile_template(text[:at]), compile_template(text[at:]),
+                             compile_template(""), case_slot)
+
+    start = text.rfind(signature, 0, at)
+    if start < 0:
+        return None
+    open_at = text.index("{", start)
+    close_at = _matching_brace(text, open_at)
+    if close_at < at:
+        return None
+    head_end = text.rfind("\n", 0, start) + 1
+    return BatchTemplate(compile_template(text[:head_end]), compile_template(text[open_at + 1:close_at]),
+                         compile_template(text[close_at + 1:]), case_slot)
+
+
+def _split_all(templates: Dict[str, str]) -> Dict[str, BatchTemplate]:
+    out = {}
+    for language, text in templates.items():
+        batch = split_for_batch(text, language) if text else None
+        if batch is not None:
+            out[language] = batch
+    return out
+
+
+def _template_version() -> str:
+    """Digest of the problem template index (which holds every template's
+    sha256), the prelude fragments, the signatures, the generator's source and
+    the wrapper.py templates: changes whenever any template, helper, signature
+    or the generator is edited, without generating a single harness."""
+    digest = hashlib.sha256(f"problem\0{registry.version}\0{PRELUDE_VERSION}\0".encode())
+    for function_name in sorted(PROBLEM_SIGNATURES):
+        digest.update(f"{signature_hash(function_name, PROBLEM_SIGNATURES[function_name])}\0".encode())
+    with open(generator.__file__, "rb") as f:
+        digest.update(f.read())
+    sources = [("simple", SIMPLE_WRAPPER_TEMPLATE), ("linkedlist", LINKEDLIST_WRAPPER_TEMPLATE)]
+    for kind, by_language in sources:
+        for language in sorted(by_language):
+            digest.update(f"{kind}\0{language}\0{by_language[language]}\0".encode())
+    return digest.hexdigest()[:16]
+
+
+# ---------------- wrapper.py templates, compiled at import ----------------
+registry = TemplateRegistry()
+
+
+def problem_text(function_name: str, language: str) -> Optional[str]:
+    """The problem's harness text: generated from its signature when it has
+    one, otherwise the registry's template (None if neither exists)."""
+    signature = PROBLEM_SIGNATURES.get(function_name)
+    if signature is not None:
+        text = generate_harness(signature, language, function_name)
+        if text is not None:
+            return text
+    return registry.text(function_name, language)
+
+
+TEMPLATE_VERSION = _template_version()
+COMPILED_SIMPLE_TEMPLATES: Dict[str, Template] = _compile_all(SIMPLE_WRAPPER_TEMPLATE)
+COMPILED_LINKEDLIST_TEMPLATES: Dict[str, Template] = _compile_all(LINKEDLIST_WRAPPER_TEMPLATE)
+
+BATCH_SIMPLE_TEMPLATES: Dict[str, BatchTemplate] = _split_all(SIMPLE_WRAPPER_TEMPLATE)
+BATCH_LINKEDLIST_TEMPLATES: Dict[str, BatchTemplate] = _split_all(LINKEDLIST_WRAPPER_TEMPLATE)
+
+
+# ---------------- problem templates, compiled on first use ----------------
+_compile_ms = 0.0
+
+
+def _timed(build, text, *args):
+    global _compile_ms
+    t0 = time.perf_counter()
+    result = build(text, *args)
+    _compile_ms += (time.perf_counter() - t0) * 1000
+    return result
+
+
+@lru_cache(maxsize=None)
+def problem_template(function_name: str, language: str) -> Optional[Template]:
+    """The compiled problem template, or None if there is none."""
+    text = problem_text(function_name, language)
+    return _timed(compile_template, text) if text else None
+
+
+@lru_cache(maxsize=None)
+def batch_template(function_name: str, language: str) -> Optional[BatchTemplate]:
+    """The batch form of a problem template, or None if there is none."""
+    text = problem_text(function_name, language)
+    return _timed(split_for_batch, text, language) if text else None
+
+
+def registry_stats() -> dict:
+    """What the problem template registry has read and compiled so far."""
+    stats = registry.stats()
+    stats["compiled"] = problem_template.cache_info().currsize
+    stats["compiled_batch"] = batch_template.cache_info().currsize
+    stats["compile_ms"] = round(_compile_ms, 3)
+    stats["generated"] = generator_stats()
+    return stats
@@ -1,12 +1,39 @@
 
 import json
+import os
 import time
 import threading
 import pika
 from judge import SafetyChecker
-from wrapper import SIMPLE_WRAPPER_TEMPLATE, LINKEDLIST_WRAPPER_TEMPLATE
-
-checker = SafetyChecker()
+from preludes import user_types
+from templates import (BATCH_LINKEDLIST_TEMPLATES, BATCH_SIMPLE_TEMPLATES, COMPILED_LINKEDLIST_TEMPLATES,
+                       COMPILED_SIMPLE_TEMPLATES, TEMPLATE_VERSION, batch_template, problem_template,
+                       registry_stats)
+from harness import (BATCH_CASE_MARKER, BATCH_ERROR_MARKER, RAW_TEMPLATE_VERSION, ProgramHashes,
+                     VariableCache, iter_chunks, remove_user_prints, render_batch)
+from signatures import PROBLEM_INPUTS, PROBLEM_SIGNATURES
+from stdin_harness import compile_stdin_template, encode_stdin_input
+from testinput import emit_variables, literal, parse_test_input
+from wrapper import SIMPLE_WRAPPER_TEMPLATE
+
+# One pool process per consumer thread: large submissions are checked off the
+# GIL so a burst of them does not serialise the three consumers. Edits to
+# policy.json are picked up within a few seconds without a restart.
+POLICY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "policy.json")
+checker = SafetyChecker(processes=3, policy_path=POLICY_PATH)
+# Test cases per program on all_test_batch_execution: one compile and one
+# start-up per chunk instead of per test case. 0 keeps one
+# all_test_execution message per test case.
+BATCH_CHUNK_SIZE = 0
+# Send one program per job that reads each test case from its "stdin" payload,
+# so executors can compile once and run it for every test case.
+STDIN_HARNESS = False
+# Recently emitted programHash values, to mark messages first-seen or repeat.
+program_hashes = ProgramHashes()
+# Rendered per-case blocks (test variables or linked-list conversions) per
+# problem, test input, language and slot.
+variable_cache = VariableCache(render=lambda slot, test_input, language, function_name:
+                               _case_value(slot, {"input": test_input}, language, function_name))
 
 
 # ------------------------ RabbitMQ Setup ------------------------ #
@@ -58,137 +85,88 @@ safe_builtins = {
 }
 
 
-def remove_user_prints(code, language):
-    """Comment out user-level print statements for the given language."""
-    lines = code.split('\n')
-    cleaned = []
-
-    for line in lines:
-        stripped = line.strip()
-        if language == "python" and stripped.startswith('print('):
-            cleaned.append(' # ' + line + ' # Suppressed for test case')
-        elif language == "javascript" and 'console.log(' in stripped:
-            cleaned.append(' // ' + line + ' // Suppressed for test case')
-        elif language == "go" and 'fmt.Println(' in stripped:
-            cleaned.append(' // ' + line + ' // Suppressed for test case')
-        elif language == "java" and 'System.out.print' in stripped:
-            cleaned.append(' // ' + line + ' // Suppressed for test case')
-        elif language == "c" and 'printf(' in stripped:
-            cleaned.append(' // ' + line + ' // Suppressed for test case')
-        else:
-            cleaned.append(line)
-
-    return '\n'.join(cleaned)
-
-
-def parse_test_input(input_str, language):
-    """Parse test case input safely."""
-    if not input_str:
-        return {}
-
-    test_vars = {}
-    try:
-        parts = []
-        current = ""
-        brackets = 0
-        for char in input_str:
-            if char == '[':
-                brackets += 1
-            elif char == ']':
-                brackets -= 1
-            elif char == ',' and brackets == 0:
-                parts.append(current.strip())
-                current = ""
-                continue
-            current += char
-        if current.strip():
-            parts.append(current.strip())
-
-        for part in parts:
-            if '=' in part:
-                k, v = part.split('=', 1)
-                test_vars[k.strip()] = v.strip()
-    except Exception as e:
-        print(f"Error parsing test input: {e}")
-        return {}
-
-    return test_vars
-
-
-def format_test_variables(test_vars, language):
-    """Convert test variables to language-specific format."""
-    lines = []
-    for key, value in test_vars.items():
-        if language == "python":
-            lines.append(f"{key} = {value}")
-        elif language == "javascript":
-            lines.append(f"const {key} = {value};")
-        elif language == "java":
-            if value.startswith('[') and value.endswith(']'):
-                lines.append(f"int[] {key} = {value.replace('[', '{').replace(']', '}')};")
-            else:
-                lines.append(f"var {key} = {value};")
-        elif language == "go":
-            if value.startswith('[') and value.endswith(']'):
-                inner = value[1:-1]
-                lines.append(f"{key} := []int{{{inner}}}")
-            else:
-                lines.append(f"{key} := {value}")
-        elif language == "c":
-            lines.append(f"// {key} = {value}")
-    return '\n'.join(lines)
+# ------------------------ Wrapper Generators ------------------------ #
+LINKEDLIST_FUNCTIONS = ["addTwoNumbers", "reverseList", "mergeTwoLists"]
 
 
-# ------------------------ Wrapper Generators ------------------------ #
-def generate_simple_wrapper(user_code, function_name, parameters, test_case, language, suppress_prints):
-    template = SIMPLE_WRAPPER_TEMPLATE.get(language, "")
-    if not template:
-        return user_code
+def _job_template(language, function_name, wrapper_type, simple, linkedlist, generated):
+    if wrapper_type == "simple":
+        return simple.get(language)
+    if wrapper_type == "custom" and function_name in PROBLEM_SIGNATURES:
+        # the harness generated from the problem's signature (see generator.py)
+        return generated(function_name, language)
+    if wrapper_type == "custom" and function_name in LINKEDLIST_FUNCTIONS:
+        return linkedlist.get(language)
+    return None
 
-    test_vars = parse_test_input(test_case.get("input", ""), language)
-    test_variables_str = format_test_variables(test_vars, language)
-    function_call = f"{function_name}({', '.join(parameters)})"
-    cleaned_code = remove_user_prints(user_code, language) if suppress_prints else user_code
 
-    wrapper = template.replace("{{USER_CODE}}", cleaned_code)
-    wrapper = wrapper.replace("{{TEST_VARIABLES}}", test_variables_str)
-    wrapper = wrapper.replace("{{FUNCTION_CALL}}", function_call)
+def _job_values(user_code, language, function_name, parameters, suppress_prints):
+    cleaned_code = remove_user_prints(user_code, language) if suppress_prints else user_code
+    function_call = f"{function_name}({', '.join(parameters)})"
+    values = {"USER_CODE": cleaned_code, "USER_TYPES": user_types(language, cleaned_code),
+              "FUNCTION_CALL": function_call}
     if language == "c":
-        c_function_call = f"printf(\"%d\\n\", {function_call});"
-        wrapper = wrapper.replace("{{FUNCTION_CALL_C}}", c_function_call)
-    return wrapper
+        values["FUNCTION_CALL_C"] = f"printf(\"%d\\n\", {function_call});"
+    return values
 
 
-def generate_linkedlist_wrapper(user_code, function_name, parameters, test_case, language, suppress_prints):
-    template = LINKEDLIST_WRAPPER_TEMPLATE.get(language, "")
-    if not template:
-        return user_code
+def _case_value(case_slot, test_case, language, function_name=None):
+    """What one test case puts into the template's per-case slot."""
+    test_vars = parse_test_input(test_case.get("input", ""))
+    if case_slot == "LINKEDLIST_CONVERSIONS":
+        conversion_code = ""
+        if language == "python":
+            for key, value in test_vars:
+                conversion_code += f"{key} = array_to_list({literal(value, language)})\n"
+        return conversion_code
+    return emit_variables(test_vars, language, function_name)
 
-    test_vars = parse_test_input(test_case.get("input", ""), language)
-    cleaned_code = remove_user_prints(user_code, language) if suppress_prints else user_code
 
-    conversion_code = ""
-    if language == "python":
-        for key, value in test_vars.items():
-            conversion_code += f"{key} = array_to_list({value})\n"
+def prepare_wrapper(user_code, language, function_name, parameters, wrapper_type, suppress_prints=False):
+    """Bind everything that is fixed for the job; None means run the user code as is."""
+    template = _job_template(language, function_name, wrapper_type,
+                             COMPILED_SIMPLE_TEMPLATES, COMPILED_LINKEDLIST_TEMPLATES, problem_template)
+    if template is None:
+        return None
+    return template.bind(**_job_values(user_code, language, function_name, parameters, suppress_prints))
 
-    function_call = f"{function_name}({', '.join(parameters)})"
-    wrapper = template.replace("{{USER_CODE}}", cleaned_code)
-    wrapper = wrapper.replace("{{LINKEDLIST_CONVERSIONS}}", conversion_code)
-    wrapper = wrapper.replace("{{FUNCTION_CALL}}", function_call)
-    return wrapper
+
+def render_wrapper(job_template, test_case, language, problem_id=None, function_name=None):
+    """One test case's program from a prepared job template."""
+    slot = "LINKEDLIST_CONVERSIONS" if "LINKEDLIST_CONVERSIONS" in job_template.placeholders else "TEST_VARIABLES"
+    return job_template.render(**{slot: variable_cache.block(problem_id, test_case, language, slot, function_name)})
+
+
+def prepare_batch_wrapper(user_code, language, function_name, parameters, wrapper_type):
+    """The job's batch template (prints suppressed), or None if it has none."""
+    batch = _job_template(language, function_name, wrapper_type,
+                          BATCH_SIMPLE_TEMPLATES, BATCH_LINKEDLIST_TEMPLATES, batch_template)
+    if batch is None:
+        return None
+    return batch.bind(**_job_values(user_code, language, function_name, parameters, True))
+
+
+def render_batch_wrapper(batch, test_cases, language, first_number=1, problem_id=None, function_name=None):
+    values = variable_cache.blocks(problem_id, test_cases, language, batch.case_slot, function_name)
+    return render_batch(batch, values, language, first_number)
+
+
+def prepare_stdin_wrapper(user_code, language, function_name, parameters, wrapper_type):
+    """(program, input signature) reading the test case from stdin, or None if unsupported."""
+    inputs = PROBLEM_INPUTS.get(function_name)
+    if wrapper_type != "simple" or not inputs or language not in SIMPLE_WRAPPER_TEMPLATE:
+        return None
+    template = compile_stdin_template(SIMPLE_WRAPPER_TEMPLATE[language], language, inputs)
+    if template is None:
+        return None
+    return template.render(**_job_values(user_code, language, function_name, parameters, True)), inputs
 
 
 def generate_wrapper(user_code, job_data, test_case, language, function_name, parameters, wrapper_type, suppress_prints=False):
-    if wrapper_type == "simple":
-        return generate_simple_wrapper(user_code, function_name, parameters, test_case, language, suppress_prints)
-    elif wrapper_type == "custom":
-        if function_name in ["addTwoNumbers", "reverseList", "mergeTwoLists"]:
-            return generate_linkedlist_wrapper(user_code, function_name, parameters, test_case, language, suppress_prints)
-        else:
-            return user_code
-    else:
+    job_template = prepare_wrapper(user_code, language, function_name, parameters, wrapper_type, suppress_prints)
+    if job_template is None:
         return user_code
+    return render_wrapper(job_template, test_case, language, function_name=function_name)
 
 
 # ------------------------ Consumers ------------------------ #
@@ -210,9 +188,10 @@ def programiz_consumer(_):
 
 
 
-        is_safe = checker.check(code, language)
-        if is_safe:
-            publish_message(ch, 'programiz_execution', {
+        verdict = checker.check(code, language)
+        # a single run of a never-ending loop just hits the executor timeout once
+        if verdict or verdict.will_time_out:
+            publish_message(ch, 'programiz_execution', program_hashes.stamp({
                 "jobId": job_id,
                 "language": language,
                 "userId": userId,
@@ -220,13 +199,13 @@ def programiz_consumer(_):
                 "socketId": socketId,
                 "type":type,
                 "createdAt":createdAt,
-            })
+            }, code, language, RAW_TEMPLATE_VERSION))
             print("published the programmiz code for exe")
         else:
             publish_message(ch, 'blocked_execution', {
                 "jobId": job_id,
                 "socketId": socketId,
-                "reason": checker.reason(),
+                "reason": verdict.reason,
                 "language": language,
                 "code": code,
                 "userId": userId,
@@ -267,8 +246,10 @@ def all_test_consumer(_):
         createdAt=job.get("createdAt")
 
 
-        is_safe = checker.check(code, language)
-        if not is_safe:
+        verdict = checker.check(code, language)
+        if not verdict:
+            # a loop that can never exit would hit the executor timeout on every
+            # test case, so it is answered once here instead of being fanned out
             publish_message(channel, "blocked_execution", {
                 "jobId": job_id,
                 "socketId": socket_id,
@@ -276,17 +257,68 @@ def all_test_consumer(_):
                 "userId": user_id,
                 "language": language,
                 "code": code,
-                "reason": checker.reason(),
-                "status": "unsafe",
+                "reason": verdict.reason,
+                "status": "timeout" if verdict.will_time_out else "unsafe",
                 "type":type,
                 "createdAt":createdAt
             })
             ch.basic_ack(delivery_tag=method.delivery_tag)
             return
 
+        batch = None
+        if BATCH_CHUNK_SIZE > 0:
+            batch = prepare_batch_wrapper(code, language, function_name, parameters, wrapper_type)
+        if batch is not None:
+            chunks = list(iter_chunks(testCases, BATCH_CHUNK_SIZE))
+            for k, (first, chunk) in enumerate(chunks):
+                wrapped = render_batch_wrapper(batch, chunk, language, first, problem_id, function_name)
+                publish_message(channel, "all_test_batch_execution", program_hashes.stamp({
+                    "jobId": job_id,
+                    "batchId": f"{job_id}_batch_{k+1}",
+                    "batchNumber": k + 1,
+                    "totalBatches": len(chunks),
+                    "totalTestCases": len(testCases),
+                    "testCases": [{
+                        "testCaseId": f"{job_id}_test_{first+j}",
+                        "testCaseNumber": first + j,
+                        "input": tc.get("input"),
+                        "expected": tc.get("expected"),
+                    } for j, tc in enumerate(chunk)],
+                    "caseMarker": BATCH_CASE_MARKER,
+                    "errorMarker": BATCH_ERROR_MARKER,
+                    "language": language,
+                    "wrappedCode": wrapped,
+                    "socketId": socket_id,
+                    "userId": user_id,
+                    "problemId": problem_id,
+                    "orginalCode": code if k == 0 else "",
+                    "type":type,
+                    "createdAt":createdAt
+                }, wrapped, language))
+                print("batch genrated and sent", k + 1)
+            ch.basic_ack(delivery_tag=method.delivery_tag)
+            return
+
+        payloads = None
+        stdin_job = None
+        if STDIN_HARNESS:
+            stdin_job = prepare_stdin_wrapper(code, language, function_name, parameters, wrapper_type)
+        if stdin_job is not None:
+            stdin_program, inputs = stdin_job
+            payloads = [encode_stdin_input(tc.get("input", ""), inputs) for tc in testCases]
+            if None in payloads:
+                payloads = None
+
+        # the user code is prepared once; each test case only renders its variables
+        job_template = None
+        if payloads is None:
+            job_template = prepare_wrapper(code, language, function_name, parameters, wrapper_type, suppress_prints=True)
         for i, tc in enumerate(testCases):
-            wrapped = generate_wrapper(code, job, tc, language, function_name, parameters, wrapper_type, suppress_prints=True)
-            publish_message(channel, "all_test_execution", {
+            if payloads is not None:
+                wrapped = stdin_program
+            else:
+                wrapped = render_wrapper(job_template, tc, language, problem_id, function_name) if job_template else code
+            message = {
                 "jobId": job_id,
                 "testCaseId": f"{job_id}_test_{i+1}",
                 "testCaseNumber": i + 1,
@@ -301,7 +333,13 @@ def all_test_consumer(_):
                 "orginalCode": code if i == 0 else "",
                 "type":type,
                 "createdAt":createdAt
-            })
+            }
+            if payloads is not None:
+                message["inputMode"] = "stdin"
+                message["stdin"] = payloads[i]
+            program_hashes.stamp(message, wrapped, language,
+                                 RAW_TEMPLATE_VERSION if wrapped is code else TEMPLATE_VERSION)
+            publish_message(channel, "all_test_execution", message)
             print("wrapper genrated and sent",i)
 
         ch.basic_ack(delivery_tag=method.delivery_tag)
@@ -337,15 +375,15 @@ def print_test_consumer(_):
 
         print("this is for the single conusmer btw")
 
-        is_safe = checker.check(code, language)
-        if not is_safe:
+        verdict = checker.check(code, language)
+        if not verdict and not verdict.will_time_out:
             publish_message(channel, "blocked_execution", {
                 "jobId": job_id,
                 "socketId": socket_id,
                 "userId": user_id,
                 "language": language,
                 "code": code,
-                "reason": checker.reason(),
+                "reason": verdict.reason,
                 "status": "unsafe",
                 "type":type,
                 "createdAt":createdAt
@@ -354,7 +392,7 @@ def print_test_consumer(_):
             return
 
         wrapped = generate_wrapper(code, job, test_case, language, function_name, parameters, wrapper_type, suppress_prints=False)
-        publish_message(channel, "print_test_execution", {
+        publish_message(channel, "print_test_execution", program_hashes.stamp({
             "jobId": job_id,
             "socketId": socket_id,
             "wrappedCode": wrapped,
@@ -363,7 +401,7 @@ def print_test_consumer(_):
             "problemId": problem_id,
             "type":type,
             "createdAt":createdAt
-        })
+        }, wrapped, language, RAW_TEMPLATE_VERSION if wrapped is code else TEMPLATE_VERSION))
         print("createdat emited:",createdAt)
 
         ch.basic_ack(delivery_tag=method.delivery_tag)
@@ -379,7 +417,16 @@ threading.Thread(target=lambda: all_test_consumer(None), daemon=True).start()
 threading.Thread(target=lambda: print_test_consumer(None), daemon=True).start()
 
 print("RabbitMQ WorkerBee running...")
+print("Template registry:", registry_stats())
 
 # Keep main thread alive
 while True:
     time.sleep(60)
+    print("SafetyChecker verdict cache:", checker.cache_stats())
+    print("SafetyChecker pre-gate rejections:", checker.pregate_stats())
+    print("SafetyChecker policy:", checker.policy_version)
+    print("SafetyChecker latency:", checker.latency_stats())
+    print("SafetyChecker rules:", checker.rule_stats())
+    print("Program hashes:", program_hashes.stats())
+    print("Template registry:", registry_stats())
+    print("Test variable cache:", variable_cache.stats())
@@ -0,0 +1,465 @@
+"""
+testinput.py
+
+Test-case inputs parsed once into typed values, with one emitter per language.
+
+`parse_test_input('nums = [2,7,11,15], target = 9')` scans the text in a
+single left-to-right pass and returns `[("nums", Value), ("target", Value)]`.
+Flat int and char arrays, which is where large inputs live, are matched by one
+regex and converted with `int()` / a slice per element. Each emitter then
+declares the variables for its language from the types instead of guessing
+them from the literal text. Given the function under test, an empty `[]`
+takes its element type from the problem's signature (signatures.PROBLEM_INPUTS),
+since the literal alone cannot tell `[]byte` from `[]int`.
+
+Value kinds:
+    int, float, bool, null, string, char   scalars; `data` is the Python value
+    array                                  `data` is a list; `elem` is the element
+                                           kind ("int", "char", ..., "array",
+                                           "mixed", or None when empty)
+    raw                                    could not be parsed; `text` is emitted as is
+
+Usage:
+    assignments = parse_test_input(test_input)
+    block = emit_variables(assignments, "go", "reverseString")   # the {{TEST_VARIABLES}} block
+"""
+import json
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from signatures import PROBLEM_INPUTS, c_size_name
+
+_INT_MIN, _INT_MAX = -2 ** 31, 2 ** 31 - 1
+
+_SPACE_RE = re.compile(r"\s*")
+_NAME_RE = re.compile(r"[A-Za-z_]\w*+")
+_NUMBER_RE = re.compile(r"[-+]?(?:\d++(\.\d*+)?|\.\d++)(?:[eE][-+]?\d++)?")
+_WORD_RE = re.compile(r"[A-Za-z_]\w*+")
+_DQ_RE = re.compile(r'"(?:[^"\\]|\\.)*+"', re.DOTALL)
+_SQ_RE = re.compile(r"'(?:[^'\\]|\\.)*+'", re.DOTALL)
+# Flat arrays of plain ints / single plain chars, the shapes of big inputs.
+_INT_ARRAY_RE = re.compile(r"\[[-+\d\s,]*+\]")
+_CHAR_ARRAY_RE = re.compile(r"\[\s*+(?:'[^'\\\n]'\s*+(?:,\s*+'[^'\\\n]'\s*+)*+)?\]")
+_PLAIN_RE = re.compile(r"[^\\\x00-\x1f\x7f-\U0010ffff]*+")
+_WORDS = {"true": ("bool", True), "True": ("bool", True), "false": ("bool", False),
+          "False": ("bool", False), "null": ("null", None), "None": ("null", None)}
+
+
+class Value:
+    """One parsed input value; see the module docstring for the kinds."""
+
+    __slots__ = ("kind", "data", "text", "elem")
+
+    def __init__(self, kind: str, data: Any, text: str, elem: Optional[str] = None):
+        self.kind = kind
+        self.data = data
+        self.text = text
+        self.elem = elem
+
+    def __repr__(self):
+        return f"Value({self.kind}, {self.text[:40]!r})"
+
+
+# ---------------- parser ----------------
+def _unquote(token: str) -> str:
+    body = token[1:-1]
+    if "\\" not in body:
+        return body
+    if token[0] == '"':
+        return json.loads(token)
+    return json.loads('"' + body.replace('"', '\\"').replace("\\'", "'") + '"')
+
+
+def _element_kind(items: List[Value]) -> Optional[str]:
+    kinds = {item.kind for item in items}
+    if not kinds:
+        return None
+    if kinds == {"int", "float"}:
+        return "float"
+    return kinds.pop() if len(kinds) == 1 else "mixed"
+
+
+class _Parser:
+    __slots__ = ("s", "i")
+
+    def __init__(self, text: str):
+        self.s = text
+        self.i = 0
+
+    def skip_space(self):
+        self.i = _SPACE_RE.match(self.s, self.i).end()
+
+    def value(self) -> Value:
+        s, start = self.s, self.i
+        if start >= len(s):
+            raise ValueError("missing value")
+        c = s[start]
+        if c == "[":
+            return self.array()
+        if c == '"' or c == "'":
+            m = (_DQ_RE if c == '"' else _SQ_RE).match(s, start)
+            if m is None:
+                raise ValueError("unterminated string")
+            self.i = m.end()
+            text = m.group()
+            data = _unquote(text)
+            return Value("char" if c == "'" and len(data) == 1 else "string", data, text)
+        m = _NUMBER_RE.match(s, start)
+        if m is not None:
+            self.i = m.end()
+            text = m.group()
+            if m.group(1) is None and "e" not in text and "E" not in text and not text.startswith("."):
+                return Value("int", int(text), text)
+            return Value("float", float(text), text)
+        m = _WORD_RE.match(s, start)
+        if m is not None and m.group() in _WORDS:
+            self.i = m.end()
+            kind, data = _WORDS[m.group()]
+            return Value(kind, data, m.group())
+        raise ValueError(f"unexpected {c!r}")
+
+    def array(self) -> Value:
+        s, start = self.s, self.i
+        m = _INT_ARRAY_RE.match(s, start)
+        if m is not None:
+            inner = s[start + 1:m.end() - 1]
+            try:
+                data = [int(x) for x in inner.split(",")] if inner.strip() else []
+            except ValueError:
+                data = None
+            if data is not None:
+                self.i = m.end()
+                return Value("array", data, m.group(), "int" if data else None)
+        m = _CHAR_ARRAY_RE.match(s, start)
+        if m is not None:
+            self.i = m.end()
+            text = m.group()
+            return Value("array", re.findall(r"'(.)'", text), text, "char")
+
+        self.i += 1
+        items: List[Value] = []
+        while True:
+            self.skip_space()
+            if self.i < len(s) and s[self.i] == "]":
+                self.i += 1
+                break
+            items.append(self.value())
+            self.skip_space()
+            if self.i < len(s) and s[self.i] == ",":
+                self.i += 1
+            elif self.i < len(s) and s[self.i] == "]":
+                self.i += 1
+                break
+            else:
+                raise ValueError("unterminated array")
+        elem = _element_kind(items)
+        if elem in ("int", "float", "bool", "null", "string", "char"):
+            return Value("array", [item.data for item in items], s[start:self.i], elem)
+        return Value("array", items, s[start:self.i], elem)
+
+    def skip_to_next(self) -> int:
+        """End of the current top-level item: the next comma outside brackets and quotes."""
+        s, i, depth, quote = self.s, self.i, 0, None
+        while i < len(s):
+            c = s[i]
+            if quote:
+                if c == "\\":
+                    i += 1
+                elif c == quote:
+                    quote = None
+            elif c == '"' or c == "'":
+                quote = c
+            elif c == "[":
+                depth += 1
+            elif c == "]":
+                depth -= 1
+            elif c == "," and depth <= 0:
+                break
+            i += 1
+        self.i = i
+        return i
+
+
+def parse_test_input(test_input: str) -> List[Tuple[str, Value]]:
+    """`a = [1,2], b = "x"` -> [("a", Value), ("b", Value)], in one pass.
+
+    Items without `name =` are skipped; a value that does not parse becomes a
+    "raw" Value holding its text.
+    """
+    p = _Parser(test_input or "")
+    s = p.s
+    out: List[Tuple[str, Value]] = []
+    while True:
+        p.skip_space()
+        if p.i >= len(s):
+            break
+        m = _NAME_RE.match(s, p.i)
+        if m is not None:
+            p.i = m.end()
+            p.skip_space()
+        if m is None or p.i >= len(s) or s[p.i] != "=":
+            p.skip_to_next()
+        else:
+            p.i += 1
+            p.skip_space()
+            start = p.i
+            try:
+                value = p.value()
+                p.skip_space()
+                if p.i < len(s) and s[p.i] != ",":
+                    raise ValueError("trailing text")
+            except (ValueError, IndexError):
+                p.i = start
+                value = Value("raw", None, s[start:p.skip_to_next()].strip())
+            out.append((m.group(), value))
+        if p.i < len(s) and s[p.i] == ",":
+            p.i += 1
+    return out
+
+
+# ---------------- literal helpers ----------------
+def _json(value) -> str:
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _escape(s: str, quote: str, utf8_octal: bool = False) -> str:
+    """C-family escapes for a `quote`-delimited literal; control characters (and,
+    for C, non-ASCII bytes) as octal."""
+    if _PLAIN_RE.fullmatch(s) and quote not in s:
+        return s
+    out = []
+    for ch in s:
+        o = ord(ch)
+        if ch == "\\" or ch == quote:
+            out.append("\\" + ch)
+        elif ch == "\n":
+            out.append("\\n")
+        elif ch == "\t":
+            out.append("\\t")
+        elif ch == "\r":
+            out.append("\\r")
+        elif o < 0x20 or o == 0x7F:
+            out.append("\\%03o" % o)
+        elif o > 0x7F and utf8_octal:
+            out.append("".join("\\%03o" % b for b in ch.encode()))
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def _join_literals(data: List[Any], to_literal: Callable[[Any], str]) -> str:
+    """`to_literal` over scalar elements, once per distinct value (char arrays
+    repeat a handful of characters 10^5 times)."""
+    literals = {x: to_literal(x) for x in set(data)}
+    return ",".join(map(literals.__getitem__, data))
+
+
+def _fits_int(data) -> bool:
+    return all(_INT_MIN <= x <= _INT_MAX for x in data)
+
+
+# ---------------- python / javascript ----------------
+def _dynamic_literal(v: Value, language: str) -> str:
+    kind = v.kind
+    if kind == "int":
+        return str(v.data)
+    if kind == "float":
+        return repr(v.data)
+    if kind == "bool":
+        return ("True" if v.data else "False") if language == "python" else ("true" if v.data else "false")
+    if kind == "null":
+        return "None" if language == "python" else "null"
+    if kind in ("string", "char"):
+        return _json(v.data)
+    if kind == "array":
+        elem = v.elem
+        if elem == "int":
+            return "[" + ",".join(map(str, v.data)) + "]"
+        if elem in ("float", "bool", "null", "string", "char"):
+            return "[" + _join_literals(v.data, lambda x: _dynamic_literal(Value(elem, x, ""), language)) + "]"
+        return "[" + ",".join(_dynamic_literal(x, language) for x in v.data) + "]"
+    return v.text
+
+
+def _emit_python(name: str, v: Value) -> List[str]:
+    return [f"{name} = {_dynamic_literal(v, 'python')}"]
+
+
+def _emit_javascript(name: str, v: Value) -> List[str]:
+    return [f"const {name} = {_dynamic_literal(v, 'javascript')};"]
+
+
+# ---------------- java ----------------
+def _java_type(v: Value) -> Optional[str]:
+    kind = v.kind
+    if kind == "int":
+        return "int" if _INT_MIN <= v.data <= _INT_MAX else "long"
+    scalar = {"float": "double", "bool": "boolean", "string": "String", "char": "char"}
+    if kind in scalar:
+        return scalar[kind]
+    if kind != "array":
+        return None
+    elem = v.elem
+    if elem is None or elem == "int":
+        return "int[]" if _fits_int(v.data) else "long[]"
+    if elem in scalar:
+        return scalar[elem] + "[]"
+    if elem == "array":
+        inner = {_java_type(item) for item in v.data if item.data}
+        inner = inner or {"int[]"}
+        return inner.pop() + "[]" if len(inner) == 1 and None not in inner else None
+    return None
+
+
+def _java_literal(v: Value, java_type: str) -> str:
+    kind = v.kind
+    if kind == "int":
+        return str(v.data) + ("L" if java_type.startswith("long") else "")
+    if kind == "float":
+        return repr(v.data)
+    if kind == "bool":
+        return "true" if v.data else "false"
+    if kind == "string":
+        return '"' + _escape(v.data, '"') + '"'
+    if kind == "char":
+        return "'" + _escape(v.data, "'") + "'"
+    elem_type = java_type[:-2]
+    elem = v.elem
+    if elem == "int":
+        suffix = "L" if elem_type == "long" else ""
+        return "{" + ",".join(f"{x}{suffix}" for x in v.data) + "}"
+    if elem in ("float", "bool", "string", "char"):
+        return "{" + _join_literals(v.data, lambda x: _java_literal(Value(elem, x, ""), elem_type)) + "}"
+    return "{" + ",".join(_java_literal(x, elem_type) for x in v.data) + "}"
+
+
+def _emit_java(name: str, v: Value) -> List[str]:
+    java_type = _java_type(v)
+    if java_type is None:
+        return [f"var {name} = {v.text};"]
+    return [f"{java_type} {name} = {_java_literal(v, java_type)};"]
+
+
+# ---------------- go ----------------
+_GO_SCALARS = {"int": "int", "float": "float64", "bool": "bool", "string": "string", "char": "byte"}
+
+
+def _go_type(v: Value) -> Optional[str]:
+    if v.kind in _GO_SCALARS:
+        return _GO_SCALARS[v.kind]
+    if v.kind != "array":
+        return None
+    elem = v.elem
+    if elem is None:
+        return "[]int"
+    if elem in _GO_SCALARS:
+        return "[]" + _GO_SCALARS[elem]
+    if elem == "array":
+        inner = {_go_type(item) for item in v.data if item.data}
+        inner = inner or {"[]int"}
+        return "[]" + inner.pop() if len(inner) == 1 and None not in inner else None
+    return None
+
+
+def _go_literal(v: Value) -> str:
+    kind = v.kind
+    if kind == "int":
+        return str(v.data)
+    if kind == "float":
+        return repr(v.data)
+    if kind == "bool":
+        return "true" if v.data else "false"
+    if kind == "string":
+        return '"' + _escape(v.data, '"') + '"'
+    if kind == "char":
+        return "'" + _escape(v.data, "'") + "'"
+    elem = v.elem
+    if elem == "int":
+        return "{" + ",".join(map(str, v.data)) + "}"
+    if elem in ("float", "bool", "string", "char"):
+        return "{" + _join_literals(v.data, lambda x: _go_literal(Value(elem, x, ""))) + "}"
+    return "{" + ",".join(_go_literal(x) for x in v.data) + "}"
+
+
+def _emit_go(name: str, v: Value) -> List[str]:
+    go_type = _go_type(v)
+    if go_type is None:
+        return [f"{name} := {v.text}"]
+    if v.kind == "array":
+        return [f"{name} := {go_type}{_go_literal(v)}"]
+    if v.kind == "char":
+        return [f"{name} := byte({_go_literal(v)})"]
+    return [f"{name} := {_go_literal(v)}"]
+
+
+# ---------------- c ----------------
+def _c_scalar(v: Value) -> Optional[Tuple[str, str]]:
+    kind = v.kind
+    if kind == "int":
+        return ("int" if _INT_MIN <= v.data <= _INT_MAX else "long long"), str(v.data)
+    if kind == "float":
+        return "double", repr(v.data)
+    if kind == "bool":
+        return "int", "1" if v.data else "0"
+    if kind == "string":
+        return "char*", '"' + _escape(v.data, '"', True) + '"'
+    if kind == "char":
+        return "char", "'" + _escape(v.data, "'", True) + "'"
+    return None
+
+
+def _emit_c(name: str, v: Value) -> List[str]:
+    if v.kind != "array":
+        scalar = _c_scalar(v)
+        if scalar is None:
+            return [f"int {name} = {v.text};"]
+        return [f"{scalar[0]} {name} = {scalar[1]};"]
+
+    size = f"int {c_size_name(name)} = {len(v.data)};"
+    elem = v.elem
+    if elem is None or elem == "int":
+        c_type = "int" if _fits_int(v.data) else "long long"
+        items = ",".join(map(str, v.data))
+    elif elem in ("float", "bool", "string", "char"):
+        c_type = {"float": "double", "bool": "int", "string": "char*", "char": "char"}[elem]
+        items = _join_literals(v.data, lambda x: _c_scalar(Value(elem, x, ""))[1])
+    else:
+        # nested or mixed arrays: the literal with braces, as the templates always did
+        return [f"int {name}[] = {v.text.replace('[', '{').replace(']', '}')};", size]
+    items = items or "0"  # C has no empty initializer; the size variable stays 0
+    if c_type == "char*":
+        return [f"char* {name}[] = {{{items}}};", size]
+    return [f"{c_type} {name}[] = {{{items}}};", size]
+
+
+_EMITTERS: Dict[str, Callable[[str, Value], List[str]]] = {
+    "python": _emit_python,
+    "javascript": _emit_javascript,
+    "java": _emit_java,
+    "go": _emit_go,
+    "c": _emit_c,
+}
+
+
+def _declared(value: Value, input_type: Optional[str]) -> Value:
+    """An empty array typed by its signature input type (`char[]` -> char elements)."""
+    if value.kind != "array" or value.elem is not None or input_type not in ("int[]", "char[]"):
+        return value
+    return Value("array", value.data, value.text, input_type[:-2])
+
+
+def emit_variables(assignments: List[Tuple[str, Value]], language: str,
+                   function_name: Optional[str] = None) -> str:
+    """The declarations block for `language`; empty for an unknown language.
+    `function_name` types empty arrays from the problem's signature."""
+    emit = _EMITTERS.get(language)
+    if emit is None:
+        return ""
+    inputs = dict(PROBLEM_INPUTS.get(function_name, ())) if function_name else {}
+    return "\n".join(line for name, value in assignments
+                     for line in emit(name, _declared(value, inputs.get(name))))
+
+
+def literal(value: Value, language: str) -> str:
+    """A value as an expression in Python or JavaScript."""
+    return _dynamic_literal(value, language)
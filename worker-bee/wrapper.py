@@ -1,4 +1,5 @@
 # wrapper.py
+from preludes import compose
 
 # Template for all simple problems
 SIMPLE_WRAPPER_TEMPLATE = {
@@ -56,65 +57,22 @@ int main() {
 }"""
 }
 
-# Template for LinkedList problems (placeholder for now)
+# Template for LinkedList problems (placeholder for now). The ListNode class and
+# converters come from preludes.py; the per-case conversions call array_to_list
+# and user code builds ListNode, so both are kept even though the template
+# itself does not name them.
 LINKEDLIST_WRAPPER_TEMPLATE = {
-    "python": """# Definition for singly-linked list.
-class ListNode:
-    def __init__(self, val=0, next=None):
-        self.val = val
-        self.next = next
-
-def array_to_list(arr):
-    if not arr: 
-        return None
-    head = ListNode(arr[0])
-    current = head
-    for val in arr[1:]:
-        current.next = ListNode(val)
-        current = current.next
-    return head
-
-def list_to_array(head):
-    result = []
-    while head:
-        result.append(head.val)
-        head = head.next
-    return result
-
+    "python": compose("python", """{{PRELUDE}}
 {{USER_CODE}}
 
 {{LINKEDLIST_CONVERSIONS}}
 result = {{FUNCTION_CALL}}
-print(list_to_array(result))""",
-
-    "javascript": """function ListNode(val, next) {
-    this.val = (val===undefined ? 0 : val)
-    this.next = (next===undefined ? null : next)
-}
-
-function arrayToList(arr) {
-    if (!arr || arr.length === 0) return null;
-    let head = new ListNode(arr[0]);
-    let current = head;
-    for (let i = 1; i < arr.length; i++) {
-        current.next = new ListNode(arr[i]);
-        current = current.next;
-    }
-    return head;
-}
-
-function listToArray(head) {
-    let result = [];
-    while (head) {
-        result.push(head.val);
-        head = head.next;
-    }
-    return result;
-}
+print(list_to_array(result))""", extra=("array_to_list",)),
 
+    "javascript": compose("javascript", """{{PRELUDE}}
 {{USER_CODE}}
 
 {{LINKEDLIST_CONVERSIONS}}
 const result = {{FUNCTION_CALL}};
-console.log(JSON.stringify(listToArray(result)));"""
-}
\ No newline at end of file
+console.log(JSON.stringify(listToArray(result)));""", extra=("ListNode",))
+}